@@ -0,0 +1,100 @@
+"""
+bench_async.py
+
+Benchmark de latencia del ciclo de eventos con `async_logic.aconvert_batch`. Una tarea
+testigo duerme 1 ms en bucle y mide cuánto se retrasa cada despertar mientras varias
+tareas convierten lotes grandes. Se compara la conversión bloqueante
+(`batch_logic.convert_batch` llamado dentro de la corrutina) con `aconvert_batch`,
+con listas de Python y, si está instalado, con arreglos de NumPy.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_async.py [--values N] [--tasks T] [--rounds R]
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from interfaces.interfaz_server import percentile
+from logic import async_logic
+from logic.batch_logic import convert_batch
+
+
+# ────────────────────── MEDICIÓN ──────────────────────
+TICK = 0.001    # Segundos que duerme la tarea testigo entre mediciones
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    """Mide el retraso de cada despertar respecto a lo pedido."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _blocking(values, rounds: int) -> None:
+    """Convierte dentro de la corrutina, bloqueando el ciclo de eventos."""
+    for _ in range(rounds):
+        convert_batch("pressure", values, "bares", "pascales")
+        await asyncio.sleep(0)
+
+
+async def _offloaded(values, rounds: int) -> None:
+    """Convierte con `aconvert_batch`."""
+    for _ in range(rounds):
+        await async_logic.aconvert_batch("pressure", values, "bares", "pascales")
+
+
+async def _run(worker, values, tasks: int, rounds: int) -> dict[str, float]:
+    """Ejecuta la carga con la tarea testigo y resume las latencias en milisegundos."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(values, rounds) for _ in range(tasks)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    lags.sort()
+    return {
+        "seconds": elapsed,
+        "p50_ms": percentile(lags, 0.50) * 1000,
+        "p99_ms": percentile(lags, 0.99) * 1000,
+        "max_ms": lags[-1] * 1000,
+    }
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--values", type=int, default=1_000_000, help="Valores por lote")
+    parser.add_argument("--tasks", type=int, default=4, help="Tareas que convierten a la vez")
+    parser.add_argument("--rounds", type=int, default=3, help="Lotes por tarea")
+    args = parser.parse_args()
+
+    inputs = {"lista": [float(i) for i in range(args.values)]}
+    if async_logic.np is not None:
+        inputs["numpy"] = async_logic.np.arange(args.values, dtype=float)
+
+    print(f"{'entrada':<8}{'modo':<16}{'segundos':>10}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for label, values in inputs.items():
+        for mode, worker in (("bloqueante", _blocking), ("aconvert_batch", _offloaded)):
+            result = asyncio.run(_run(worker, values, args.tasks, args.rounds))
+            print(f"{label:<8}{mode:<16}{result['seconds']:>10.2f}{result['p50_ms']:>9.2f}"
+                  f"{result['p99_ms']:>9.2f}{result['max_ms']:>9.2f}")
+    async_logic.shutdown_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+bench_binary.py
+
+Benchmark de `binary_logic.convert_binary_file`. Genera un archivo temporal de valores
+float32 y mide la conversión con NumPy (vistas sobre el mapa de memoria), sin NumPy
+(bloques con `memoryview` y `array.array`) y, como referencia, leyendo cada valor como
+`float` de Python y llamando a `convert_pressure`.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_binary.py [--values N]
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+from array import array
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic import binary_logic
+from logic.conversion_logic import convert_pressure
+
+
+# ────────────────────── MEDICIÓN ──────────────────────
+def _per_python_floats(input_path: str, output_path: str) -> int:
+    """Referencia: lee cada valor como `float` y convierte uno por uno."""
+    values = array("f")
+    with open(input_path, "rb") as file:
+        values.frombytes(file.read())
+    result = array("f", [convert_pressure(value, "bares", "pascales") for value in values])
+    with open(output_path, "wb") as file:
+        result.tofile(file)
+    return len(values)
+
+
+def _measure(func) -> float:
+    """Mejor tiempo en segundos de tres ejecuciones."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--values", type=int, default=2_000_000, help="Valores del archivo")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "entrada.f32")
+        output_path = os.path.join(directory, "salida.f32")
+        with open(input_path, "wb") as file:
+            array("f", range(args.values)).tofile(file)
+
+        def convert():
+            binary_logic.convert_binary_file(
+                input_path, output_path, "pressure", "bares", "pascales", dtype="float32",
+                byteorder="native"
+            )
+
+        numpy_module = binary_logic.np
+        cases = {"floats de Python": lambda: _per_python_floats(input_path, output_path)}
+        if numpy_module is not None:
+            cases["NumPy (mmap)"] = convert
+        cases["memoryview/array"] = convert
+
+        print(f"{'ruta':<20}{'segundos':>10}{'millones/s':>12}")
+        for name, func in cases.items():
+            binary_logic.np = None if name == "memoryview/array" else numpy_module
+            try:
+                elapsed = _measure(func)
+            finally:
+                binary_logic.np = numpy_module
+            print(f"{name:<20}{elapsed:>10.3f}{args.values / elapsed / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
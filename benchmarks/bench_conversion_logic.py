@@ -0,0 +1,122 @@
+"""
+bench_conversion_logic.py
+
+Micro-benchmark del costo por llamada de las funciones `convert_*`.
+Compara la implementación actual (tablas precalculadas al importar el módulo)
+contra la implementación anterior, que reconstruía la tabla de factores y su
+inversa en cada llamada, y contra un conversor especializado de `get_converter`.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_conversion_logic.py [--number N]
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic import conversion_logic as cl
+
+
+# ────────────────────── CASOS DE PRUEBA ──────────────────────
+# (sistema, función, tabla hacia la base, unidad de origen, unidad de destino)
+CASES = [
+    ("length", cl.convert_length, cl.TO_METERS, "metros", "pies"),
+    ("mass", cl.convert_mass, cl.TO_GRAMS, "kilogramos", "libras"),
+    ("volume", cl.convert_volume, cl.TO_MILLILITERS, "litros", "galones_us"),
+    ("energy", cl.convert_energy, cl.TO_JOULES, "joules", "kilovatio_horas"),
+    ("area", cl.convert_area, cl.TO_SQUARE_MILLIMETERS, "hectareas", "acres"),
+    ("speed", cl.convert_speed, cl.TO_CM_PER_SECOND, "kilometros_por_hora", "nudos"),
+    ("time", cl.convert_time, cl.TO_MICROSECONDS, "horas", "segundos"),
+    ("power", cl.convert_power, cl.TO_WATTS, "kilovatios", "caballos_de_fuerza_eeuu"),
+    ("angle", cl.convert_angle, cl.TO_GRADES, "grados", "radianes"),
+    ("pressure", cl.convert_pressure, cl.TO_ATMOSPHERES, "bares", "pascales"),
+    ("data", cl.convert_data, cl.TO_BITS, "gibibytes", "megabits"),
+]
+
+
+# ────────────────────── IMPLEMENTACIÓN ANTERIOR ──────────────────────
+def _legacy_convert(to_base: dict, value: float, from_unit: str, to_unit: str) -> float:
+    """Reproduce el costo de la versión anterior: tabla e inversa nuevas por llamada."""
+    table = dict(to_base)
+    inverse = {unit: 1 / factor for unit, factor in table.items()}
+    return value * table[from_unit] * inverse[to_unit]
+
+
+def _legacy_temperature(value: float, from_unit: str, to_unit: str) -> float:
+    """Reproduce la versión anterior de temperatura: seis lambdas por llamada."""
+    to_celsius = {
+        "celsius": lambda x: x,
+        "kelvin": lambda x: x - 273.15,
+        "fahrenheit": lambda x: (x - 32) * 5 / 9
+    }
+    from_celsius = {
+        "celsius": lambda x: x,
+        "kelvin": lambda x: x + 273.15,
+        "fahrenheit": lambda x: x * 9 / 5 + 32
+    }
+    return from_celsius[to_unit](to_celsius[from_unit](value))
+
+
+# ────────────────────── MEDICIÓN ──────────────────────
+def _per_call_ns(func, number: int) -> float:
+    """Devuelve el mejor tiempo por llamada en nanosegundos de 5 repeticiones."""
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e9
+
+
+def run(number: int) -> list[tuple[str, float, float, float]]:
+    """
+    Mide el costo por llamada antes y después para cada sistema.
+
+    Returns:
+        list[tuple[str, float, float, float]]: (sistema, ns antes, ns después,
+        ns con conversor especializado).
+    """
+    converter = cl.get_converter("temperature", "celsius", "fahrenheit")
+    results = [(
+        "temperature",
+        _per_call_ns(lambda: _legacy_temperature(36.6, "celsius", "fahrenheit"), number),
+        _per_call_ns(lambda: cl.convert_temperature(36.6, "celsius", "fahrenheit"), number),
+        _per_call_ns(lambda: converter(36.6), number),
+    )]
+    for system, func, table, from_unit, to_unit in CASES:
+        converter = cl.get_converter(system, from_unit, to_unit)
+        before = _per_call_ns(
+            lambda t=table, f=from_unit, u=to_unit: _legacy_convert(t, 12.5, f, u), number
+        )
+        after = _per_call_ns(
+            lambda c=func, f=from_unit, u=to_unit: c(12.5, f, u), number
+        )
+        specialised = _per_call_ns(lambda c=converter: c(12.5), number)
+        results.append((system, before, after, specialised))
+    return results
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--number", type=int, default=100_000, help="Llamadas por repetición")
+    args = parser.parse_args()
+
+    print(
+        f"{'sistema':<12}{'antes (ns)':>14}{'después (ns)':>16}{'mejora':>10}"
+        f"{'get_converter (ns)':>22}"
+    )
+    for system, before, after, specialised in run(args.number):
+        print(
+            f"{system:<12}{before:>14.1f}{after:>16.1f}{before / after:>9.1f}x"
+            f"{specialised:>22.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+bench_memo.py
+
+Micro-benchmark de la caché de resultados de `memo_logic`. Recorre una secuencia de
+lecturas con distribución sesgada (Zipf: pocos valores muy repetidos) y otra de
+valores únicos con los backends de precisión, con la caché desactivada y activada, y
+muestra el costo por conversión, la tasa de aciertos y los desalojos.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_memo.py [--values N] [--distinct D] [--maxsize M]
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic import conversion_logic as cl
+from logic import memo_logic
+
+
+# ────────────────────── CASOS DE PRUEBA ──────────────────────
+# (sistema, función, unidad de origen, unidad de destino)
+CASES = [
+    ("length", cl.convert_length, "metros", "pies"),
+    ("temperature", cl.convert_temperature, "fahrenheit", "kelvin"),
+]
+BACKENDS = ("decimal", "fraction")
+
+
+def _workloads(count: int, distinct: int) -> dict[str, list[float]]:
+    """Genera las secuencias de lecturas: sesgada (Zipf) y de valores únicos."""
+    rng = random.Random(847)
+    readings = [round(rng.uniform(-50, 150), 1) for _ in range(distinct)]
+    weights = [1 / rank for rank in range(1, distinct + 1)]
+    return {
+        "zipf": rng.choices(readings, weights, k=count),
+        "unicos": [rng.uniform(-50, 150) for _ in range(count)],
+    }
+
+
+def _per_value_ns(func, values: list[float], from_unit: str, to_unit: str, backend: str):
+    """Tiempo por conversión en nanosegundos de una pasada por la secuencia."""
+    def run():
+        for value in values:
+            func(value, from_unit, to_unit, backend=backend)
+
+    return timeit.timeit(run, number=1) / len(values) * 1e9
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--values", type=int, default=50_000, help="Lecturas por secuencia")
+    parser.add_argument("--distinct", type=int, default=1000, help="Valores distintos (Zipf)")
+    parser.add_argument(
+        "--maxsize", type=int, default=memo_logic.DEFAULT_MAXSIZE, help="Tamaño de la caché"
+    )
+    args = parser.parse_args()
+
+    workloads = _workloads(args.values, args.distinct)
+    print(f"{'sistema':<13}{'backend':<10}{'secuencia':<10}{'sin caché ns':>14}"
+          f"{'con caché ns':>14}{'aciertos':>10}{'desalojos':>11}")
+    for dimension, func, from_unit, to_unit in CASES:
+        for backend in BACKENDS:
+            for label, values in workloads.items():
+                plain = _per_value_ns(func, values, from_unit, to_unit, backend)
+                memo_logic.enable([dimension], maxsize=args.maxsize)
+                try:
+                    cached = _per_value_ns(func, values, from_unit, to_unit, backend)
+                    stats = memo_logic.get_cache_stats()[dimension]
+                finally:
+                    memo_logic.disable([dimension])
+                print(f"{dimension:<13}{backend:<10}{label:<10}{plain:>14.1f}{cached:>14.1f}"
+                      f"{stats['hit_ratio']:>10.1%}{stats['evictions']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+bench_precision.py
+
+Micro-benchmark de los backends numéricos de las funciones `convert_*`: `float`,
+`decimal` (contexto por defecto de 28 dígitos) y `fraction` (exacto). Mide el costo
+por llamada de la función de conversión y de un conversor especializado, e informa
+el error relativo del resultado float frente al exacto, para decidir dónde conviene
+pagar la precisión.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_precision.py [--number N]
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+from fractions import Fraction
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic import conversion_logic as cl
+from logic.precision_logic import get_precise_converter
+
+
+# ────────────────────── CASOS DE PRUEBA ──────────────────────
+# (sistema, función, unidad de origen, unidad de destino, valor)
+CASES = [
+    ("temperature", cl.convert_temperature, "fahrenheit", "kelvin", 98.6),
+    ("length", cl.convert_length, "parsec", "angstroms", 1.5),
+    ("speed", cl.convert_speed, "kilometros_por_hora", "nudos", 120.0),
+    ("data", cl.convert_data, "yobibytes", "bits", 3.0),
+    ("data", cl.convert_data, "exbibytes", "kibibits", 7.0),
+]
+
+
+# ────────────────────── MEDICIÓN ──────────────────────
+def _per_call_ns(func, number: int) -> float:
+    """Devuelve el mejor tiempo por llamada en nanosegundos de 5 repeticiones."""
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e9
+
+
+def run(number: int) -> list[tuple[str, str, dict[str, tuple[float, float]], float]]:
+    """
+    Mide cada caso con los tres backends.
+
+    Returns:
+        list: (sistema, par de unidades, {backend: (ns función, ns conversor)},
+        error relativo del float frente al resultado exacto).
+    """
+    results = []
+    for system, func, from_unit, to_unit, value in CASES:
+        timings = {}
+        for backend in cl.BACKENDS:
+            if backend == "float":
+                converter = cl.get_converter(system, from_unit, to_unit)
+            else:
+                converter = get_precise_converter(system, from_unit, to_unit, backend)
+            timings[backend] = (
+                _per_call_ns(
+                    lambda f=func, b=backend: f(value, from_unit, to_unit, backend=b), number
+                ),
+                _per_call_ns(lambda c=converter: c(value), number),
+            )
+        exact = func(value, from_unit, to_unit, backend="fraction")
+        approx = Fraction(func(value, from_unit, to_unit))
+        error = abs(approx - exact) / abs(exact) if exact else 0
+        results.append((system, f"{from_unit}->{to_unit}", timings, float(error)))
+    return results
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--number", type=int, default=20_000, help="Llamadas por repetición")
+    args = parser.parse_args()
+
+    header = "".join(f"{backend + ' (ns)':>18}" for backend in cl.BACKENDS)
+    print(f"{'sistema':<12}{'conversión':<30}{'modo':<11}{header}{'error float':>14}")
+    for system, pair, timings, error in run(args.number):
+        for mode, column in (("función", 0), ("conversor", 1)):
+            cells = "".join(f"{timings[backend][column]:>18.1f}" for backend in cl.BACKENDS)
+            suffix = f"{error:>14.2e}" if column == 0 else ""
+            print(f"{system:<12}{pair:<30}{mode:<11}{cells}{suffix}")
+
+
+if __name__ == "__main__":
+    main()
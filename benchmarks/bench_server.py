@@ -0,0 +1,177 @@
+"""
+bench_server.py
+
+Cliente de carga para el servidor de `main.py serve`. Abre varias conexiones
+keep-alive concurrentes, envía peticiones `GET /convert` (o `POST /convert/batch` con
+`--batch N`) y mide el rendimiento y la latencia p50/p99 vista por el cliente. Al
+final consulta `/stats` para mostrar también la latencia medida por el servidor.
+
+Si no se indica `--port`, lanza su propio servidor en un puerto libre y lo detiene
+al terminar.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_server.py [--connections C] [--requests N] [--batch B]
+    python benchmarks/bench_server.py --port 8000
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from interfaces.interfaz_server import percentile
+
+
+# ────────────────────── PETICIONES ──────────────────────
+QUERY = "dim=length&from=metros&to=pies"
+
+
+def _build_request(host: str, batch: int) -> bytes:
+    """Construye la petición HTTP que se repite en cada iteración."""
+    if not batch:
+        return (
+            f"GET /convert?{QUERY}&value=12.5 HTTP/1.1\r\nHost: {host}\r\n\r\n"
+        ).encode()
+    body = json.dumps([float(i) for i in range(batch)]).encode()
+    return (
+        f"POST /convert/batch?{QUERY} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Lee una respuesta completa y devuelve (código de estado, cuerpo)."""
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def _worker(host: str, port: int, request: bytes, count: int, latencies: list) -> int:
+    """Envía `count` peticiones por una sola conexión keep-alive. Devuelve los errores."""
+    reader, writer = await asyncio.open_connection(host, port)
+    errors = 0
+    for _ in range(count):
+        start = time.perf_counter()
+        writer.write(request)
+        status, _ = await _read_response(reader)
+        latencies.append(time.perf_counter() - start)
+        errors += status != 200
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+
+async def _fetch_stats(host: str, port: int) -> dict:
+    """Consulta `/stats` del servidor."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+    _, body = await _read_response(reader)
+    writer.close()
+    return json.loads(body)
+
+
+async def run(host: str, port: int, connections: int, requests: int, batch: int) -> dict:
+    """
+    Ejecuta la carga y devuelve el resumen.
+
+    Returns:
+        dict: Peticiones, errores, peticiones por segundo, latencias del cliente
+        y estadísticas del servidor.
+    """
+    request = _build_request(host, batch)
+    latencies: list[float] = []
+    per_connection = max(1, requests // connections)
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        _worker(host, port, request, per_connection, latencies) for _ in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "requests_per_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "server": await _fetch_stats(host, port),
+    }
+
+
+# ────────────────────── SERVIDOR LOCAL ──────────────────────
+def _free_port() -> int:
+    """Obtiene un puerto TCP libre en la interfaz local."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(host: str, port: int) -> subprocess.Popen:
+    """Lanza `main.py serve` y espera a que acepte conexiones."""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "main.py"), "serve", "--host", host,
+         "--port", str(port)],
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("El servidor no respondió a tiempo.")
+
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección del servidor")
+    parser.add_argument("--port", type=int, default=None, help="Puerto de un servidor ya activo")
+    parser.add_argument("--connections", type=int, default=8, help="Conexiones concurrentes")
+    parser.add_argument("--requests", type=int, default=20_000, help="Peticiones totales")
+    parser.add_argument(
+        "--batch", type=int, default=0, help="Valores por petición POST (0 = GET individual)"
+    )
+    args = parser.parse_args()
+
+    process = None
+    port = args.port
+    if port is None:
+        port = _free_port()
+        process = _start_server(args.host, port)
+    try:
+        result = asyncio.run(run(args.host, port, args.connections, args.requests, args.batch))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    server = result["server"]
+    print(
+        f"{result['requests']} peticiones ({result['errors']} con error) con "
+        f"{args.connections} conexiones: {result['requests_per_s']:.0f} peticiones/s"
+    )
+    print(f"cliente   p50 {result['p50_ms']:.3f} ms   p99 {result['p99_ms']:.3f} ms")
+    print(f"servidor  p50 {server['p50_ms']:.3f} ms   p99 {server['p99_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+bench_startup.py
+
+Benchmark de regresión del tiempo de arranque. Ejecuta un intérprete nuevo con
+`python -X importtime` para cada módulo de la ruta de consola, toma el tiempo de
+importación acumulado y lo compara contra un presupuesto. También verifica que la
+lógica de conversión no importe dependencias de terceros.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_startup.py [--runs N] [--scale X]
+
+Termina con código 1 si algún módulo excede su presupuesto o si la lógica importa
+paquetes de terceros, por lo que puede usarse como verificación automática.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_PACKAGES = {"logic", "interfaces", "main"}
+
+# Presupuesto de importación acumulada en microsegundos por módulo
+BUDGETS_US = {
+    "logic.conversion_logic": 40_000,
+    "interfaces.interfaz_cli": 80_000,
+    "main": 60_000,
+}
+
+# Módulos que no deben cargar ningún paquete de terceros
+STDLIB_ONLY = {"logic.conversion_logic"}
+
+
+# ────────────────────── MEDICIÓN ──────────────────────
+def _import_profile(module: str) -> tuple[int, set[str]]:
+    """
+    Importa un módulo en un intérprete nuevo con `-X importtime`.
+
+    Args:
+        module: Nombre del módulo a importar.
+
+    Returns:
+        tuple[int, set[str]]: (microsegundos acumulados del módulo, paquetes raíz importados).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, field = line.split("|")
+        name = field.strip()
+        entries.append((len(field) - len(field.lstrip()), name, int(cumulative_us)))
+
+    # `-X importtime` imprime cada dependencia antes que el módulo que la importó y con
+    # mayor sangría, así que el subárbol del módulo son las líneas previas más indentadas.
+    position = next(i for i, entry in enumerate(entries) if entry[1] == module)
+    indent, _, cumulative = entries[position]
+    packages = {module.split(".")[0]}
+    for entry_indent, name, _ in reversed(entries[:position]):
+        if entry_indent <= indent:
+            break
+        packages.add(name.split(".")[0])
+    return cumulative, packages
+
+def _third_party(packages: set[str]) -> set[str]:
+    """Filtra los paquetes que no pertenecen a la biblioteca estándar ni al proyecto."""
+    return {
+        package for package in packages
+        if package not in sys.stdlib_module_names
+        and package not in PROJECT_PACKAGES
+        and not package.startswith("_")
+    }
+
+def run(runs: int, scale: float) -> bool:
+    """
+    Mide cada módulo `runs` veces y compara la mediana contra su presupuesto.
+
+    Returns:
+        bool: True si todos los módulos están dentro de su presupuesto.
+    """
+    ok = True
+    print(f"{'módulo':<28}{'mediana (ms)':>14}{'presupuesto (ms)':>18}  estado")
+    for module, budget in BUDGETS_US.items():
+        samples = []
+        packages = set()
+        for _ in range(runs):
+            cumulative, packages = _import_profile(module)
+            samples.append(cumulative)
+        median = statistics.median(samples)
+        limit = budget * scale
+        status = "OK" if median <= limit else "EXCEDIDO"
+
+        external = _third_party(packages)
+        if module in STDLIB_ONLY and external:
+            status = f"TERCEROS: {', '.join(sorted(external))}"
+        ok = ok and status == "OK"
+        print(f"{module:<28}{median / 1000:>14.1f}{limit / 1000:>18.1f}  {status}")
+    return ok
+
+def main() -> None:
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description="Presupuesto de tiempo de arranque.")
+    parser.add_argument("--runs", type=int, default=5, help="Intérpretes por módulo")
+    parser.add_argument(
+        "--scale", type=float, default=1.0,
+        help="Multiplicador del presupuesto para máquinas más lentas o más rápidas"
+    )
+    args = parser.parse_args()
+    sys.exit(0 if run(args.runs, args.scale) else 1)
+
+
+if __name__ == "__main__":
+    main()
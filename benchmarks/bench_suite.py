@@ -0,0 +1,289 @@
+"""
+bench_suite.py
+
+Suite de benchmarks del proyecto con `timeit` de la biblioteca estándar. Mide:
+    - El costo por llamada de cada una de las 12 funciones `convert_*`.
+    - La resolución de alias de unidades con `_match_unit` de la interfaz de consola.
+    - Una sesión completa de la interfaz de consola (`start_interface`) guiada por una
+      entrada estándar con guion, sin limpiar la pantalla y con la salida descartada.
+    - `SecApp.convert_values` de la interfaz gráfica sin pantalla, sobre una instancia
+      mínima con los atributos que usa el método (se omite si CustomTkinter no está).
+    - La elección de la unidad más legible con `humanize_logic.humanize`.
+
+Los resultados se escriben en JSON junto con el commit y la versión de Python, para
+compararlos entre commits con `--compare`, que termina con código 1 si algún caso es
+más lento que la referencia por encima de `--threshold`.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/bench_suite.py --output resultados.json
+    python benchmarks/bench_suite.py --compare resultados.json [--threshold 0.15]
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from logic import conversion_logic as cl
+from logic.humanize_logic import humanize
+from interfaces import interfaz_cli as cli
+
+
+# ────────────────────── CASOS DE PRUEBA ──────────────────────
+# (función, unidad de origen, unidad de destino)
+CONVERT_CASES = [
+    (cl.convert_temperature, "celsius", "fahrenheit"),
+    (cl.convert_length, "metros", "pies"),
+    (cl.convert_mass, "kilogramos", "libras"),
+    (cl.convert_volume, "litros", "galones_us"),
+    (cl.convert_energy, "joules", "kilovatio_horas"),
+    (cl.convert_area, "hectareas", "acres"),
+    (cl.convert_speed, "kilometros_por_hora", "nudos"),
+    (cl.convert_time, "horas", "segundos"),
+    (cl.convert_power, "kilovatios", "caballos_de_fuerza_eeuu"),
+    (cl.convert_angle, "grados", "radianes"),
+    (cl.convert_pressure, "bares", "pascales"),
+    (cl.convert_data, "gibibytes", "megabits"),
+]
+
+# (sistema, alias) para `_match_unit`: símbolo, nombre, número de menú y alias inexistente
+ALIAS_CASES = [
+    ("LONGITUD", "km"),
+    ("MASA", "Kilogramos"),
+    ("DATOS", "7"),
+    ("VOLUMEN", "no-existe"),
+]
+
+# (sistema, valor, unidad, prefijos) para `humanize`: extremos y valores intermedios
+HUMANIZE_CASES = [
+    ("data", 8.3e21, "bits", "iec"),
+    ("data", 1.23e-7, "gigabits", "si"),
+    ("time", 5.4e9, "microsegundos", "si"),
+    ("length", 0.25, "metros", "si"),
+]
+
+# Conversiones de cada sesión de consola: (sistema, origen, valor, destino)
+CLI_SCRIPT = [
+    ("2", "m", "12.5", "ft"),
+    ("1", "c", "36.6", "f"),
+    ("12", "gib", "3", "mb"),
+    ("7", "km/h", "100", "mph"),
+]
+
+
+# ────────────────────── MEDICIÓN ──────────────────────
+def _per_call_ns(func, number: int, repeat: int) -> float:
+    """Devuelve el mejor tiempo por llamada en nanosegundos de `repeat` repeticiones."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return best / number * 1e9
+
+
+def _cli_script() -> str:
+    """Construye la entrada estándar de una sesión que hace todas las conversiones."""
+    lines = []
+    for system, from_unit, value, to_unit in CLI_SCRIPT:
+        lines += [system, from_unit, value, to_unit, "1"]    # "1": volver al menú
+    lines += ["0", ""]                                      # Salir y confirmar
+    return "\n".join(lines) + "\n"
+
+
+def _run_cli_session(script: str) -> None:
+    """Ejecuta `start_interface` con la entrada del guion y descarta la salida."""
+    stdin = sys.stdin
+    sys.stdin = io.StringIO(script)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            cli.start_interface()
+    finally:
+        sys.stdin = stdin
+
+
+def bench_convert(number: int, repeat: int) -> dict[str, float]:
+    """Costo por llamada de cada función `convert_*`."""
+    return {
+        f"convert.{func.__name__}": _per_call_ns(
+            lambda f=func, a=from_unit, b=to_unit: f(12.5, a, b), number, repeat
+        )
+        for func, from_unit, to_unit in CONVERT_CASES
+    }
+
+
+def bench_aliases(number: int, repeat: int) -> dict[str, float]:
+    """Costo por búsqueda de `_match_unit` con distintos tipos de alias."""
+    match_unit = cli._match_unit                 # pylint: disable=protected-access
+    return {
+        f"alias._match_unit.{system.lower()}.{alias}": _per_call_ns(
+            lambda a=alias, i=cli.UNIT_INDEX[system]: match_unit(a, i), number, repeat
+        )
+        for system, alias in ALIAS_CASES
+    }
+
+
+def bench_cli(number: int, repeat: int) -> dict[str, float]:
+    """Costo por conversión de una sesión de consola guiada por stdin."""
+    script = _cli_script()
+    clear_console = cli._clear_console           # pylint: disable=protected-access
+    cli._clear_console = lambda: None            # Evita lanzar `clear` en cada menú
+    try:
+        sessions = max(1, number // 1000)
+        per_session = _per_call_ns(lambda: _run_cli_session(script), sessions, repeat)
+    finally:
+        cli._clear_console = clear_console
+    return {"cli.start_interface.per_conversion": per_session / len(CLI_SCRIPT)}
+
+
+def bench_gui(number: int, repeat: int) -> dict[str, float]:
+    """
+    Costo de `SecApp.convert_values` sin pantalla, con un valor y con un lote pegado.
+    Devuelve un diccionario vacío si la interfaz gráfica no se puede importar.
+    """
+    try:
+        from interfaces.interfaz_ctk import SecApp      # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return {}
+
+    def window(text: str) -> SimpleNamespace:
+        fake = SimpleNamespace(
+            conversion_system="LONGITUD",
+            convert_func=cl.convert_length,
+            entry_unity="metros",
+            exit_unity="pies",
+            threaded_batches=False,
+            pending_conversion=None,
+            batch_job=0,
+            entry_value_input=SimpleNamespace(get=lambda: text),
+            exit_value_label=SimpleNamespace(configure=lambda **kwargs: None),
+        )
+        fake.show_batch = lambda results: SecApp.show_batch(fake, results)
+        return fake
+
+    single = window("12.5")
+    batch = window(" ".join(str(i) for i in range(100)))
+    return {
+        "gui.SecApp.convert_values.single": _per_call_ns(
+            lambda: SecApp.convert_values(single), number, repeat
+        ),
+        "gui.SecApp.convert_values.batch100": _per_call_ns(
+            lambda: SecApp.convert_values(batch), max(1, number // 100), repeat
+        ),
+    }
+
+
+def bench_humanize(number: int, repeat: int) -> dict[str, float]:
+    """Costo por llamada de `humanize` con valores que caen en distintas unidades."""
+    return {
+        f"humanize.{dimension}.{unit}.{system}": _per_call_ns(
+            lambda d=dimension, v=value, u=unit, s=system: humanize(v, d, u, s), number, repeat
+        )
+        for dimension, value, unit, system in HUMANIZE_CASES
+    }
+
+
+BENCHMARKS = (bench_convert, bench_aliases, bench_cli, bench_gui, bench_humanize)
+
+
+# ────────────────────── RESULTADOS ──────────────────────
+def _git_commit() -> str | None:
+    """Devuelve el commit actual del repositorio, si se puede obtener."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+            text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(number: int, repeat: int) -> dict:
+    """
+    Ejecuta todos los benchmarks.
+
+    Returns:
+        dict: {'meta': {...}, 'results': {caso: ns por llamada}}.
+    """
+    results = {}
+    for benchmark in BENCHMARKS:
+        results.update(benchmark(number, repeat))
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "number": number,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compara dos ejecuciones y devuelve los casos que empeoraron más que `threshold`.
+
+    Returns:
+        list[str]: Casos con regresión.
+    """
+    regressions = []
+    for name, value in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference and value > reference * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    """Punto de entrada de la suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--number", type=int, default=100_000, help="Llamadas por repetición")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por caso")
+    parser.add_argument("--output", default=None, help="Archivo JSON donde guardar resultados")
+    parser.add_argument("--compare", default=None, help="Archivo JSON de referencia")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15,
+        help="Empeoramiento relativo tolerado al comparar. Por defecto 0.15 (15%%)."
+    )
+    args = parser.parse_args()
+
+    current = run(args.number, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    print(f"{'caso':<48}{'ns/llamada':>14}{'referencia':>14}{'cambio':>10}")
+    for name, value in current["results"].items():
+        reference = baseline["results"].get(name) if baseline else None
+        change = f"{value / reference - 1:>+9.1%}" if reference else ""
+        reference = f"{reference:>14.1f}" if reference else f"{'':>14}"
+        print(f"{name:<48}{value:>14.1f}{reference}{change:>10}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2)
+
+    if baseline:
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"Regresiones por encima del {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
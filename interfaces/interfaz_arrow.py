@@ -0,0 +1,108 @@
+"""
+interfaz_arrow.py
+
+Interfaz no interactiva para convertir una columna de un archivo Parquet o Arrow IPC
+(Feather v2) con `arrow_logic`. El archivo se procesa lote por lote y la columna
+convertida se agrega al final, con la unidad en los metadatos del campo. Requiere
+pyarrow.
+
+Uso:
+    python main.py convert-parquet --dim pressure --from bares --to pascales \\
+        --column presion --input lecturas.parquet --output salida.parquet
+    python main.py convert-parquet --dim temperature --to kelvin --column temp \\
+        --input lecturas.arrow --output salida.arrow --format arrow
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import logging
+import sys
+import time
+
+from logic.arrow_logic import DEFAULT_BATCH_SIZE, convert_arrow_file, convert_parquet
+from logic.conversion_logic import UNIT_REGISTRY
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+logger = logging.getLogger("conversor")
+
+
+# ────────────────────── FUNCIONES AUXILIARES ──────────────────────
+def _build_parser() -> argparse.ArgumentParser:
+    """Construye el analizador de argumentos del comando `convert-parquet`."""
+    parser = argparse.ArgumentParser(
+        prog="main.py convert-parquet",
+        description="Convierte una columna de un archivo Parquet o Arrow y la agrega al final."
+    )
+    parser.add_argument(
+        "--dim", required=True, choices=sorted(UNIT_REGISTRY),
+        help="Sistema de conversión."
+    )
+    parser.add_argument(
+        "--from", dest="from_unit", default=None,
+        help="Unidad de origen. Por defecto, la de los metadatos de la columna."
+    )
+    parser.add_argument("--to", dest="to_unit", required=True, help="Unidad de destino.")
+    parser.add_argument("--column", required=True, help="Columna a convertir.")
+    parser.add_argument(
+        "--new-column", default=None,
+        help="Nombre de la columna nueva. Por defecto '<columna>_<destino>'."
+    )
+    parser.add_argument("--input", required=True, help="Archivo de entrada.")
+    parser.add_argument("--output", required=True, help="Archivo de salida.")
+    parser.add_argument(
+        "--format", default="parquet", choices=("parquet", "arrow"),
+        help="Formato de los archivos: parquet o arrow (IPC/Feather v2). Por defecto parquet."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Filas por lote al leer Parquet; acota la memoria usada."
+    )
+    return parser
+
+
+# ────────────────────── INICIO DE LA INTERFAZ ──────────────────────
+def start_interface(argv: list[str] | None = None) -> int:
+    """
+    Ejecuta el comando `convert-parquet` e informa el rendimiento.
+
+    Args:
+        argv: Argumentos del comando (sin incluir `convert-parquet`).
+
+    Returns:
+        int: Código de salida (0 si la conversión terminó correctamente).
+    """
+    args = _build_parser().parse_args(argv)
+    columns = (args.column, args.dim, args.from_unit, args.to_unit, args.new_column)
+
+    start = time.perf_counter()
+    try:
+        if args.format == "arrow":
+            rows = convert_arrow_file(args.input, args.output, *columns)
+        else:
+            rows = convert_parquet(args.input, args.output, *columns, args.batch_size)
+    except ImportError as e:
+        logger.error("%s", e)
+        return 1
+    except ValueError as e:
+        logger.error("%s", e)
+        return 2
+    except OSError as e:
+        logger.error("No se pudo convertir el archivo: %s", e)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    logger.info(
+        "%d filas convertidas en %.2f s (%.0f filas/s).",
+        rows, elapsed, rows / elapsed if elapsed else 0.0
+    )
+    return 0
+
+
+# ────────────────────── PUNTO DE EJECUCIÓN ──────────────────────
+if __name__ == "__main__":
+    sys.exit(start_interface())
@@ -0,0 +1,108 @@
+"""
+interfaz_binary.py
+
+Interfaz no interactiva para convertir archivos binarios de valores float32/float64
+(volcados crudos de instrumentos) con `binary_logic`. La entrada y la salida se mapean
+en memoria, por lo que los valores nunca se leen como texto.
+
+Uso:
+    python main.py convert-binary --dim pressure --from bares --to pascales \\
+        --input lecturas.f32 --output pascales.f32 --dtype float32
+    python main.py convert-binary --dim temperature --from celsius --to kelvin \\
+        --input registros.bin --output kelvin.f64 --stride 16 --offset 8 --byteorder big
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import logging
+import sys
+import time
+
+from logic.binary_logic import BYTEORDERS, DTYPES, convert_binary_file
+from logic.conversion_logic import UNIT_REGISTRY
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+logger = logging.getLogger("conversor")
+
+
+# ────────────────────── FUNCIONES AUXILIARES ──────────────────────
+def _build_parser() -> argparse.ArgumentParser:
+    """Construye el analizador de argumentos del comando `convert-binary`."""
+    parser = argparse.ArgumentParser(
+        prog="main.py convert-binary",
+        description="Convierte un archivo binario de valores float32/float64 en otro."
+    )
+    parser.add_argument(
+        "--dim", required=True, choices=sorted(UNIT_REGISTRY),
+        help="Sistema de conversión."
+    )
+    parser.add_argument("--from", dest="from_unit", required=True, help="Unidad de origen.")
+    parser.add_argument("--to", dest="to_unit", required=True, help="Unidad de destino.")
+    parser.add_argument("--input", required=True, help="Archivo binario de entrada.")
+    parser.add_argument("--output", required=True, help="Archivo binario de salida.")
+    parser.add_argument(
+        "--dtype", default="float64", choices=list(DTYPES),
+        help="Tipo de los valores de entrada. Por defecto float64."
+    )
+    parser.add_argument(
+        "--out-dtype", default=None, choices=list(DTYPES),
+        help="Tipo de los valores de salida. Por defecto, el de la entrada."
+    )
+    parser.add_argument(
+        "--byteorder", default="little", choices=list(BYTEORDERS),
+        help="Orden de bytes de entrada y salida. Por defecto little."
+    )
+    parser.add_argument(
+        "--stride", type=int, default=None,
+        help="Bytes entre valores consecutivos. Por defecto, el tamaño del valor."
+    )
+    parser.add_argument(
+        "--offset", type=int, default=0,
+        help="Bytes que se saltan al inicio (encabezado o posición del canal). Por defecto 0."
+    )
+    return parser
+
+
+# ────────────────────── INICIO DE LA INTERFAZ ──────────────────────
+def start_interface(argv: list[str] | None = None) -> int:
+    """
+    Ejecuta el comando `convert-binary` e informa el rendimiento.
+
+    Args:
+        argv: Argumentos del comando (sin incluir `convert-binary`).
+
+    Returns:
+        int: Código de salida (0 si la conversión terminó correctamente).
+    """
+    args = _build_parser().parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        count = convert_binary_file(
+            args.input, args.output, args.dim, args.from_unit, args.to_unit,
+            dtype=args.dtype, byteorder=args.byteorder, out_dtype=args.out_dtype,
+            stride=args.stride, offset=args.offset
+        )
+    except ValueError as e:
+        logger.error("%s", e)
+        return 2
+    except OSError as e:
+        logger.error("No se pudo convertir el archivo: %s", e)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    logger.info(
+        "%d valores convertidos en %.2f s (%.1f millones de valores/s).",
+        count, elapsed, count / elapsed / 1e6 if elapsed else 0.0
+    )
+    return 0
+
+
+# ────────────────────── PUNTO DE EJECUCIÓN ──────────────────────
+if __name__ == "__main__":
+    sys.exit(start_interface())
@@ -0,0 +1,395 @@
+"""
+interfaz_bulk.py
+
+Interfaz no interactiva para conversiones masivas. Lee un archivo CSV (o texto con
+un valor por línea) desde la entrada estándar, convierte una columna y escribe el
+resultado en la salida estándar, procesando fila por fila con un pipeline de
+generadores para mantener el uso de memoria acotado sin importar el tamaño del archivo.
+
+Para archivos muy grandes, `--input` junto con `--workers N` mapea el archivo en memoria,
+lo divide en bloques alineados a saltos de línea y los convierte en paralelo con un
+`ProcessPoolExecutor`, escribiendo los bloques en orden. La salida es idéntica byte a
+byte a la del modo de un solo proceso, siempre que ningún campo entre comillas
+contenga saltos de línea.
+
+Uso:
+    python main.py convert --dim length --from metros --to pies < in.csv > out.csv
+    python main.py convert --dim mass --from kilogramos --to libras --input in.csv --workers 8
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import argparse
+import csv
+import io
+import logging
+import mmap
+import os
+import sys
+import time
+from typing import Callable, Iterable, Iterator, TextIO
+
+from logic.conversion_logic import UNIT_REGISTRY, get_converter
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+logger = logging.getLogger("conversor")
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024    # Tamaño aproximado en bytes de cada bloque paralelo
+ENCODING = "utf-8"
+
+
+class InvalidRowError(ValueError):
+    """
+    Valor no numérico en modo estricto. Guarda la fila (contada desde 1, sin el
+    encabezado) para que el modo paralelo pueda renumerarla respecto al archivo.
+    Los argumentos se pasan a `ValueError` para que la excepción viaje entre procesos.
+    """
+
+    def __init__(self, row: int, detail: str):
+        super().__init__(row, detail)
+        self.row = row
+        self.detail = detail
+
+    def __str__(self) -> str:
+        return f"Fila {self.row}: valor inválido ({self.detail})."
+
+
+# ────────────────────── FUNCIONES AUXILIARES ──────────────────────
+def _build_parser() -> argparse.ArgumentParser:
+    """Construye el analizador de argumentos del comando `convert`."""
+    parser = argparse.ArgumentParser(
+        prog="main.py convert",
+        description="Convierte una columna de un CSV leído por stdin y lo escribe en stdout."
+    )
+    parser.add_argument(
+        "--dim", required=True, choices=sorted(UNIT_REGISTRY),
+        help="Sistema de conversión."
+    )
+    parser.add_argument("--from", dest="from_unit", required=True, help="Unidad de origen.")
+    parser.add_argument("--to", dest="to_unit", required=True, help="Unidad de destino.")
+    parser.add_argument(
+        "--column", default="0",
+        help="Columna a convertir, por nombre (requiere encabezado) o por índice. Por defecto 0."
+    )
+    parser.add_argument(
+        "--delimiter", default=",", help="Separador de columnas. Por defecto ','."
+    )
+    parser.add_argument(
+        "--no-header", action="store_true",
+        help="Indica que la primera fila contiene datos y no nombres de columna."
+    )
+    parser.add_argument(
+        "--strict", action="store_true",
+        help="Detiene la conversión ante el primer valor no numérico en lugar de conservarlo."
+    )
+    parser.add_argument(
+        "--input", default=None,
+        help="Archivo de entrada. Si se omite se lee stdin. Necesario para --workers."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Procesos para convertir el archivo de --input en paralelo. Por defecto 1."
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help="Tamaño aproximado en bytes de cada bloque paralelo."
+    )
+    return parser
+
+def _resolve_column(column: str, header: list[str] | None) -> int:
+    """
+    Obtiene el índice de la columna a convertir.
+
+    Args:
+        column: Nombre o índice de la columna como cadena.
+        header: Encabezado del archivo o None si no tiene.
+
+    Returns:
+        int: Índice de la columna.
+
+    Raises:
+        ValueError: Si la columna no existe en el encabezado.
+    """
+    if column.lstrip("-").isdigit():
+        return int(column)
+    if header is None:
+        raise ValueError(f"No se puede buscar la columna '{column}' sin encabezado.")
+    try:
+        return header.index(column)
+    except ValueError as e:
+        raise ValueError(f"La columna '{column}' no existe en el encabezado.") from e
+
+
+# ────────────────────── PIPELINE DE CONVERSIÓN ──────────────────────
+def convert_rows(
+    rows: Iterable[list[str]],
+    converter: Callable[[float], float],
+    column: int,
+    stats: dict[str, int],
+    strict: bool = False
+) -> Iterator[list[str]]:
+    """
+    Convierte de forma perezosa la columna indicada de cada fila; el resto de columnas
+    se conservan sin cambios.
+
+    Args:
+        rows: Filas ya separadas en columnas.
+        converter: Función especializada obtenida con `get_converter`.
+        column: Índice de la columna a convertir.
+        stats: Contadores {"rows": ..., "errors": ...} que se actualizan al avanzar.
+        strict: Si es True, un valor no numérico detiene la conversión.
+
+    Yields:
+        list[str]: Fila con el valor convertido.
+
+    Raises:
+        InvalidRowError: En modo estricto, si algún valor no es numérico.
+    """
+    for row in rows:
+        stats["rows"] += 1
+        try:
+            row[column] = str(converter(float(row[column])))
+        except (ValueError, IndexError) as e:
+            if strict:
+                raise InvalidRowError(stats["rows"], str(e)) from e
+            stats["errors"] += 1
+        yield row
+
+def convert_stream(
+    source: TextIO,
+    destination: TextIO,
+    converter: Callable[[float], float],
+    column: str = "0",
+    delimiter: str = ",",
+    has_header: bool = True,
+    strict: bool = False
+) -> dict[str, int]:
+    """
+    Convierte un flujo CSV completo fila por fila.
+
+    Args:
+        source: Flujo de texto de entrada.
+        destination: Flujo de texto de salida.
+        converter: Función especializada obtenida con `get_converter`.
+        column: Nombre o índice de la columna a convertir.
+        delimiter: Separador de columnas.
+        has_header: Si la primera fila es el encabezado (se copia sin cambios).
+        strict: Si es True, un valor no numérico detiene la conversión.
+
+    Returns:
+        dict[str, int]: Contadores {"rows": filas procesadas, "errors": valores no convertidos}.
+    """
+    reader = csv.reader(source, delimiter=delimiter)
+    writer = csv.writer(destination, delimiter=delimiter, lineterminator="\n")
+    stats = {"rows": 0, "errors": 0}
+
+    header = None
+    if has_header:
+        header = next(reader, None)
+        if header is None:
+            return stats
+        writer.writerow(header)
+
+    column_index = _resolve_column(column, header)
+    writer.writerows(convert_rows(reader, converter, column_index, stats, strict))
+    return stats
+
+
+# ────────────────────── MOTOR PARALELO ──────────────────────
+def _chunk_bounds(buffer: mmap.mmap, start: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """
+    Divide el buffer en bloques de aproximadamente `chunk_size` bytes que terminan
+    siempre en un salto de línea (o en el final del archivo).
+
+    Yields:
+        tuple[int, int]: Posiciones (inicio, fin) de cada bloque.
+    """
+    size = len(buffer)
+    while start < size:
+        end = start + chunk_size
+        if end >= size:
+            end = size
+        else:
+            newline = buffer.find(b"\n", end - 1)
+            end = size if newline == -1 else newline + 1
+        yield start, end
+        start = end
+
+def _convert_chunk(
+    path: str,
+    bounds: tuple[int, int],
+    conversion: tuple[str, str, str],
+    column: int,
+    delimiter: str,
+    strict: bool
+) -> tuple[str, dict[str, int]]:
+    """
+    Convierte un bloque del archivo dentro de un proceso trabajador. Cada proceso mapea
+    el archivo por su cuenta, por lo que solo se envían posiciones y no los datos.
+
+    Args:
+        path: Ruta del archivo de entrada.
+        bounds: Posiciones (inicio, fin) del bloque en bytes.
+        conversion: (sistema, unidad de origen, unidad de destino).
+        column: Índice de la columna a convertir.
+        delimiter: Separador de columnas.
+        strict: Si es True, un valor no numérico detiene la conversión.
+
+    Returns:
+        tuple[str, dict[str, int]]: Texto convertido del bloque y sus contadores.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        text = buffer[bounds[0]:bounds[1]].decode(ENCODING)
+
+    stats = {"rows": 0, "errors": 0}
+    output = io.StringIO()
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter)
+    writer = csv.writer(output, delimiter=delimiter, lineterminator="\n")
+    writer.writerows(convert_rows(reader, get_converter(*conversion), column, stats, strict))
+    return output.getvalue(), stats
+
+def _write_chunk(future: Future, destination: TextIO, stats: dict[str, int]) -> None:
+    """
+    Espera el resultado de un bloque, lo escribe y acumula sus contadores.
+
+    Raises:
+        InvalidRowError: En modo estricto, con la fila contada desde el inicio del
+            archivo. Los bloques se escriben en orden, así que `stats["rows"]` ya
+            tiene las filas de todos los bloques anteriores.
+    """
+    try:
+        text, chunk_stats = future.result()
+    except InvalidRowError as e:
+        raise InvalidRowError(stats["rows"] + e.row, e.detail) from None
+    destination.write(text)
+    stats["rows"] += chunk_stats["rows"]
+    stats["errors"] += chunk_stats["errors"]
+
+def convert_file_parallel(
+    path: str,
+    destination: TextIO,
+    conversion: tuple[str, str, str],
+    column: str = "0",
+    delimiter: str = ",",
+    has_header: bool = True,
+    strict: bool = False,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict[str, int]:
+    """
+    Convierte un archivo CSV repartiendo bloques entre varios procesos y escribe los
+    resultados en orden. Solo se mantienen en vuelo `2 * workers` bloques a la vez,
+    por lo que la memoria usada no depende del tamaño del archivo.
+
+    Args:
+        path: Ruta del archivo de entrada.
+        destination: Flujo de texto de salida.
+        conversion: (sistema, unidad de origen, unidad de destino).
+        column: Nombre o índice de la columna a convertir.
+        delimiter: Separador de columnas.
+        has_header: Si la primera fila es el encabezado (se copia sin cambios).
+        strict: Si es True, un valor no numérico detiene la conversión.
+        workers: Número de procesos. Por defecto, el número de núcleos.
+        chunk_size: Tamaño aproximado en bytes de cada bloque.
+
+    Returns:
+        dict[str, int]: Contadores {"rows": filas procesadas, "errors": valores no convertidos}.
+    """
+    stats = {"rows": 0, "errors": 0}
+    workers = workers or os.cpu_count() or 1
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return stats
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = 0
+            header = None
+            if has_header:
+                newline = buffer.find(b"\n")
+                start = len(buffer) if newline == -1 else newline + 1
+                header_text = buffer[:start].decode(ENCODING)
+                header = next(csv.reader(io.StringIO(header_text, newline=""), delimiter=delimiter))
+                csv.writer(destination, delimiter=delimiter, lineterminator="\n").writerow(header)
+            column_index = _resolve_column(column, header)
+            bounds = list(_chunk_bounds(buffer, start, chunk_size))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future] = deque()
+        for chunk in bounds:
+            pending.append(executor.submit(
+                _convert_chunk, path, chunk, conversion, column_index, delimiter, strict
+            ))
+            if len(pending) >= 2 * workers:
+                _write_chunk(pending.popleft(), destination, stats)
+        while pending:
+            _write_chunk(pending.popleft(), destination, stats)
+    return stats
+
+# ────────────────────── INICIO DE LA INTERFAZ ──────────────────────
+def start_interface(argv: list[str] | None = None) -> int:
+    """
+    Ejecuta el comando `convert` desde stdin hacia stdout e informa el rendimiento.
+
+    Args:
+        argv: Argumentos del comando (sin incluir `convert`).
+
+    Returns:
+        int: Código de salida (0 si la conversión terminó correctamente).
+    """
+    args = _build_parser().parse_args(argv)
+
+    try:
+        converter = get_converter(args.dim, args.from_unit, args.to_unit)
+    except ValueError as e:
+        logger.error("%s", e)
+        return 2
+
+    if args.workers > 1 and args.input is None:
+        logger.error("--workers requiere un archivo de entrada con --input.")
+        return 2
+
+    start = time.perf_counter()
+    try:
+        if args.workers > 1:
+            stats = convert_file_parallel(
+                args.input, sys.stdout, (args.dim, args.from_unit, args.to_unit),
+                args.column, args.delimiter, not args.no_header, args.strict,
+                args.workers, args.chunk_size
+            )
+        elif args.input is not None:
+            with open(args.input, encoding=ENCODING, newline="") as source:
+                stats = convert_stream(
+                    source, sys.stdout, converter, args.column, args.delimiter,
+                    not args.no_header, args.strict
+                )
+        else:
+            sys.stdin.reconfigure(newline="")
+            stats = convert_stream(
+                sys.stdin, sys.stdout, converter, args.column, args.delimiter,
+                not args.no_header, args.strict
+            )
+    except OSError as e:
+        logger.error("No se pudo leer el archivo de entrada: %s", e)
+        return 1
+    except ValueError as e:
+        logger.error("%s", e)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    if stats["errors"]:
+        logger.warning("%d valores no numéricos se copiaron sin convertir.", stats["errors"])
+    logger.info(
+        "%d filas convertidas en %.2f s (%.0f filas/s).",
+        stats["rows"], elapsed, stats["rows"] / elapsed if elapsed else 0.0
+    )
+    return 0
+
+
+# ────────────────────── PUNTO DE EJECUCIÓN ──────────────────────
+if __name__ == "__main__":
+    sys.exit(start_interface())
@@ -12,12 +12,16 @@ Versión: 1.0
 
 # ────────────────────── IMPORTACIONES ──────────────────────
 from enum import Enum, auto
+from functools import cache
 import logging
-from tkinter import TclError
+import sys
+import time
+from typing import Mapping
+from queue import Empty, SimpleQueue
+import threading
+from tkinter import Misc, TclError
 
-from colorama import Fore, Style, init
 import customtkinter as ctk
-from screeninfo import get_monitors
 
 from logic.conversion_logic import (
     convert_temperature,
@@ -32,12 +36,19 @@ from logic.conversion_logic import (
     convert_angle,
     convert_pressure,
     convert_data,
+    get_converter,
 )
+from logic.unit_catalog import SYSTEMS, get_display_names, get_logical_names
+from interfaces.terminal import load_colors
 
 
 # ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
-init (autoreset=True)
+Fore, Style = load_colors(sys.stderr)   # Colorama solo se carga si hay una terminal
 BOLD = Style.BRIGHT
+DEBOUNCE_MS = 150               # Espera tras la última tecla antes de convertir
+POLL_MS = 30                    # Intervalo para recoger resultados del hilo de trabajo
+BATCH_THREAD_THRESHOLD = 2000   # Lotes con más valores se convierten en otro hilo
+BATCH_PREVIEW = 5               # Valores de un lote que se muestran en la etiqueta
 
 class ConversionSystems(Enum):
     """
@@ -95,6 +106,21 @@ class ColorFormatter(logging.Formatter):
         message = super().format(record)
         return f"{color}{message}{Style.RESET_ALL}"
 
+CONVERSION_MAP = {
+    ConversionSystems.TEMPERATURA: convert_temperature,
+    ConversionSystems.LONGITUD: convert_length,
+    ConversionSystems.MASA: convert_mass,
+    ConversionSystems.VOLUMEN: convert_volume,
+    ConversionSystems.ENERGIA: convert_energy,
+    ConversionSystems.AREA: convert_area,
+    ConversionSystems.VELOCIDAD: convert_speed,
+    ConversionSystems.TIEMPO: convert_time,
+    ConversionSystems.POTENCIA: convert_power,
+    ConversionSystems.ANGULOS: convert_angle,
+    ConversionSystems.PRESION: convert_pressure,
+    ConversionSystems.DATOS: convert_data
+}
+
 # Configuración del logger
 logger = logging.getLogger("conversor")
 logger.setLevel(logging.DEBUG)
@@ -103,7 +129,45 @@ formatter = ColorFormatter("%(levelname)s: %(message)s")
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
-screen_size = get_monitors()[0] # Tamaño real de la pantalla
+
+
+# ────────────────────── GEOMETRÍA DE PANTALLA ──────────────────────
+@cache
+def _get_monitor_size() -> tuple[int, int] | None:
+    """
+    Obtiene el tamaño real del monitor principal con `screeninfo`. El módulo se importa
+    y se consulta una sola vez, al abrir la primera ventana y no al importar la interfaz.
+
+    Returns:
+        tuple[int, int] | None: (ancho, alto) en píxeles, o None si `screeninfo` no está
+        instalado o no encuentra monitores (por ejemplo, en entornos sin pantalla).
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from screeninfo import ScreenInfoError, get_monitors
+    except ImportError:
+        return None
+    try:
+        monitor = get_monitors()[0]
+    except (ScreenInfoError, IndexError):
+        return None
+    return monitor.width, monitor.height
+
+def get_screen_size(window: Misc) -> tuple[int, int]:
+    """
+    Devuelve el tamaño de la pantalla para posicionar ventanas. Usa el monitor principal
+    si `screeninfo` está disponible y, si no, el tamaño que reporta Tk.
+
+    Args:
+        window: Cualquier ventana o widget de Tk ya creado.
+
+    Returns:
+        tuple[int, int]: (ancho, alto) en píxeles.
+    """
+    size = _get_monitor_size()
+    if size is None:
+        size = (window.winfo_screenwidth(), window.winfo_screenheight())
+    return size
 
 
 # ────────────────────── CLASES DE INTERFAZ ──────────────────────
@@ -125,17 +189,20 @@ class App(ctk.CTk):
         Inicializa la ventana principal y sus elementos.
 
         Configura el tamaño de la ventana, crea los marcos de encabezado
-        y contenido, añade el interruptor de modo claro/oscuro, y genera
-        los botones correspondientes a cada sistema de unidades.
+        y contenido y añade el interruptor de modo claro/oscuro. Los botones
+        de cada sistema de unidades se crean después de dibujar el primer
+        cuadro para que la ventana aparezca cuanto antes.
         """
+        self.startup_time = time.perf_counter()
         ctk.set_appearance_mode("system")
         super().__init__()
         self.title("Conversor de Unidades")
-        win_width = int(screen_size.width * 0.3)
-        win_height = int(screen_size.height * 0.4)
+        screen_width, screen_height = get_screen_size(self)
+        win_width = int(screen_width * 0.3)
+        win_height = int(screen_height * 0.4)
         self.win_position = (
-            f"{int((screen_size.width - win_width) / 2.5)}+"
-            f"{int((screen_size.height - win_height) / 2.5)}"
+            f"{int((screen_width - win_width) / 2.5)}+"
+            f"{int((screen_height - win_height) / 2.5)}"
         )
         self.geometry(f"{win_width}x{win_height}+{self.win_position}")
         self.configure(padx = 20, pady=20)
@@ -204,12 +271,22 @@ class App(ctk.CTk):
         self.content_frame.columnconfigure((0,1,2), weight=1)
         self.content_frame.rowconfigure((0,1,2,3), weight=1)
 
+        # Ventanas secundarias ya construidas, una por sistema
+        self.windows: dict[ConversionSystems, SecApp] = {}
+
+        # Sonda de arranque: registra el tiempo hasta el primer cuadro
+        self.bind("<Map>", self.log_first_frame, add="+")
+        self.after_idle(self.build_system_buttons)
+
+    def build_system_buttons(self) -> None:
+        """Crea los botones de cada sistema de unidades y el botón de salida."""
+        self.selected_system = ctk.StringVar(value= ConversionSystems.TEMPERATURA.name)
+
         # Botones de sistemas
         for i in range(len(ConversionSystems)):
             row = i // 3
             col = i % 3
             system = ConversionSystems(i)
-            self.selected_system = ctk.StringVar(value= ConversionSystems.TEMPERATURA.name)
 
             button = ctk.CTkButton(
             master = self.content_frame,
@@ -238,6 +315,19 @@ class App(ctk.CTk):
         )
         self.exit_button.grid(row=5, column=1, pady=4)
 
+    def log_first_frame(self, event) -> None:
+        """
+        Registra una sola vez el tiempo transcurrido entre la creación de la ventana
+        principal y su primer cuadro en pantalla.
+        """
+        if event.widget is not self or self.startup_time is None:
+            return
+        logger.info(
+            "Primer cuadro dibujado en %.1f ms.",
+            (time.perf_counter() - self.startup_time) * 1000
+        )
+        self.startup_time = None
+
     def toogle_appearance_mode(self):
         """Cambia entre modo claro y oscuro de la interfaz."""
         if self.switch_light_dark.get():
@@ -247,12 +337,19 @@ class App(ctk.CTk):
 
     def instanciar_ventana(self, value):
         """
-        Crea una ventana secundaria para el sistema de unidades elegido.
+        Muestra la ventana secundaria del sistema de unidades elegido. Cada ventana se
+        construye la primera vez que se abre su sistema y después solo se oculta y se
+        vuelve a mostrar, por lo que abrirla de nuevo no reconstruye sus widgets.
 
         Args:
             value (str): Nombre del sistema de unidades seleccionado.
         """
-        SecApp(master = self, conversion_system = value)
+        system = ConversionSystems[value]
+        window = self.windows.get(system)
+        if window is None or not window.winfo_exists():
+            self.windows[system] = SecApp(master = self, conversion_system = value)
+        else:
+            window.show()
 
 class SecApp(ctk.CTkToplevel):
     """
@@ -267,7 +364,12 @@ class SecApp(ctk.CTkToplevel):
         customtkinter.CTkToplevel: Clase para gestionar ventanas secundarias.
     """
 
-    def __init__(self, master = None, conversion_system = "Conversión de ..."):
+    def __init__(
+        self,
+        master = None,
+        conversion_system = "Conversión de ...",
+        threaded_batches: bool = True
+    ):
         """
         Inicializa la ventana secundaria y sus elementos.
         Configura el tamaño de la ventana y su posición, y crea los marcos para contener a los
@@ -277,12 +379,18 @@ class SecApp(ctk.CTkToplevel):
             master: El objeto al que pertenece o en el que se aloja. Por defecto se determina None.
             conversion_system: Cadena que indica el tipo de sistema de conversión.
             Por defecto se establece como "Conversión de ...".
+            threaded_batches: Si es True, los lotes grandes (por ejemplo, una columna de
+            valores pegada) se convierten en un hilo de trabajo para no congelar la ventana.
         """
         super().__init__(master = master)
         self.conversion_system = conversion_system
+        self.threaded_batches = threaded_batches
+        self.convert_func = CONVERSION_MAP.get(ConversionSystems[conversion_system])
+        self.pending_conversion = None  # Identificador del `after()` pendiente
+        self.batch_job = 0              # Lote vigente; los resultados anteriores se descartan
+        self.batch_results = SimpleQueue()
         self.title("Conversión de " + self.conversion_system.title())
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
+        screen_width, screen_height = get_screen_size(self)
         win_width = int(screen_width * 0.2)
         win_height = int(screen_height * 0.4)
         self.win_position = (
@@ -295,6 +403,7 @@ class SecApp(ctk.CTkToplevel):
         self.grab_set()
         self.focus_set()
         self.resizable("false","false")
+        self.protocol("WM_DELETE_WINDOW", self.cerrar_toplevel)  # Ocultar, no destruir
 
         # ----- Frame Principal -----
         self.main_frame = ctk.CTkFrame(
@@ -316,8 +425,9 @@ class SecApp(ctk.CTkToplevel):
         # Unidad de Entrada
         self.units_map = self.get_units_display_map(self.conversion_system)
         self.display_units = list(self.units_map.values())  # Para mostrar en el combobox
+        self.reverse_units_map = self.get_units_reverse_map(self.conversion_system)
 
-        self.entry_unity = self.get_logical_generic_unity(self.display_units[0])
+        self.entry_unity = next(iter(self.units_map))
 
         # ----- Frame de Entrada -----
         self.entry_frame = ctk.CTkFrame(
@@ -376,11 +486,11 @@ class SecApp(ctk.CTkToplevel):
         self.entry_value_input.pack(fill="x", pady=(5,10))
         self.entry_value_input.bind(
             "<KeyRelease>",
-            lambda event: self.convert_values()
+            lambda event: self.schedule_conversion()
         ) # Luego de soltar una tecla al ingresar en input.
 
         # Unidad de Salida
-        self.exit_unity = self.get_logical_generic_unity(self.display_units[0])
+        self.exit_unity = next(iter(self.units_map))
 
         # ----- Frame de Salida -----
         self.exit_frame = ctk.CTkFrame(
@@ -434,95 +544,36 @@ class SecApp(ctk.CTkToplevel):
         )
         self.back_button.pack(pady=(0, 10), fill="x")
 
-    def get_units_display_map(self, conversion_system: str) -> dict[str, str]:
+    def get_units_display_map(self, conversion_system: str) -> Mapping[str, str]:
         """
         Devuelve un diccionario que mapea las unidades lógicas
         (usadas internamente) a sus nombres amigables para mostrar
-        en la interfaz.
+        en la interfaz. El mapa lo precalcula el catálogo y todas las ventanas
+        del mismo sistema comparten la misma instancia.
 
         Args:
             conversion_system: Nombre del sistema de conversión.
 
         Returns:
-            dict: {unidad_logica: "Unidad Amigable"}
+            Mapping: {unidad_logica: "Unidad Amigable"}, tomado del catálogo de unidades.
         """
-        match ConversionSystems[conversion_system]:
-            case ConversionSystems.TEMPERATURA:
-                units = ["celsius", "farenheit", "kelvin"]
-            case ConversionSystems.LONGITUD:
-                units = [
-                    "angstroms", "nanometros", "micrones", "milimetros", "centimetros",
-                    "metros", "kilometros", "pies", "yardas", "millas", "millas_nauticas",
-                    "anio_luz", "unidad_astronomica", "parsec"
-                ]
-            case ConversionSystems.MASA:
-                units = [
-                    "miligramos", "centigramos", "decigramos", "quilates", "gramos", "decagramos",
-                    "hectogramos", "kilogramos", "toneladas_metricas", "onzas", "libras",
-                    "piedra", "toneladas_cortas_eeuu", "toneladas_largas_uk"
-                ]
-            case ConversionSystems.VOLUMEN:
-                units = [
-                    "mililitros", "centimetros_cubicos", "litros", "metros_cubicos",
-                    "cucharaditas_us", "cucharadas_us", "onzas_liquidas_us", "tazas_us",
-                    "pintas_us", "cuartos_de_galon_us", "galones_us", "pulgadas_cubicas",
-                    "pies_cubicos", "yardas_cubicas", "cucharaditas_uk", "cucharadas_uk",
-                    "onzas_liquidas_uk", "pintas_uk", "cuartos_de_galon_uk", "galones_uk"
-                ]
-            case ConversionSystems.ENERGIA:
-                units = [
-                    "joules", "kilojulios", "calorias_termales", "calorias_alimentos",
-                    "pie_libras", "unidades_termicas_britanicas", "kilovatio_horas"
-                ]
-            case ConversionSystems.AREA:
-                units = [
-                    "milimetros_cuadrados", "centimetros_cuadrados", "metros_cuadrados",
-                    "hectareas", "kilometros_cuadrados", "pulgadas_cuadradas", "pies_cuadrados",
-                    "yardas_cuadradas", "acres", "millas_cuadradas"
-                ]
-            case ConversionSystems.VELOCIDAD:
-                units = [
-                    "centimetros_por_segundo", "metros_por_segundo", "kilometros_por_hora",
-                    "pies_por_segundo", "millas_por_hora", "nudos", "mach"
-                ]
-            case ConversionSystems.TIEMPO:
-                units = [
-                    "microsegundos", "milisegundos", "segundos", "minutos", "horas", "dias",
-                    "semanas", "años"
-                ]
-            case ConversionSystems.POTENCIA:
-                units = [
-                    "vatios", "kilovatios", "caballos_de_fuerza_eeuu", "pie_libras_por_minuto",
-                    "unidades_termicas_britanicas_por_minuto"
-                ]
-            case ConversionSystems.ANGULOS:
-                units = ["grados", "radianes", "grados_centesimales"]
-            case ConversionSystems.PRESION:
-                units = [
-                    "atmosferas", "bares", "kilopascales", "milimetros_de_mercurio", "pascales",
-                    "libras_por_pulgada_cuadrada"
-                ]
-            case ConversionSystems.DATOS:
-                units = [
-                    "bits", "cuarteto", "bytes", "kilobits", "kibibits", "kilobytes", "kibibytes",
-                    "megabits", "mebibits", "megabytes", "mebibytes", "gigabits", "gibibits",
-                    "gigabytes", "gibibytes", "terabits", "tebibits", "terabytes", "tebibytes",
-                    "petabits", "pebibits", "petabytes", "pebibytes", "exabits", "exbibits",
-                    "exabytes", "exbibytes", "zettabits", "zebibits", "zettabytes", "zebibytes",
-                    "yottabits", "yobibits", "yottabytes", "yobibytes"
-                ]
-            case _:
-                units = []
-
-        # Generar un diccionario {valor_logico: "Valor Amigable"}
-        return {
-            unit: (
-                unit.replace("_", " ").capitalize()
-                if "_" not in unit
-                else " ".join(word.capitalize() for word in unit.split("_"))
-            )
-            for unit in units
-        }
+        if conversion_system not in SYSTEMS:
+            return {}
+        return get_display_names(conversion_system)
+
+    def get_units_reverse_map(self, conversion_system: str) -> Mapping[str, str]:
+        """
+        Devuelve el mapa inverso de `get_units_display_map`, precalculado por el catálogo.
+
+        Args:
+            conversion_system: Nombre del sistema de conversión.
+
+        Returns:
+            Mapping: {"Unidad Amigable": unidad_logica}.
+        """
+        if conversion_system not in SYSTEMS:
+            return {}
+        return get_logical_names(conversion_system)
 
     # ----- Obtener Unidades Lógicas -----
     def get_logical_entry_unit(self) -> str:
@@ -532,12 +583,7 @@ class SecApp(ctk.CTkToplevel):
         Returns:
             str: Obtiene el nombre de la unidad de entrada reconocible para el programa
         """
-        selected_display_value = self.from_unity_combobox.get()
-
-        # Invertir el diccionario para buscar la clave lógica
-        reverse_units_map = {v: k for k, v in self.units_map.items()}
-        selected_logical_value = reverse_units_map[selected_display_value]
-        return selected_logical_value
+        return self.reverse_units_map[self.from_unity_combobox.get()]
 
     def get_logical_exit_unit(self) -> str:
         """
@@ -546,22 +592,7 @@ class SecApp(ctk.CTkToplevel):
         Returns:
             str: Obtiene el nombre de la unidad de salida reconocible para el programa
         """
-        selected_display_value = self.to_unity_combobox.get()
-
-        # Invertir el diccionario para buscar la clave lógica
-        reverse_units_map = {v: k for k, v in self.units_map.items()}
-        selected_logical_value = reverse_units_map[selected_display_value]
-        return selected_logical_value
-
-    def get_logical_generic_unity(self, unity):
-        """
-        Obtiene el nombre de unidad en minúsculas y remplazando '_' por un espacio ' '.
-
-        Returns:
-            str: Obtiene el nombre de la unidad de entrada reconocible para el programa
-        """
-        value = unity
-        return value.replace(" ", "_").lower()
+        return self.reverse_units_map[self.to_unity_combobox.get()]
 
     # ----- Establecer Unidades -----
     def set_entry_unity(self, unity) -> None:
@@ -569,9 +600,10 @@ class SecApp(ctk.CTkToplevel):
         Configura la unidad de entrada y actualiza el resultado.
 
         Args:
-            unity (str): Unidad de entrada como cadena.
+            unity (str): Nombre lógico de la unidad de entrada.
         """
-        self.entry_unity = unity.lower()
+        self.entry_unity = unity
+        self.cancel_pending_conversion()
         self.convert_values()
 
     def set_exit_unity(self, unity) -> None:
@@ -579,22 +611,44 @@ class SecApp(ctk.CTkToplevel):
         Configura la unidad de salida y actualiza el resultado.
 
         Args:
-            unity (str): Unidad de salida como cadena.
+            unity (str): Nombre lógico de la unidad de salida.
         """
-        self.exit_unity = unity.lower()
+        self.exit_unity = unity
+        self.cancel_pending_conversion()
         self.convert_values()
 
     # ----- Conversión de Valores -----
+    def cancel_pending_conversion(self) -> None:
+        """Cancela la conversión programada por `schedule_conversion`, si la hay."""
+        if self.pending_conversion is not None:
+            self.after_cancel(self.pending_conversion)
+            self.pending_conversion = None
+
+    def schedule_conversion(self) -> None:
+        """
+        Programa la conversión `DEBOUNCE_MS` milisegundos después de la última tecla.
+        Cada pulsación cancela la conversión pendiente, de modo que al escribir, mantener
+        una tecla o pegar un número largo solo se convierte una vez.
+        """
+        self.cancel_pending_conversion()
+        self.pending_conversion = self.after(DEBOUNCE_MS, self.convert_values)
+
     def convert_values(self) -> None:
         """
         Convierte el valor ingresado en el campo de entrada
-        y actualiza la etiqueta de resultado.
+        y actualiza la etiqueta de resultado. Si se pegaron varios valores separados
+        por espacios, saltos de línea o punto y coma, se convierten como un lote.
         """
-        if self.entry_value_input.get() == "":
+        self.pending_conversion = None
+        self.batch_job += 1     # Invalida cualquier lote que siga en curso
+        if self.entry_value_input.get().strip() == "":
             self.exit_value_label.configure(text = "Esperando datos...")
             return
         try:
-            entry_value = float(self.entry_value_input.get())
+            entry_values = [
+                float(value)
+                for value in self.entry_value_input.get().replace(";", " ").split()
+            ]
         except ValueError:
             self.exit_value_label.configure(text="Error! Debes ingresar un Número válido!")
             return
@@ -617,31 +671,79 @@ class SecApp(ctk.CTkToplevel):
             )
             return
 
-        conversion_map = {
-            ConversionSystems.TEMPERATURA: convert_temperature,
-            ConversionSystems.LONGITUD: convert_length,
-            ConversionSystems.MASA: convert_mass,
-            ConversionSystems.VOLUMEN: convert_volume,
-            ConversionSystems.ENERGIA: convert_energy,
-            ConversionSystems.AREA: convert_area,
-            ConversionSystems.VELOCIDAD: convert_speed,
-            ConversionSystems.TIEMPO: convert_time,
-            ConversionSystems.POTENCIA: convert_power,
-            ConversionSystems.ANGULOS: convert_angle,
-            ConversionSystems.PRESION: convert_pressure,
-            ConversionSystems.DATOS: convert_data
-        }
-
-        func = conversion_map.get(ConversionSystems[self.conversion_system])
-
-        if func:
-            exit_value = func(entry_value, self.entry_unity, self.exit_unity)
+        if not self.convert_func:
+            return
+
+        if len(entry_values) == 1:
+            exit_value = self.convert_func(entry_values[0], self.entry_unity, self.exit_unity)
             self.exit_value_label.configure(text=str(exit_value))
+            return
+
+        converter = get_converter(
+            SYSTEMS[self.conversion_system].key, self.entry_unity, self.exit_unity
+        )
+        if not self.threaded_batches or len(entry_values) <= BATCH_THREAD_THRESHOLD:
+            self.show_batch(list(map(converter, entry_values)))
+            return
+
+        self.exit_value_label.configure(text=f"Convirtiendo {len(entry_values)} valores...")
+        threading.Thread(
+            target=self.convert_batch_worker,
+            args=(self.batch_job, converter, entry_values),
+            daemon=True
+        ).start()
+        self.after(POLL_MS, self.poll_batch_results)
+
+    def convert_batch_worker(self, job: int, converter, values: list[float]) -> None:
+        """
+        Convierte un lote fuera del hilo principal. No toca ningún widget: deja el
+        resultado en `batch_results` para que el hilo de Tk lo recoja.
+
+        Args:
+            job: Número de lote con el que se lanzó el trabajo.
+            converter: Función de conversión de `get_converter`.
+            values: Valores a convertir.
+        """
+        self.batch_results.put((job, list(map(converter, values))))
+
+    def poll_batch_results(self) -> None:
+        """
+        Recoge desde el bucle de eventos de Tk los lotes terminados por el hilo de
+        trabajo y muestra el más reciente. Los lotes reemplazados por una edición
+        posterior se descartan.
+        """
+        try:
+            job, results = self.batch_results.get_nowait()
+        except Empty:
+            self.after(POLL_MS, self.poll_batch_results)
+            return
+        if job == self.batch_job:
+            self.show_batch(results)
+
+    def show_batch(self, results: list[float]) -> None:
+        """
+        Muestra los primeros `BATCH_PREVIEW` resultados de un lote y el total de valores.
+
+        Args:
+            results: Valores convertidos.
+        """
+        preview = ", ".join(str(value) for value in results[:BATCH_PREVIEW])
+        if len(results) > BATCH_PREVIEW:
+            preview += ", ..."
+        self.exit_value_label.configure(text=f"{len(results)} valores: {preview}")
 
     # ----- Control de Ventanas -----
+    def show(self) -> None:
+        """Vuelve a mostrar la ventana oculta con sus unidades y su último valor."""
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.focus_set()
+
     def cerrar_toplevel(self) -> None:
-        """Cierra la ventana toplevel."""
-        self.destroy()
+        """Oculta la ventana toplevel para reutilizarla la próxima vez que se abra."""
+        self.grab_release()
+        self.withdraw()
 
 
 # ────────────────────── INICIO DE LA INTERFAZ ──────────────────────
@@ -0,0 +1,434 @@
+"""
+interfaz_server.py
+
+Microservicio HTTP local para usar el conversor como proceso auxiliar (sidecar) sin
+lanzar `main.py` por cada conversión. Está construido sobre `asyncio` y solo usa la
+biblioteca estándar. Las conexiones HTTP/1.1 se mantienen abiertas (keep-alive) para
+atender varias peticiones seguidas sin volver a conectar.
+
+Rutas:
+    GET  /convert?dim=length&from=metros&to=pies&value=12.5
+    POST /convert/batch?dim=length&from=metros&to=pies
+         Cuerpo JSON: [1, 2, 3] o {"dim": ..., "from": ..., "to": ..., "values": [...]}
+         Cuerpo NDJSON (Content-Type: application/x-ndjson): un arreglo JSON por línea;
+         la respuesta tiene una línea convertida por cada línea recibida.
+    GET  /stats     Peticiones atendidas y latencia p50/p99 del servidor.
+    GET  /metrics   Contadores por terna en formato de Prometheus (solo si la
+                    instrumentación de `metrics_logic` está activa).
+
+Uso:
+    python main.py serve --host 127.0.0.1 --port 8000
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from collections import deque
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Callable
+
+from logic import metrics_logic
+from logic.async_logic import get_executor
+from logic.conversion_logic import get_cached_converter
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+logger = logging.getLogger("conversor")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+MAX_HEADERS = 100                   # Encabezados admitidos por petición
+MAX_BODY_SIZE = 16 * 1024 * 1024    # Tamaño máximo del cuerpo de una petición
+OFFLOAD_BODY_SIZE = 64 * 1024       # Cuerpos mayores se convierten fuera del ciclo de eventos
+KEEP_ALIVE_TIMEOUT = 15             # Segundos de espera por la siguiente petición
+LATENCY_WINDOW = 100_000            # Latencias recientes usadas para p50/p99
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class HTTPError(Exception):
+    """Error que se responde al cliente con un código HTTP y un mensaje JSON."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ────────────────────── ESTADÍSTICAS ──────────────────────
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Devuelve el percentil de una lista de muestras por el método del rango más cercano.
+
+    Args:
+        samples: Muestras ordenadas de menor a mayor.
+        fraction: Percentil entre 0 y 1 (ej. 0.99).
+
+    Returns:
+        float: Valor del percentil, o 0.0 si no hay muestras.
+    """
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+class LatencyStats:
+    """
+    Cuenta las peticiones atendidas y guarda las latencias más recientes en una
+    ventana acotada para calcular p50/p99 sin crecer en memoria.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=window)
+
+    def record(self, seconds: float, ok: bool) -> None:
+        """Registra la latencia de una petición y si terminó sin error."""
+        self.requests += 1
+        self.errors += not ok
+        self.latencies.append(seconds)
+
+    def summary(self) -> dict[str, float]:
+        """
+        Returns:
+            dict[str, float]: Peticiones, errores y latencias p50/p99 en milisegundos.
+        """
+        samples = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 4),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 4),
+        }
+
+
+# ────────────────────── CONVERSIÓN ──────────────────────
+def _get_converter(params: dict) -> Callable[[float], float]:
+    """
+    Obtiene el conversor de los parámetros 'dim', 'from' y 'to'.
+
+    Raises:
+        HTTPError: Si falta algún parámetro o no es válido.
+    """
+    try:
+        return get_cached_converter(params["dim"], params["from"], params["to"])
+    except KeyError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Falta el parametro {e}.") from e
+    except (ValueError, TypeError) as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, str(e)) from e
+
+def _convert_values(converter: Callable[[float], float], values) -> list[float]:
+    """
+    Convierte una lista JSON de números.
+
+    Raises:
+        HTTPError: Si la entrada no es una lista de números.
+    """
+    if not isinstance(values, list):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Se esperaba un arreglo de numeros.")
+    if any(isinstance(value, bool) for value in values):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Valor no numerico: true/false.")
+    try:
+        return [converter(float(value)) for value in values]
+    except (ValueError, TypeError, OverflowError) as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Valor no numerico: {e}") from e
+
+def _dumps(payload) -> str:
+    """
+    Codifica una respuesta en JSON estricto (sin `Infinity` ni `NaN`).
+
+    Raises:
+        HTTPError: Si algún resultado es infinito o NaN.
+    """
+    try:
+        return json.dumps(payload, allow_nan=False)
+    except ValueError as e:
+        raise HTTPError(
+            HTTPStatus.BAD_REQUEST, "Resultado fuera de rango: infinito o NaN."
+        ) from e
+
+def _loads(data: bytes):
+    """
+    Decodifica un documento JSON.
+
+    Raises:
+        HTTPError: Si el documento no es JSON válido.
+    """
+    try:
+        return json.loads(data)
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"JSON invalido: {e}") from e
+
+
+# ────────────────────── RUTAS ──────────────────────
+def handle_convert(params: dict, body: bytes, content_type: str) -> tuple[bytes, str]:
+    """Atiende `GET /convert`: convierte un solo valor."""
+    converter = _get_converter(params)
+    try:
+        value = float(params["value"])
+    except KeyError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Falta el parametro {e}.") from e
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Valor no numerico: {e}") from e
+    payload = {**params, "value": value, "result": converter(value)}
+    return _dumps(payload).encode(), "application/json"
+
+def handle_batch(params: dict, body: bytes, content_type: str) -> tuple[bytes, str]:
+    """
+    Atiende `POST /convert/batch`. Con NDJSON convierte un arreglo por línea y
+    responde con una línea por arreglo; con JSON acepta un arreglo o un objeto con
+    'values' (y opcionalmente 'dim', 'from' y 'to' en lugar de la consulta).
+    """
+    if content_type in NDJSON_TYPES:
+        converter = _get_converter(params)
+        lines = [
+            _dumps(_convert_values(converter, _loads(line)))
+            for line in body.splitlines() if line.strip()
+        ]
+        return ("\n".join(lines) + "\n").encode() if lines else b"", NDJSON_TYPES[0]
+
+    document = _loads(body)
+    if isinstance(document, dict):
+        params = {**params, **{k: document[k] for k in ("dim", "from", "to") if k in document}}
+        document = document.get("values")
+    results = _convert_values(_get_converter(params), document)
+    return _dumps({"results": results}).encode(), "application/json"
+
+ROUTES = {
+    ("GET", "/convert"): handle_convert,
+    ("POST", "/convert/batch"): handle_batch,
+}
+
+
+# ────────────────────── SERVIDOR ──────────────────────
+class ConversionServer:
+    """
+    Servidor HTTP/1.1 mínimo sobre `asyncio` con conexiones persistentes.
+
+    Attributes:
+        stats (LatencyStats): Peticiones atendidas y latencias del servidor.
+    """
+
+    def __init__(self):
+        self.stats = LatencyStats()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """
+        Lee una petición completa de la conexión.
+
+        Returns:
+            tuple | None: (método, ruta, consulta, versión, encabezados, cuerpo), o None si
+            el cliente cerró la conexión o no envió nada antes del tiempo de espera.
+
+        Raises:
+            HTTPError: Si la petición está mal formada o excede los límites.
+        """
+        try:
+            line = await _read_line(reader)
+        except asyncio.TimeoutError:
+            return None
+        if not line:
+            return None
+
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Linea de peticion invalida.") from e
+
+        headers = {}
+        while True:
+            try:
+                line = await _read_line(reader)
+            except asyncio.TimeoutError as e:
+                raise HTTPError(HTTPStatus.REQUEST_TIMEOUT, "Encabezados incompletos.") from e
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise HTTPError(
+                    HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Demasiados encabezados."
+                )
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "Se requiere Content-Length.")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length invalido.") from e
+        if length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length invalido.")
+        if length > MAX_BODY_SIZE:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Cuerpo demasiado grande.")
+        body = await reader.readexactly(length) if length else b""
+
+        url = urlsplit(target)
+        return method.upper(), url.path, url.query, version, headers, body
+
+    async def _dispatch(self, method: str, path: str, query: str, headers: dict, body: bytes):
+        """
+        Ejecuta la ruta solicitada. Los cuerpos mayores que `OFFLOAD_BODY_SIZE` se
+        convierten en el ejecutor compartido de `async_logic` para no bloquear las
+        demás conexiones.
+
+        Returns:
+            tuple[HTTPStatus, bytes, str]: (estado, cuerpo, tipo de contenido).
+        """
+        if path == "/stats" and method == "GET":
+            return HTTPStatus.OK, json.dumps(self.stats.summary()).encode(), "application/json"
+        if path == "/metrics" and method == "GET" and metrics_logic.is_enabled():
+            payload = metrics_logic.export_prometheus().encode()
+            return HTTPStatus.OK, payload, "text/plain; version=0.0.4"
+
+        handler = ROUTES.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in ROUTES):
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"Metodo no permitido: {method}.")
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {path}.")
+
+        params = {key: values[-1] for key, values in parse_qs(query).items()}
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if len(body) > OFFLOAD_BODY_SIZE:
+            loop = asyncio.get_running_loop()
+            payload, content_type = await loop.run_in_executor(
+                get_executor(), handler, params, body, content_type
+            )
+        else:
+            payload, content_type = handler(params, body, content_type)
+        return HTTPStatus.OK, payload, content_type
+
+    async def handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Atiende todas las peticiones de una conexión hasta que se cierre."""
+        keep_alive = True
+        try:
+            while keep_alive:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    self._write(writer, e.status, _error_body(e.message), "application/json", False)
+                    break
+                if request is None:
+                    break
+
+                start = time.perf_counter()
+                method, path, query, version, headers, body = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection == "keep-alive" if version == "HTTP/1.0"
+                    else connection != "close"
+                )
+                try:
+                    status, payload, content_type = await self._dispatch(
+                        method, path, query, headers, body
+                    )
+                except HTTPError as e:
+                    status, payload, content_type = (
+                        e.status, _error_body(e.message), "application/json"
+                    )
+                self._write(writer, status, payload, content_type, keep_alive)
+                await writer.drain()
+                self.stats.record(time.perf_counter() - start, status == HTTPStatus.OK)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _write(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: bytes,
+        content_type: str,
+        keep_alive: bool
+    ) -> None:
+        """Escribe una respuesta HTTP/1.1 completa en el buffer de la conexión."""
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+
+    async def serve(self, host: str, port: int) -> None:
+        """Escucha en `host:port` hasta que se cancele la tarea."""
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        addresses = ", ".join(str(sock.getsockname()[:2]) for sock in server.sockets)
+        logger.info("Servidor de conversiones escuchando en %s.", addresses)
+        async with server:
+            await server.serve_forever()
+
+async def _read_line(reader: asyncio.StreamReader) -> bytes:
+    """
+    Lee una línea de la petición con el tiempo de espera de la conexión.
+
+    Raises:
+        asyncio.TimeoutError: Si la línea no llega a tiempo.
+        HTTPError: Si la línea supera el límite del buffer de la conexión.
+    """
+    try:
+        return await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+    except (ValueError, asyncio.LimitOverrunError) as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Linea demasiado larga.") from e
+
+def _error_body(message: str) -> bytes:
+    """Cuerpo JSON de una respuesta de error."""
+    return json.dumps({"error": message}).encode()
+
+
+# ────────────────────── INICIO DE LA INTERFAZ ──────────────────────
+def _build_parser() -> argparse.ArgumentParser:
+    """Construye el analizador de argumentos del comando `serve`."""
+    parser = argparse.ArgumentParser(
+        prog="main.py serve",
+        description="Inicia un servidor HTTP local de conversiones."
+    )
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST, help=f"Dirección de escucha. Por defecto {DEFAULT_HOST}."
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Puerto. Por defecto {DEFAULT_PORT}."
+    )
+    return parser
+
+def start_interface(argv: list[str] | None = None) -> int:
+    """
+    Ejecuta el comando `serve` hasta que se interrumpa y al terminar informa las
+    peticiones atendidas y la latencia p50/p99.
+
+    Args:
+        argv: Argumentos del comando (sin incluir `serve`).
+
+    Returns:
+        int: Código de salida (0 al detenerse normalmente).
+    """
+    args = _build_parser().parse_args(argv)
+    server = ConversionServer()
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except OSError as e:
+        logger.error("No se pudo iniciar el servidor: %s", e)
+        return 1
+    finally:
+        summary = server.stats.summary()
+        logger.info(
+            "%d peticiones atendidas (%d con error). Latencia p50 %.3f ms, p99 %.3f ms.",
+            summary["requests"], summary["errors"], summary["p50_ms"], summary["p99_ms"]
+        )
+    return 0
+
+
+# ────────────────────── PUNTO DE EJECUCIÓN ──────────────────────
+if __name__ == "__main__":
+    sys.exit(start_interface())
@@ -0,0 +1,161 @@
+"""
+interfaz_worker.py
+
+Modo trabajador persistente para integraciones por tubería. El proceso queda
+residente, lee una petición JSON por línea desde la entrada estándar y escribe una
+respuesta JSON por línea en la salida estándar, en el mismo orden, vaciando el buffer
+después de cada respuesta. Así se paga el arranque de Python una sola vez en lugar de
+una vez por conversión.
+
+Petición:
+    {"dim": "length", "from": "metros", "to": "pies", "values": [1, 2.5]}
+    {"id": 7, "dim": "temperature", "from": "celsius", "to": "kelvin", "value": 20}
+Respuesta:
+    {"results": [3.280839895013123, 8.202099737532807]}
+    {"id": 7, "result": 293.15}
+Error (el proceso sigue atendiendo las siguientes líneas):
+    {"id": 7, "error": "Unidad invalida: 'pulgas'."}
+
+Uso:
+    python main.py worker < peticiones.ndjson > respuestas.ndjson
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import argparse
+import json
+import logging
+import sys
+import time
+from math import isfinite
+from typing import BinaryIO, TextIO
+
+from logic.conversion_logic import get_cached_converter
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+logger = logging.getLogger("conversor")
+
+
+# ────────────────────── PROCESAMIENTO ──────────────────────
+def _convert(converter, value) -> float:
+    """
+    Convierte un valor de la petición.
+
+    Raises:
+        TypeError: Si el valor no es un número ni una cadena numérica (incluye true/false).
+        ValueError: Si el valor no es numérico o el resultado es infinito o NaN.
+    """
+    if isinstance(value, bool):
+        raise TypeError(f"Valor no numerico: {value!r}.")
+    result = converter(float(value))
+    if not isfinite(result):
+        raise ValueError(f"Resultado fuera de rango para {value!r}: infinito o NaN.")
+    return result
+
+def handle_request(request) -> dict:
+    """
+    Atiende una petición ya decodificada.
+
+    Args:
+        request: Objeto JSON con 'dim', 'from', 'to' y 'values' (lista) o 'value'
+            (número). Si incluye 'id', se copia en la respuesta.
+
+    Returns:
+        dict: Respuesta con 'results' o 'result', o con 'error' si la petición no
+        es válida.
+    """
+    if not isinstance(request, dict):
+        return {"error": "La peticion debe ser un objeto JSON."}
+
+    response = {"id": request["id"]} if "id" in request else {}
+    try:
+        converter = get_cached_converter(request["dim"], request["from"], request["to"])
+        if "values" in request:
+            values = request["values"]
+            if not isinstance(values, list):
+                raise TypeError("Se esperaba un arreglo de numeros en 'values'.")
+            response["results"] = [_convert(converter, value) for value in values]
+        else:
+            response["result"] = _convert(converter, request["value"])
+    except KeyError as e:
+        response["error"] = f"Falta el campo {e}."
+    except (ValueError, TypeError, OverflowError) as e:
+        response["error"] = str(e)
+    return response
+
+def serve_stream(source: BinaryIO, destination: TextIO) -> dict[str, int]:
+    """
+    Atiende peticiones línea por línea hasta que se cierre la entrada.
+
+    Args:
+        source: Flujo binario de entrada con una petición JSON por línea.
+        destination: Flujo de texto de salida; recibe una respuesta por petición.
+
+    Returns:
+        dict[str, int]: Peticiones atendidas ('requests') y con error ('errors').
+    """
+    stats = {"requests": 0, "errors": 0}
+    write, flush = destination.write, destination.flush
+    for line in source:
+        if not line.strip():
+            continue
+        try:
+            response = handle_request(json.loads(line))
+        except ValueError as e:
+            response = {"error": f"JSON invalido: {e}"}
+        except Exception as e:      # pylint: disable=broad-exception-caught
+            # Una petición defectuosa nunca debe detener al trabajador
+            logger.exception("Error inesperado al atender una peticion.")
+            response = {"error": f"Error interno: {e}"}
+        try:
+            line = json.dumps(response, allow_nan=False)
+        except ValueError:      # Un 'id' con NaN o infinito no se puede devolver
+            response = {"error": "La respuesta contiene valores no finitos."}
+            line = json.dumps(response)
+        stats["requests"] += 1
+        stats["errors"] += "error" in response
+        write(line + "\n")
+        flush()
+    return stats
+
+
+# ────────────────────── INICIO DE LA INTERFAZ ──────────────────────
+def start_interface(argv: list[str] | None = None) -> int:
+    """
+    Ejecuta el comando `worker` hasta que se cierre la entrada estándar e informa el
+    número de peticiones y el tiempo medio por petición.
+
+    Args:
+        argv: Argumentos del comando (sin incluir `worker`).
+
+    Returns:
+        int: Código de salida (0 al cerrarse la entrada).
+    """
+    argparse.ArgumentParser(
+        prog="main.py worker",
+        description="Atiende peticiones JSON por línea desde stdin y responde por stdout."
+    ).parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        stats = serve_stream(sys.stdin.buffer, sys.stdout)
+    except BrokenPipeError:
+        logger.warning("La salida se cerró antes de terminar.")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    logger.info(
+        "%d peticiones atendidas (%d con error), %.1f µs por petición.",
+        stats["requests"], stats["errors"],
+        elapsed / stats["requests"] * 1e6 if stats["requests"] else 0.0
+    )
+    return 0
+
+
+# ────────────────────── PUNTO DE EJECUCIÓN ──────────────────────
+if __name__ == "__main__":
+    sys.exit(start_interface())
@@ -0,0 +1,64 @@
+"""
+terminal.py
+
+Configuración perezosa de colores para la terminal. Colorama solo se importa e
+inicializa cuando hay una terminal (TTY) conectada; al redirigir la salida a un
+archivo o a otro proceso se usan sustitutos sin color y no se carga ninguna
+dependencia externa.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from functools import cache
+import sys
+from typing import Any, TextIO
+
+
+# ────────────────────── SUSTITUTOS SIN COLOR ──────────────────────
+class _NoColor:
+    """Sustituto de `colorama.Fore` y `colorama.Style` que devuelve cadenas vacías."""
+
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+NO_COLOR = _NoColor()
+
+
+# ────────────────────── FUNCIONES DE CONFIGURACIÓN ──────────────────────
+@cache
+def _import_colorama() -> tuple[Any, Any]:
+    """
+    Importa e inicializa Colorama una sola vez por proceso.
+
+    Returns:
+        tuple: (Fore, Style) de Colorama, o sustitutos sin color si no está instalado.
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from colorama import Fore, Style, init
+    except ImportError:
+        return NO_COLOR, NO_COLOR
+    init(autoreset=True)    # Inicializa Colorama con autoreset en cada impresión
+    return Fore, Style
+
+def is_tty(stream: TextIO | None) -> bool:
+    """Indica si el flujo existe y está conectado a una terminal."""
+    return stream is not None and stream.isatty()
+
+def load_colors(stream: TextIO | None = None) -> tuple[Any, Any]:
+    """
+    Devuelve los objetos de color a usar al escribir en un flujo.
+
+    Args:
+        stream: Flujo en el que se escribirá. Por defecto, `sys.stdout`.
+
+    Returns:
+        tuple: (Fore, Style) de Colorama si el flujo es una terminal, o sustitutos
+        que devuelven cadenas vacías en caso contrario.
+    """
+    if not is_tty(sys.stdout if stream is None else stream):
+        return NO_COLOR, NO_COLOR
+    return _import_colorama()
@@ -0,0 +1,290 @@
+"""
+arrow_logic.py
+
+Integración opcional con Apache Arrow y Parquet. Convierte una columna de una tabla
+por lotes de registros (`RecordBatch`) con los kernels vectorizados de `pyarrow.compute`
+y los coeficientes precalculados de `conversion_logic` (una multiplicación, más una
+suma en temperatura). El resultado se agrega como una columna nueva, y la unidad y el
+sistema quedan en los metadatos del campo ('unit' y 'dimension').
+
+Los archivos se leen y escriben lote por lote, así que la memoria usada depende del
+tamaño del lote y no del de la tabla.
+
+pyarrow es opcional: solo se importa en este módulo, y las funciones lanzan
+`ImportError` si no está instalado.
+
+Uso:
+    convert_parquet("lecturas.parquet", "salida.parquet", "presion", "pressure",
+                    "bares", "pascales")
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from collections.abc import Iterable, Iterator
+
+from logic.conversion_logic import get_coefficients
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:     # pyarrow es opcional
+    pa = pc = ipc = pq = None
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+DEFAULT_BATCH_SIZE = 64 * 1024      # Filas por lote al leer archivos
+UNIT_KEY = b"unit"                  # Metadato del campo con la unidad
+DIMENSION_KEY = b"dimension"        # Metadato del campo con el sistema
+
+
+# ────────────────────── FUNCIONES AUXILIARES ──────────────────────
+def _require_pyarrow() -> None:
+    """
+    Verifica que pyarrow esté instalado.
+
+    Raises:
+        ImportError: Si pyarrow no está disponible.
+    """
+    if pa is None:
+        raise ImportError("Se requiere pyarrow para leer Arrow/Parquet: pip install pyarrow")
+
+def _resolve_from_unit(field, from_unit: str | None) -> str:
+    """
+    Obtiene la unidad de origen: la indicada o, si se omite, la guardada en los
+    metadatos del campo.
+
+    Raises:
+        ValueError: Si no se indicó y el campo no tiene la unidad en sus metadatos.
+    """
+    if from_unit is not None:
+        return from_unit
+    metadata = field.metadata or {}
+    if UNIT_KEY not in metadata:
+        raise ValueError(f"La columna '{field.name}' no indica su unidad; use from_unit.")
+    return metadata[UNIT_KEY].decode()
+
+def build_output_schema(
+    schema,
+    column: str,
+    dimension: str,
+    from_unit: str | None,
+    to_unit: str,
+    new_column: str | None = None
+):
+    """
+    Construye el esquema de salida: el de entrada más el campo convertido (float64),
+    con la unidad y el sistema en sus metadatos.
+
+    Args:
+        schema: Esquema de entrada (`pyarrow.Schema`).
+        column: Columna a convertir.
+        dimension: Sistema de conversión ('pressure', 'temperature', ...).
+        from_unit: Unidad de origen, o None para leerla de los metadatos del campo.
+        to_unit: Unidad de destino.
+        new_column: Nombre de la columna nueva. Por defecto, '<columna>_<destino>'.
+
+    Returns:
+        tuple: (esquema de salida, unidad de origen, nombre de la columna nueva).
+
+    Raises:
+        ValueError: Si la columna no existe, la columna nueva ya existe o no se
+            conoce la unidad de origen.
+    """
+    _require_pyarrow()
+    index = schema.get_field_index(column)
+    if index < 0:
+        raise ValueError(f"La columna '{column}' no existe en el esquema.")
+    from_unit = _resolve_from_unit(schema.field(index), from_unit)
+    new_column = new_column or f"{column}_{to_unit}"
+    if schema.get_field_index(new_column) >= 0:
+        raise ValueError(f"La columna '{new_column}' ya existe en el esquema.")
+
+    field = pa.field(
+        new_column, pa.float64(), metadata={UNIT_KEY: to_unit, DIMENSION_KEY: dimension}
+    )
+    return schema.append(field), from_unit, new_column
+
+
+# ────────────────────── CONVERSIÓN DE COLUMNAS ──────────────────────
+def convert_array(values, scale: float, offset: float):
+    """
+    Aplica `valor * escala + desplazamiento` a un arreglo de Arrow con los kernels de
+    `pyarrow.compute`. Los valores nulos se conservan como nulos.
+
+    Args:
+        values: `pyarrow.Array` o `ChunkedArray` numérico.
+        scale: Escala de la conversión.
+        offset: Desplazamiento de la conversión (0.0 en los sistemas lineales).
+
+    Returns:
+        El arreglo convertido como float64.
+    """
+    _require_pyarrow()
+    result = pc.multiply(pc.cast(values, pa.float64()), pa.scalar(scale, pa.float64()))
+    if offset:
+        result = pc.add(result, pa.scalar(offset, pa.float64()))
+    return result
+
+def convert_batches(
+    batches: Iterable,
+    column: str,
+    dimension: str,
+    from_unit: str | None,
+    to_unit: str,
+    new_column: str | None = None,
+    schema=None
+) -> Iterator:
+    """
+    Convierte una columna en cada lote de una secuencia de `RecordBatch`, de forma
+    perezosa: cada lote se convierte al pedirlo.
+
+    Args:
+        batches: Lotes de registros con el mismo esquema.
+        column: Columna a convertir.
+        dimension: Sistema de conversión.
+        from_unit: Unidad de origen, o None para leerla de los metadatos del campo.
+        to_unit: Unidad de destino.
+        new_column: Nombre de la columna nueva (ver `build_output_schema`).
+        schema: Esquema de los lotes. Si se omite, se toma del primer lote.
+
+    Yields:
+        pyarrow.RecordBatch: Cada lote con la columna convertida agregada al final.
+
+    Raises:
+        ValueError: Si la columna, el sistema o las unidades no son válidos.
+    """
+    _require_pyarrow()
+    output_schema = scale = offset = None
+    if schema is not None:
+        output_schema, from_unit, _ = build_output_schema(
+            schema, column, dimension, from_unit, to_unit, new_column
+        )
+        scale, offset = get_coefficients(dimension, from_unit, to_unit)
+
+    for batch in batches:
+        if output_schema is None:
+            output_schema, from_unit, _ = build_output_schema(
+                batch.schema, column, dimension, from_unit, to_unit, new_column
+            )
+            scale, offset = get_coefficients(dimension, from_unit, to_unit)
+        converted = convert_array(batch.column(column), scale, offset)
+        yield pa.RecordBatch.from_arrays([*batch.columns, converted], schema=output_schema)
+
+def convert_table(
+    table,
+    column: str,
+    dimension: str,
+    from_unit: str | None,
+    to_unit: str,
+    new_column: str | None = None
+):
+    """
+    Convierte una columna de una tabla (`pyarrow.Table`) ya cargada en memoria.
+
+    Returns:
+        pyarrow.Table: La tabla con la columna convertida agregada al final.
+
+    Raises:
+        ValueError: Si la columna, el sistema o las unidades no son válidos.
+    """
+    _require_pyarrow()
+    schema, from_unit, _ = build_output_schema(
+        table.schema, column, dimension, from_unit, to_unit, new_column
+    )
+    scale, offset = get_coefficients(dimension, from_unit, to_unit)
+    converted = convert_array(table.column(column), scale, offset)
+    return pa.Table.from_arrays([*table.columns, converted], schema=schema)
+
+
+# ────────────────────── ARCHIVOS ──────────────────────
+def convert_parquet(
+    input_path: str,
+    output_path: str,
+    column: str,
+    dimension: str,
+    from_unit: str | None,
+    to_unit: str,
+    new_column: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Convierte una columna de un archivo Parquet y escribe el resultado en otro,
+    leyendo y escribiendo un lote a la vez.
+
+    Args:
+        input_path: Archivo Parquet de entrada.
+        output_path: Archivo Parquet de salida.
+        column: Columna a convertir.
+        dimension: Sistema de conversión.
+        from_unit: Unidad de origen, o None para leerla de los metadatos del campo.
+        to_unit: Unidad de destino.
+        new_column: Nombre de la columna nueva (ver `build_output_schema`).
+        batch_size: Filas por lote; acota la memoria usada.
+
+    Returns:
+        int: Número de filas convertidas.
+
+    Raises:
+        ImportError: Si pyarrow no está instalado.
+        ValueError: Si la columna, el sistema o las unidades no son válidos.
+        OSError: Si no se puede leer la entrada o escribir la salida.
+    """
+    _require_pyarrow()
+    source = pq.ParquetFile(input_path)
+    schema = source.schema_arrow
+    output_schema, _, _ = build_output_schema(
+        schema, column, dimension, from_unit, to_unit, new_column
+    )
+
+    rows = 0
+    with pq.ParquetWriter(output_path, output_schema) as writer:
+        for batch in convert_batches(
+            source.iter_batches(batch_size=batch_size), column, dimension, from_unit,
+            to_unit, new_column, schema
+        ):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+def convert_arrow_file(
+    input_path: str,
+    output_path: str,
+    column: str,
+    dimension: str,
+    from_unit: str | None,
+    to_unit: str,
+    new_column: str | None = None
+) -> int:
+    """
+    Igual que `convert_parquet`, pero con archivos Arrow IPC (Feather v2). La entrada
+    se mapea en memoria y se recorre lote por lote con los lotes del propio archivo.
+
+    Returns:
+        int: Número de filas convertidas.
+
+    Raises:
+        ImportError: Si pyarrow no está instalado.
+        ValueError: Si la columna, el sistema o las unidades no son válidos.
+        OSError: Si no se puede leer la entrada o escribir la salida.
+    """
+    _require_pyarrow()
+    with pa.memory_map(input_path) as source:
+        reader = ipc.open_file(source)
+        output_schema, _, _ = build_output_schema(
+            reader.schema, column, dimension, from_unit, to_unit, new_column
+        )
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+        rows = 0
+        with ipc.new_file(output_path, output_schema) as writer:
+            for batch in convert_batches(
+                batches, column, dimension, from_unit, to_unit, new_column, reader.schema
+            ):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    return rows
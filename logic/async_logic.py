@@ -0,0 +1,180 @@
+"""
+async_logic.py
+
+API asíncrona para usar el conversor dentro de servicios con `asyncio` sin bloquear
+el ciclo de eventos. `aconvert` convierte un valor en línea (cuesta una multiplicación)
+y `aconvert_batch` convierte lotes: los pequeños en línea y los que superan un umbral
+por bloques en un ejecutor compartido (hilos por defecto, o el que se configure con
+`set_executor`, por ejemplo un `ProcessPoolExecutor`).
+
+Los bloques en vuelo de todas las llamadas comparten una cola acotada por ciclo de
+eventos (`MAX_PENDING_CHUNKS`): cuando está llena, cada llamada espera antes de enviar
+el siguiente bloque, lo que limita la memoria y el trabajo pendiente del ejecutor. Al
+cancelar una llamada se cancelan sus bloques que aún no empezaron.
+
+Está en un módulo aparte para que `conversion_logic` no importe `asyncio` al arrancar.
+
+Uso:
+    result = await aconvert("length", 12.5, "metros", "pies")
+    results = await aconvert_batch("pressure", lecturas, "bares", "pascales")
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any
+from weakref import WeakKeyDictionary
+import asyncio
+import os
+
+from logic.batch_logic import convert_batch
+from logic.conversion_logic import get_cached_converter, get_coefficients
+
+try:
+    import numpy as np
+except ImportError:     # NumPy es opcional
+    np = None
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+INLINE_THRESHOLD = 10_000       # Valores que se convierten en línea sin usar el ejecutor
+CHUNK_SIZE = 100_000            # Valores por bloque enviado al ejecutor
+MAX_PENDING_CHUNKS = 8          # Bloques en vuelo por ciclo de eventos (cola acotada)
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor: Executor | None = None
+_slots: WeakKeyDictionary = WeakKeyDictionary()     # Ciclo de eventos -> asyncio.Semaphore
+
+
+# ────────────────────── EJECUTOR COMPARTIDO ──────────────────────
+def get_executor() -> Executor:
+    """Devuelve el ejecutor compartido; por defecto, un grupo de hilos creado al primer uso."""
+    global _executor    # pylint: disable=global-statement
+    if _executor is None:
+        _executor = ThreadPoolExecutor(DEFAULT_WORKERS, thread_name_prefix="conversor")
+    return _executor
+
+def set_executor(executor: Executor | None) -> None:
+    """
+    Reemplaza el ejecutor compartido. El anterior no se cierra.
+
+    Args:
+        executor: Nuevo ejecutor (ej. `ProcessPoolExecutor`), o None para volver al
+            grupo de hilos por defecto en el siguiente uso.
+    """
+    global _executor    # pylint: disable=global-statement
+    _executor = executor
+
+def shutdown_executor() -> None:
+    """Cierra el ejecutor compartido, esperando a que terminen sus tareas."""
+    global _executor    # pylint: disable=global-statement
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+def _get_slots(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    """Devuelve los lugares de la cola de bloques en vuelo del ciclo de eventos."""
+    slots = _slots.get(loop)
+    if slots is None:
+        slots = _slots[loop] = asyncio.Semaphore(MAX_PENDING_CHUNKS)
+    return slots
+
+
+# ────────────────────── API ASÍNCRONA ──────────────────────
+async def aconvert(dimension: str, value: float, from_unit: str, to_unit: str) -> float:
+    """
+    Convierte un valor sin salir del ciclo de eventos (usa `get_cached_converter`).
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        value: Valor a convertir.
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+
+    Returns:
+        float: El valor convertido.
+
+    Raises:
+        ValueError: Si el sistema o alguna de las unidades no es válida.
+    """
+    return get_cached_converter(dimension, from_unit, to_unit)(value)
+
+def _join(chunks: list) -> Any:
+    """Une los resultados de los bloques en un solo objeto del tipo de la entrada."""
+    if np is not None and isinstance(chunks[0], np.ndarray):
+        return np.concatenate(chunks)
+    result = chunks[0]
+    for chunk in chunks[1:]:
+        result.extend(chunk)
+    return result
+
+async def aconvert_batch(
+    dimension: str,
+    values: Any,
+    from_unit: str,
+    to_unit: str,
+    *,
+    executor: Executor | None = None,
+    threshold: int = INLINE_THRESHOLD,
+    chunk_size: int = CHUNK_SIZE
+) -> Any:
+    """
+    Convierte un lote sin bloquear el ciclo de eventos. Hasta `threshold` valores se
+    convierte en línea; por encima, se divide en bloques de `chunk_size` que se envían
+    al ejecutor a medida que hay lugar en la cola acotada de bloques en vuelo.
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        values: Arreglo de NumPy, buffer `array.array` o lista de números.
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+        executor: Ejecutor a usar. Por defecto, el compartido (`get_executor`).
+        threshold: Valores a partir de los cuales se usa el ejecutor.
+        chunk_size: Valores por bloque enviado al ejecutor.
+
+    Returns:
+        El resultado del mismo tipo que la entrada (ver `batch_logic.convert_batch`).
+
+    Raises:
+        ValueError: Si el sistema o alguna de las unidades no es válida.
+        asyncio.CancelledError: Si se cancela la llamada; los bloques que no habían
+            empezado se cancelan.
+    """
+    get_coefficients(dimension, from_unit, to_unit)     # Valida antes de dividir el lote
+    if not hasattr(values, "__len__"):
+        values = list(values)
+    if len(values) <= threshold:
+        return convert_batch(dimension, values, from_unit, to_unit)
+
+    loop = asyncio.get_running_loop()
+    slots = _get_slots(loop)
+    executor = executor or get_executor()
+
+    def release(_):
+        try:
+            loop.call_soon_threadsafe(slots.release)
+        except RuntimeError:    # El ciclo de eventos ya se cerró
+            pass
+
+    pending = []
+    try:
+        for start in range(0, len(values), chunk_size):
+            await slots.acquire()
+            try:
+                job = executor.submit(
+                    convert_batch, dimension, values[start:start + chunk_size], from_unit,
+                    to_unit
+                )
+            except BaseException:
+                slots.release()
+                raise
+            job.add_done_callback(release)
+            pending.append(asyncio.wrap_future(job))
+        return _join(await asyncio.gather(*pending))
+    except asyncio.CancelledError:
+        for future in pending:
+            future.cancel()
+        raise
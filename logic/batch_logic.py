@@ -0,0 +1,169 @@
+"""
+batch_logic.py
+
+Conversión vectorizada de lotes de valores. Aplica los coeficientes precalculados
+de `conversion_logic` a arreglos de NumPy, buffers `array.array` o secuencias de
+Python con una sola operación por lote (multiplicación, más una suma en temperatura).
+
+NumPy es opcional: solo se importa en este módulo, por lo que la ruta escalar de
+`conversion_logic` no paga su costo de arranque. Sin NumPy se usa una ruta en
+Python puro con el mismo comportamiento.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from array import array
+from typing import Any, Iterable
+
+from logic.conversion_logic import ChainStep, get_chain_coefficients, get_coefficients
+
+try:
+    import numpy as np
+except ImportError:     # NumPy es opcional
+    np = None
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+FLOAT_TYPECODES = ("f", "d")    # Tipos de `array.array` que pueden guardar resultados
+
+
+# ────────────────────── FUNCIONES AUXILIARES ──────────────────────
+def _check_out_length(values: Any, out: Any) -> None:
+    """
+    Verifica que el buffer de salida tenga el mismo número de elementos que la entrada.
+
+    Raises:
+        ValueError: Si las longitudes no coinciden.
+    """
+    if len(out) != len(values):
+        raise ValueError(
+            f"El buffer de salida tiene {len(out)} elementos y la entrada {len(values)}."
+        )
+
+def _convert_numpy(values: Any, scale: float, offset: float, out: Any) -> Any:
+    """Aplica `valor * escala + desplazamiento` con operaciones vectorizadas de NumPy."""
+    result = np.multiply(values, scale, out=out)
+    if offset:
+        np.add(result, offset, out=result)
+    return result
+
+def _convert_array(values: array, scale: float, offset: float, out: array | None) -> array:
+    """
+    Convierte un buffer `array.array`. Con NumPy disponible se crean vistas sin copia
+    sobre los buffers de entrada y salida; sin NumPy se recorre en Python puro.
+    """
+    typecode = values.typecode if values.typecode in FLOAT_TYPECODES else "d"
+    if out is None:
+        out = array(typecode, bytes(len(values) * array(typecode).itemsize))
+    elif out.typecode not in FLOAT_TYPECODES:
+        raise ValueError(f"El buffer de salida debe ser de tipo flotante, no '{out.typecode}'.")
+    _check_out_length(values, out)
+
+    if np is not None:
+        _convert_numpy(
+            np.frombuffer(values, dtype=values.typecode),
+            scale,
+            offset,
+            np.frombuffer(out, dtype=out.typecode),
+        )
+        return out
+
+    if offset:
+        for i, value in enumerate(values):
+            out[i] = value * scale + offset
+    else:
+        for i, value in enumerate(values):
+            out[i] = value * scale
+    return out
+
+
+# ────────────────────── API DE LOTES ──────────────────────
+def _apply_batch(values: Iterable[float], scale: float, offset: float, out: Any) -> Any:
+    """
+    Aplica `valor * escala + desplazamiento` a un lote, eligiendo la ruta según el
+    tipo de la entrada (ver `convert_batch`).
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        if out is not None:
+            if not isinstance(out, np.ndarray) or out.dtype.kind != "f":
+                kind = getattr(out, "dtype", type(out).__name__)
+                raise ValueError(f"El buffer de salida debe ser de tipo flotante, no '{kind}'.")
+            _check_out_length(values, out)
+        return _convert_numpy(values, scale, offset, out)
+
+    if isinstance(values, array):
+        return _convert_array(values, scale, offset, out)
+
+    if out is None:
+        if offset:
+            return [value * scale + offset for value in values]
+        return [value * scale for value in values]
+
+    values = list(values)
+    _check_out_length(values, out)
+    if offset:
+        for i, value in enumerate(values):
+            out[i] = value * scale + offset
+    else:
+        for i, value in enumerate(values):
+            out[i] = value * scale
+    return out
+
+def convert_batch(
+    dimension: str,
+    values: Iterable[float],
+    from_unit: str,
+    to_unit: str,
+    out: Any = None
+) -> Any:
+    """
+    Convierte un lote completo de valores entre dos unidades de un mismo sistema.
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        values: Arreglo de NumPy, buffer `array.array` o secuencia de números.
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+        out: Buffer opcional donde escribir el resultado (arreglo de NumPy o
+            `array.array` flotante del mismo tamaño). Puede ser el mismo objeto que
+            `values` para convertir en el lugar sin reservar un segundo buffer.
+
+    Returns:
+        El resultado del mismo tipo que la entrada: `numpy.ndarray` para arreglos de
+        NumPy, `array.array` para buffers y `list` para cualquier otra secuencia.
+        Si se proporcionó `out`, se devuelve ese mismo objeto.
+
+    Raises:
+        ValueError: Si el sistema, alguna unidad o el buffer de salida no es válido.
+    """
+
+    scale, offset = get_coefficients(dimension, from_unit, to_unit)
+    return _apply_batch(values, scale, offset, out)
+
+def convert_chain_batch(
+    steps: Iterable[ChainStep],
+    values: Iterable[float],
+    out: Any = None
+) -> Any:
+    """
+    Aplica una cadena de conversiones completa a un lote con una sola pasada
+    (una multiplicación, más una suma si algún paso es afín).
+
+    Args:
+        steps: Pasos de la cadena en orden de aplicación (ver
+            `conversion_logic.get_chain_coefficients`).
+        values: Arreglo de NumPy, buffer `array.array` o secuencia de números.
+        out: Buffer opcional donde escribir el resultado (ver `convert_batch`).
+
+    Returns:
+        El resultado del mismo tipo que la entrada (ver `convert_batch`).
+
+    Raises:
+        ValueError: Si algún paso, la cadena o el buffer de salida no es válido.
+    """
+
+    scale, offset = get_chain_coefficients(steps)
+    return _apply_batch(values, scale, offset, out)
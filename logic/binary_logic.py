@@ -0,0 +1,205 @@
+"""
+binary_logic.py
+
+Conversión de archivos binarios con arreglos de float32/float64 (por ejemplo, volcados
+crudos de instrumentos) sin convertir cada valor a un `float` de Python. El archivo de
+entrada se mapea en memoria y se ve como arreglo sin copiarlo; el de salida también se
+mapea en memoria y recibe los valores convertidos con los coeficientes precalculados
+de `conversion_logic` (una multiplicación, más una suma en temperatura).
+
+El tipo, el orden de bytes, el desplazamiento inicial y el paso entre valores son
+configurables, de modo que se puede extraer un canal de registros intercalados. La
+salida siempre es un arreglo contiguo.
+
+NumPy es opcional: con NumPy la entrada y la salida se ven como `ndarray` sobre los
+mapas de memoria (sin copias) y la conversión, el cambio de orden de bytes y de tipo
+se hacen con operaciones vectorizadas. Sin NumPy se procesa por bloques con
+`memoryview` y `array.array`. Ambas rutas calculan en float64 y dan el mismo resultado.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from array import array
+import mmap
+import os
+import sys
+
+from logic.conversion_logic import get_coefficients
+
+try:
+    import numpy as np
+except ImportError:     # NumPy es opcional
+    np = None
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+DTYPES = {"float32": "f", "float64": "d"}                   # Tipo -> código de `array`
+BYTEORDERS = {"little": "<", "big": ">", "native": "="}     # Orden -> prefijo de NumPy
+CHUNK_VALUES = 1 << 16          # Valores por bloque en la ruta sin NumPy
+NUMPY_CHUNK_VALUES = 1 << 20    # Valores por bloque (buffer float64 de 8 MiB) con NumPy
+
+
+# ────────────────────── FUNCIONES AUXILIARES ──────────────────────
+def _check_option(value: str, options: dict, name: str) -> None:
+    """
+    Verifica que una opción sea una de las admitidas.
+
+    Raises:
+        ValueError: Si la opción no existe.
+    """
+    if value not in options:
+        raise ValueError(f"{name} invalido: '{value}'. Opciones: {', '.join(options)}.")
+
+def _needs_swap(byteorder: str) -> bool:
+    """Indica si el orden de bytes difiere del de la máquina."""
+    return byteorder != "native" and byteorder != sys.byteorder
+
+def count_values(size: int, itemsize: int, stride: int, offset: int) -> int:
+    """
+    Calcula cuántos valores completos caben en un archivo.
+
+    Args:
+        size: Tamaño del archivo en bytes.
+        itemsize: Bytes de cada valor.
+        stride: Bytes entre el inicio de un valor y el del siguiente.
+        offset: Bytes que se saltan antes del primer valor.
+
+    Returns:
+        int: Número de valores.
+    """
+    if size - offset < itemsize:
+        return 0
+    return (size - offset - itemsize) // stride + 1
+
+def _convert_numpy(source, destination, count, dtype, out_dtype, stride, offset, coefficients):
+    """
+    Convierte con vistas de NumPy sobre los mapas de memoria. Cada bloque se calcula
+    en un buffer float64 reutilizado, igual que la ruta escalar, y se redondea una sola
+    vez al tipo y orden de bytes de salida.
+    """
+    scale, shift = coefficients
+    values = np.ndarray((count,), dtype=dtype, buffer=source, offset=offset, strides=(stride,))
+    out = np.ndarray((count,), dtype=out_dtype, buffer=destination)
+    buffer = np.empty(min(count, NUMPY_CHUNK_VALUES))
+    for first in range(0, count, NUMPY_CHUNK_VALUES):
+        last = min(first + NUMPY_CHUNK_VALUES, count)
+        chunk = buffer[:last - first]
+        np.multiply(values[first:last], scale, out=chunk, dtype=np.float64)
+        if shift:
+            np.add(chunk, shift, out=chunk)
+        out[first:last] = chunk
+
+def _convert_chunks(source, destination, count, codes, swap, stride, offset, coefficients):
+    """
+    Convierte por bloques de `CHUNK_VALUES` valores con `memoryview` y `array.array`.
+    Los valores de cada bloque se reúnen con cortes con paso (uno por byte del valor),
+    que se copian en C; solo la multiplicación pasa por `float` de Python.
+    """
+    code, out_code = codes
+    scale, shift = coefficients
+    itemsize, out_itemsize = array(code).itemsize, array(out_code).itemsize
+    view = memoryview(source)
+    for first in range(0, count, CHUNK_VALUES):
+        n = min(CHUNK_VALUES, count - first)
+        start = offset + first * stride
+        if stride == itemsize:
+            packed = view[start:start + n * itemsize]
+        else:
+            records = view[start:start + (n - 1) * stride + itemsize]
+            packed = bytearray(n * itemsize)
+            for byte in range(itemsize):
+                packed[byte::itemsize] = records[byte::stride]
+
+        values = array(code)
+        values.frombytes(packed)
+        if swap:
+            values.byteswap()
+        result = array(out_code, [value * scale + shift for value in values] if shift
+                       else [value * scale for value in values])
+        if swap:
+            result.byteswap()
+        destination[first * out_itemsize:(first + n) * out_itemsize] = result.tobytes()
+
+
+# ────────────────────── CONVERSIÓN DE ARCHIVOS ──────────────────────
+def convert_binary_file(
+    input_path: str,
+    output_path: str,
+    dimension: str,
+    from_unit: str,
+    to_unit: str,
+    *,
+    dtype: str = "float64",
+    byteorder: str = "little",
+    out_dtype: str | None = None,
+    stride: int | None = None,
+    offset: int = 0,
+) -> int:
+    """
+    Convierte un archivo binario de valores flotantes y escribe los resultados en otro.
+
+    Args:
+        input_path: Archivo de entrada.
+        output_path: Archivo de salida (se crea o se reemplaza). Debe ser distinto de
+            la entrada.
+        dimension: Sistema de conversión ('pressure', 'temperature', ...).
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+        dtype: Tipo de los valores de entrada: 'float32' o 'float64'.
+        byteorder: Orden de bytes de entrada y salida: 'little', 'big' o 'native'.
+        out_dtype: Tipo de los valores de salida. Por defecto, el de la entrada.
+        stride: Bytes entre valores consecutivos de la entrada. Por defecto, el tamaño
+            del valor (arreglo contiguo); mayor para leer un canal de registros.
+        offset: Bytes que se saltan al inicio de la entrada (encabezado o posición
+            del canal dentro del registro).
+
+    Returns:
+        int: Número de valores convertidos.
+
+    Raises:
+        ValueError: Si el sistema, las unidades o el formato no son válidos.
+        OSError: Si no se puede leer la entrada o escribir la salida.
+    """
+    out_dtype = out_dtype or dtype
+    _check_option(dtype, DTYPES, "Tipo")
+    _check_option(out_dtype, DTYPES, "Tipo")
+    _check_option(byteorder, BYTEORDERS, "Orden de bytes")
+    coefficients = get_coefficients(dimension, from_unit, to_unit)
+
+    itemsize = array(DTYPES[dtype]).itemsize
+    stride = stride or itemsize
+    if stride < itemsize or offset < 0:
+        raise ValueError(f"El paso debe ser al menos {itemsize} bytes y el desplazamiento >= 0.")
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        raise ValueError("El archivo de salida debe ser distinto del de entrada.")
+
+    with open(input_path, "rb") as source_file:
+        size = os.fstat(source_file.fileno()).st_size
+        count = count_values(size, itemsize, stride, offset)
+        if stride == itemsize and size > offset and (size - offset) % itemsize:
+            raise ValueError(
+                f"El tamaño de los datos ({size - offset} bytes) no es múltiplo de {itemsize}."
+            )
+        out_size = count * array(DTYPES[out_dtype]).itemsize
+        with open(output_path, "w+b") as destination_file:
+            destination_file.truncate(out_size)
+            if not count:
+                return 0
+            with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as source, \
+                    mmap.mmap(destination_file.fileno(), out_size) as destination:
+                if np is not None:
+                    prefix = BYTEORDERS[byteorder]
+                    _convert_numpy(
+                        source, destination, count, np.dtype(prefix + DTYPES[dtype]),
+                        np.dtype(prefix + DTYPES[out_dtype]), stride, offset, coefficients
+                    )
+                else:
+                    _convert_chunks(
+                        source, destination, count, (DTYPES[dtype], DTYPES[out_dtype]),
+                        _needs_swap(byteorder), stride, offset, coefficients
+                    )
+                destination.flush()
+    return count
@@ -0,0 +1,279 @@
+"""
+compound_logic.py
+
+Motor de unidades compuestas con análisis dimensional. Cada unidad del catálogo se
+reduce a un vector de exponentes sobre las dimensiones base (longitud, masa, tiempo,
+temperatura, datos y ángulo) y a una escala exacta hacia el SI. Las expresiones
+compuestas como 'N·m', 'kg/m³', 'MB/s' o 'kWh/día' se analizan una sola vez, se
+reducen a (vector, escala) y se guardan en caché; dos unidades con el mismo vector se
+convierten con un único factor precalculado, sin importar el sistema al que pertenezcan.
+
+Las funciones `convert_*` de `conversion_logic` se mantienen por compatibilidad;
+`convert` es la ruta genérica para cualquier par de unidades compatibles.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from fractions import Fraction
+from functools import lru_cache
+import re
+import unicodedata
+from typing import NamedTuple
+
+from logic.conversion_logic import get_coefficients
+from logic.unit_catalog import CATALOG, SYMBOL_INDEX, TEMPERATURE
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+# Dimensiones base: longitud, masa, tiempo, temperatura, datos y ángulo
+BASE_DIMENSIONS = ("L", "M", "T", "Θ", "D", "A")
+CACHE_SIZE = 4096   # Expresiones y pares de unidades guardados en caché
+
+Vector = tuple[int, ...]
+
+def _vector(
+    length: int = 0,
+    mass: int = 0,
+    time: int = 0,
+    temperature: int = 0,
+    data: int = 0,
+    angle: int = 0
+) -> Vector:
+    """Construye un vector de exponentes en el orden de `BASE_DIMENSIONS`."""
+    return (length, mass, time, temperature, data, angle)
+
+# Vector de cada sistema del catálogo y factor de su unidad base hacia el SI
+# (metro, kilogramo, segundo, kelvin, bit y grado)
+DIMENSION_VECTORS = {
+    "temperature": (_vector(temperature=1), Fraction(1)),
+    "length": (_vector(length=1), Fraction(1)),
+    "mass": (_vector(mass=1), Fraction(1, 1000)),
+    "volume": (_vector(length=3), Fraction(1, 10**6)),
+    "energy": (_vector(mass=1, length=2, time=-2), Fraction(1)),
+    "area": (_vector(length=2), Fraction(1, 10**6)),
+    "speed": (_vector(length=1, time=-1), Fraction(1, 100)),
+    "time": (_vector(time=1), Fraction(1, 10**6)),
+    "power": (_vector(mass=1, length=2, time=-3), Fraction(1)),
+    "angle": (_vector(angle=1), Fraction(1)),
+    "pressure": (_vector(mass=1, length=-1, time=-2), Fraction(101325)),
+    "data": (_vector(data=1), Fraction(1)),
+}
+
+# Unidades derivadas del SI que no están en el catálogo como unidades propias
+DERIVED_SYMBOLS = {
+    "N": (_vector(mass=1, length=1, time=-2), Fraction(1), None),
+    "Hz": (_vector(time=-1), Fraction(1), None),
+}
+
+SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻", "0123456789-")
+EXPONENT_PATTERN = re.compile(
+    r"^(.*?)(?:\^\(?(-?\d+)\)?|(⁻?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)|(?<=[a-zA-Z])(\d+))$"
+)
+PRODUCT_PATTERN = re.compile(r"\s*[·⋅*]\s*")
+
+
+# ────────────────────── ESTRUCTURAS ──────────────────────
+class CompoundUnit(NamedTuple):
+    """
+    Unidad reducida a dimensiones base.
+
+    Attributes:
+        vector (tuple[int, ...]): Exponente de cada dimensión de `BASE_DIMENSIONS`.
+        scale (Fraction): Factor exacto hacia la combinación de unidades SI base.
+        temperature (str | None): Nombre lógico de la unidad si la expresión es una
+            temperatura sola ('celsius', ...), que se convierte de forma afín.
+    """
+
+    vector: Vector
+    scale: Fraction
+    temperature: str | None = None
+
+
+# ────────────────────── ÍNDICE DE UNIDADES ──────────────────────
+def _exact(value) -> Fraction:
+    """Convierte un factor del catálogo a `Fraction` por su representación decimal."""
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+def _build_unit_index() -> dict[str, tuple[Vector, Fraction, str | None]]:
+    """
+    Indexa cada unidad del catálogo por su nombre lógico y sus alias (en minúsculas,
+    gana el primer sistema que declara un alias).
+    """
+    index = {}
+    for dimension in CATALOG:
+        vector, base_scale = DIMENSION_VECTORS[dimension.key]
+        for unit in dimension.units:
+            temperature = unit.name if dimension is TEMPERATURE else None
+            entry = (vector, _exact(unit.factor) * base_scale, temperature)
+            for alias in (unit.name, *unit.aliases):
+                index.setdefault(alias.casefold(), entry)
+    return index
+
+UNIT_INDEX = _build_unit_index()
+
+# Símbolos que distinguen mayúsculas (bit/byte del catálogo y unidades derivadas).
+# Se buscan antes que los alias del catálogo, que no distinguen mayúsculas.
+SYMBOLS = {
+    **{symbol: UNIT_INDEX[unit] for symbol, (_, unit) in SYMBOL_INDEX.items()},
+    **DERIVED_SYMBOLS,
+}
+
+
+# ────────────────────── ANÁLISIS DE EXPRESIONES ──────────────────────
+def _strip_accents(text: str) -> str:
+    """Quita los acentos de una cadena ('día' -> 'dia')."""
+    return "".join(
+        char for char in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(char)
+    )
+
+def _lookup(symbol: str) -> tuple[Vector, Fraction, str | None] | None:
+    """Busca un símbolo entre los símbolos exactos y los alias del catálogo."""
+    entry = SYMBOLS.get(symbol) or UNIT_INDEX.get(symbol.casefold())
+    if entry is None:
+        entry = UNIT_INDEX.get(_strip_accents(symbol).casefold())
+    return entry
+
+def _parse_factor(token: str) -> tuple[Vector, Fraction, str | None]:
+    """
+    Analiza un factor de una expresión, con exponente opcional ('m³', 's^-2', 'm2').
+
+    Raises:
+        ValueError: Si el símbolo no es una unidad conocida.
+    """
+    entry = _lookup(token)
+    exponent = 1
+    if entry is None:
+        match = EXPONENT_PATTERN.match(token)
+        if match and match.group(1):
+            power = match.group(2) or match.group(3) or match.group(4)
+            exponent = int(power.translate(SUPERSCRIPTS))
+            entry = _lookup(match.group(1))
+    if entry is None:
+        raise ValueError(f"Unidad invalida: '{token}'.")
+    if exponent == 1:
+        return entry
+    vector, scale, _ = entry
+    return tuple(power * exponent for power in vector), scale ** exponent, None
+
+def _parse_product(token: str) -> list[tuple[Vector, Fraction, str | None]]:
+    """
+    Analiza un término entre separadores explícitos. Si no es una unidad conocida
+    (los alias de varias palabras como 'metros por segundo' se buscan completos) y
+    contiene espacios, cada palabra se toma como un factor: 'kg m' es 'kg·m'.
+
+    Raises:
+        ValueError: Si algún factor no es una unidad conocida.
+    """
+    try:
+        return [_parse_factor(token)]
+    except ValueError:
+        words = token.split()
+        if len(words) < 2:
+            raise
+    return [_parse_factor(word) for word in words]
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_unit(expression: str) -> CompoundUnit:
+    """
+    Reduce una expresión de unidades a su vector dimensional y su escala SI.
+    Acepta productos con '·', '⋅', '*' o espacios ('m s^-1'), cocientes con '/' (todo
+    lo que sigue a cada '/' va al denominador) y exponentes como 'm³', 'm^3' o 's^-2'.
+    El resultado se guarda en caché, por lo que cada expresión se analiza una sola vez.
+
+    Args:
+        expression: Expresión de la unidad (ej. 'kg/m³', 'N·m', 'MB/s', 'kWh/día').
+
+    Returns:
+        CompoundUnit: Vector dimensional, escala exacta y, si la expresión es una
+        temperatura sola, el nombre de su unidad.
+
+    Raises:
+        ValueError: Si la expresión está vacía o contiene unidades desconocidas.
+    """
+    expression = expression.strip()
+    if not expression:
+        raise ValueError("Unidad invalida: ''.")
+
+    entry = _lookup(expression)   # Alias completos como 'km/h' o 'metros por segundo'
+    if entry is not None:
+        return CompoundUnit(*entry)
+
+    vector, scale = [0] * len(BASE_DIMENSIONS), Fraction(1)
+    for position, group in enumerate(expression.split("/")):
+        sign = 1 if position == 0 else -1
+        for token in PRODUCT_PATTERN.split(group.strip()):
+            for factor_vector, factor_scale, _ in _parse_product(token):
+                vector = [total + sign * power for total, power in zip(vector, factor_vector)]
+                scale *= factor_scale ** sign
+    return CompoundUnit(tuple(vector), scale)
+
+def format_vector(vector: Vector) -> str:
+    """
+    Devuelve la representación legible de un vector dimensional (ej. 'L·T^-1').
+
+    Args:
+        vector: Exponentes sobre `BASE_DIMENSIONS`.
+
+    Returns:
+        str: Dimensiones con exponente distinto de cero, o '1' si es adimensional.
+    """
+    parts = [
+        name if power == 1 else f"{name}^{power}"
+        for name, power in zip(BASE_DIMENSIONS, vector) if power
+    ]
+    return "·".join(parts) or "1"
+
+
+# ────────────────────── CONVERSIÓN GENÉRICA ──────────────────────
+@lru_cache(maxsize=CACHE_SIZE)
+def get_conversion(from_unit: str, to_unit: str) -> tuple[float, float]:
+    """
+    Obtiene los coeficientes para convertir entre dos expresiones de unidades
+    compatibles: `destino = valor * escala + desplazamiento`. La escala se calcula de
+    forma exacta y se redondea a float una sola vez; el par queda en caché.
+
+    Args:
+        from_unit: Expresión de la unidad de origen.
+        to_unit: Expresión de la unidad de destino.
+
+    Returns:
+        tuple[float, float]: (escala, desplazamiento). El desplazamiento solo es
+        distinto de cero entre dos temperaturas.
+
+    Raises:
+        ValueError: Si alguna expresión no es válida o sus dimensiones no coinciden.
+    """
+    source, target = parse_unit(from_unit), parse_unit(to_unit)
+    if source.vector != target.vector:
+        raise ValueError(
+            f"Unidades incompatibles: '{from_unit}' ({format_vector(source.vector)}) "
+            f"y '{to_unit}' ({format_vector(target.vector)})."
+        )
+    if source.temperature and target.temperature:
+        return get_coefficients(TEMPERATURE.key, source.temperature, target.temperature)
+    return float(source.scale / target.scale), 0.0
+
+def convert(value: float, from_unit: str, to_unit: str) -> float:
+    """
+    Convierte un valor entre dos unidades compatibles cualesquiera, simples o
+    compuestas, con un único factor precalculado.
+
+    Args:
+        value: Valor numérico a convertir.
+        from_unit: Expresión de la unidad de origen (ej. 'kWh/día').
+        to_unit: Expresión de la unidad de destino (ej. 'W').
+
+    Returns:
+        Valor convertido como float.
+
+    Raises:
+        ValueError: Si alguna expresión no es válida o sus dimensiones no coinciden.
+    """
+    scale, offset = get_conversion(from_unit, to_unit)
+    return value * scale + offset
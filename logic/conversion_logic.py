@@ -2,7 +2,8 @@
 conversion_logic.py
 
 Contiene funciones para convertir valores entre diferentes unidades de medida.
-Realiza los cálculos necesarios para convertir entre diferentes sistemas de conversión
+Realiza los cálculos necesarios para convertir entre diferentes sistemas de conversión.
+Solo depende de la biblioteca estándar para que importarlo sea rápido.
 
 Autor: Alejandro Cortés
 Versión: 1.0
@@ -10,18 +11,219 @@ Versión: 1.0
 
 
 # ────────────────────── IMPORTACIONES ──────────────────────
-from math import pi
-
-from colorama import Fore, Style, init
+from fractions import Fraction
+from functools import lru_cache
+from collections.abc import Callable, Iterable
+
+from logic.precision_logic import PRECISE_BACKENDS, convert_precise, get_precise_coefficients
+from logic.unit_catalog import (
+    Dimension,
+    TEMPERATURE,
+    LENGTH,
+    MASS,
+    VOLUME,
+    ENERGY,
+    AREA,
+    SPEED,
+    TIME,
+    POWER,
+    ANGLE,
+    PRESSURE,
+    DATA,
+)
 
 
 # ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
-init(autoreset=True)    # Inicializa Colorama con autoreset en cada impresión
-BOLD = Style.BRIGHT     # Atajo para aplicar estilo de negritas
+BACKENDS = ("float", *PRECISE_BACKENDS)    # Backends numéricos de las funciones convert_*
+CONVERTER_CACHE_SIZE = 1024     # Conversores especializados que guarda `get_cached_converter`
+
+
+# ────────────────────── TABLAS DE FACTORES ──────────────────────
+# Las tablas se construyen una sola vez al importar el módulo a partir de `unit_catalog`.
+# Cada tabla TO_* guarda el factor de cada unidad hacia la unidad base de su sistema y su
+# par FROM_* el factor inverso.
+def _factor_table(dimension: Dimension) -> dict[str, float]:
+    """Devuelve la tabla {unidad: factor hacia la base} de un sistema del catálogo."""
+    return {unit.name: float(unit.factor) for unit in dimension.units}
+
+def _invert_factors(to_base: dict[str, float]) -> dict[str, float]:
+    """Devuelve la tabla inversa {unidad: 1 / factor} de una tabla de factores."""
+    return {unit: 1 / factor for unit, factor in to_base.items()}
+
+TO_CELSIUS = {
+    "celsius": lambda x: x,
+    "kelvin": lambda x: x - 273.15,
+    "fahrenheit": lambda x: (x - 32) * 5 / 9
+}
+FROM_CELSIUS = {
+    "celsius": lambda x: x,
+    "kelvin": lambda x: x + 273.15,
+    "fahrenheit": lambda x: x * 9 / 5 + 32
+}
+
+TO_METERS = _factor_table(LENGTH)
+FROM_METERS = _invert_factors(TO_METERS)
+
+TO_GRAMS = _factor_table(MASS)
+FROM_GRAMS = _invert_factors(TO_GRAMS)
+
+TO_MILLILITERS = _factor_table(VOLUME)
+FROM_MILLILITERS = _invert_factors(TO_MILLILITERS)
+
+TO_JOULES = _factor_table(ENERGY)
+FROM_JOULES = _invert_factors(TO_JOULES)
+
+TO_SQUARE_MILLIMETERS = _factor_table(AREA)
+FROM_SQUARE_MILLIMETERS = _invert_factors(TO_SQUARE_MILLIMETERS)
+
+TO_CM_PER_SECOND = _factor_table(SPEED)
+FROM_CM_PER_SECOND = _invert_factors(TO_CM_PER_SECOND)
+
+TO_MICROSECONDS = _factor_table(TIME)
+FROM_MICROSECONDS = _invert_factors(TO_MICROSECONDS)
+
+TO_WATTS = _factor_table(POWER)
+FROM_WATTS = _invert_factors(TO_WATTS)
+
+TO_GRADES = _factor_table(ANGLE)
+FROM_GRADES = _invert_factors(TO_GRADES)
+
+TO_ATMOSPHERES = _factor_table(PRESSURE)
+FROM_ATMOSPHERES = _invert_factors(TO_ATMOSPHERES)
+
+TO_BITS = _factor_table(DATA)
+FROM_BITS = _invert_factors(TO_BITS)
+
+# Registro de unidades: sistema -> (tabla hacia la base, tabla desde la base)
+UNIT_REGISTRY = {
+    TEMPERATURE.key: (TO_CELSIUS, FROM_CELSIUS),
+    LENGTH.key: (TO_METERS, FROM_METERS),
+    MASS.key: (TO_GRAMS, FROM_GRAMS),
+    VOLUME.key: (TO_MILLILITERS, FROM_MILLILITERS),
+    ENERGY.key: (TO_JOULES, FROM_JOULES),
+    AREA.key: (TO_SQUARE_MILLIMETERS, FROM_SQUARE_MILLIMETERS),
+    SPEED.key: (TO_CM_PER_SECOND, FROM_CM_PER_SECOND),
+    TIME.key: (TO_MICROSECONDS, FROM_MICROSECONDS),
+    POWER.key: (TO_WATTS, FROM_WATTS),
+    ANGLE.key: (TO_GRADES, FROM_GRADES),
+    PRESSURE.key: (TO_ATMOSPHERES, FROM_ATMOSPHERES),
+    DATA.key: (TO_BITS, FROM_BITS),
+}
+
+
+# ────────────────────── MATRICES DE FACTORES POR PARES ──────────────────────
+# Para cada sistema se precalcula una matriz N×N con el factor directo entre cada par de
+# unidades, indexada por la posición de cada unidad en su tabla. Así una conversión lineal
+# se reduce a una sola multiplicación. La temperatura es afín, por lo que además guarda
+# una matriz de desplazamientos.
+def _build_factor_matrix(
+    to_base: dict[str, float],
+    from_base: dict[str, float]
+) -> tuple[dict[str, int], tuple[tuple[float, ...], ...]]:
+    """
+    Construye el índice de unidades y la matriz de factores directos de un sistema.
+
+    Args:
+        to_base: Tabla de factores de cada unidad hacia la unidad base.
+        from_base: Tabla de factores desde la unidad base hacia cada unidad.
+
+    Returns:
+        tuple: ({unidad: posición}, matriz[origen][destino] con el factor directo).
+    """
+    index = {unit: i for i, unit in enumerate(to_base)}
+    matrix = tuple(
+        tuple(to_base[from_unit] * from_base[to_unit] for to_unit in to_base)
+        for from_unit in to_base
+    )
+    return index, matrix
+
+def _build_affine_matrices(
+    affine: dict[str, tuple[Fraction, Fraction]]
+) -> tuple[dict[str, int], tuple[tuple[float, ...], ...], tuple[tuple[float, ...], ...]]:
+    """
+    Construye el índice de unidades y las matrices de escala y desplazamiento de un
+    sistema afín, de forma que `destino = valor * escala + desplazamiento`. Los
+    coeficientes se combinan de forma exacta y se redondean a float una sola vez.
+
+    Args:
+        affine: Tabla {unidad: (escala, desplazamiento)} exacta hacia la unidad base.
+
+    Returns:
+        tuple: ({unidad: posición}, matriz de escalas, matriz de desplazamientos).
+    """
+    index = {unit: i for i, unit in enumerate(affine)}
+    scales = tuple(
+        tuple(float(affine[from_unit][0] / affine[to_unit][0]) for to_unit in affine)
+        for from_unit in affine
+    )
+    offsets = tuple(
+        tuple(
+            float((affine[from_unit][1] - affine[to_unit][1]) / affine[to_unit][0])
+            for to_unit in affine
+        )
+        for from_unit in affine
+    )
+    return index, scales, offsets
+
+# Coeficientes (escala, desplazamiento) de cada unidad hacia Celsius:
+# celsius = valor * escala + desplazamiento
+CELSIUS_AFFINE = {unit.name: (unit.factor, unit.offset) for unit in TEMPERATURE.units}
+
+TEMPERATURE_INDEX, TEMPERATURE_MATRIX, TEMPERATURE_OFFSETS = _build_affine_matrices(CELSIUS_AFFINE)
+LENGTH_INDEX, LENGTH_MATRIX = _build_factor_matrix(TO_METERS, FROM_METERS)
+MASS_INDEX, MASS_MATRIX = _build_factor_matrix(TO_GRAMS, FROM_GRAMS)
+VOLUME_INDEX, VOLUME_MATRIX = _build_factor_matrix(TO_MILLILITERS, FROM_MILLILITERS)
+ENERGY_INDEX, ENERGY_MATRIX = _build_factor_matrix(TO_JOULES, FROM_JOULES)
+AREA_INDEX, AREA_MATRIX = _build_factor_matrix(TO_SQUARE_MILLIMETERS, FROM_SQUARE_MILLIMETERS)
+SPEED_INDEX, SPEED_MATRIX = _build_factor_matrix(TO_CM_PER_SECOND, FROM_CM_PER_SECOND)
+TIME_INDEX, TIME_MATRIX = _build_factor_matrix(TO_MICROSECONDS, FROM_MICROSECONDS)
+POWER_INDEX, POWER_MATRIX = _build_factor_matrix(TO_WATTS, FROM_WATTS)
+ANGLE_INDEX, ANGLE_MATRIX = _build_factor_matrix(TO_GRADES, FROM_GRADES)
+PRESSURE_INDEX, PRESSURE_MATRIX = _build_factor_matrix(TO_ATMOSPHERES, FROM_ATMOSPHERES)
+DATA_INDEX, DATA_MATRIX = _build_factor_matrix(TO_BITS, FROM_BITS)
+
+# Acceso por nombre de sistema a los índices y matrices anteriores
+UNIT_INDEX = {
+    "temperature": TEMPERATURE_INDEX,
+    "length": LENGTH_INDEX,
+    "mass": MASS_INDEX,
+    "volume": VOLUME_INDEX,
+    "energy": ENERGY_INDEX,
+    "area": AREA_INDEX,
+    "speed": SPEED_INDEX,
+    "time": TIME_INDEX,
+    "power": POWER_INDEX,
+    "angle": ANGLE_INDEX,
+    "pressure": PRESSURE_INDEX,
+    "data": DATA_INDEX,
+}
+FACTOR_MATRIX = {
+    "temperature": TEMPERATURE_MATRIX,
+    "length": LENGTH_MATRIX,
+    "mass": MASS_MATRIX,
+    "volume": VOLUME_MATRIX,
+    "energy": ENERGY_MATRIX,
+    "area": AREA_MATRIX,
+    "speed": SPEED_MATRIX,
+    "time": TIME_MATRIX,
+    "power": POWER_MATRIX,
+    "angle": ANGLE_MATRIX,
+    "pressure": PRESSURE_MATRIX,
+    "data": DATA_MATRIX,
+}
+OFFSET_MATRIX = {
+    "temperature": TEMPERATURE_OFFSETS,
+}
 
 
 # ────────────────────── FUNCIONES DE CONVERSIÓN ──────────────────────
-def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
+def convert_temperature(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de temperatura entre Celsius, Kelvin y Fahrenheit.
 
@@ -29,32 +231,31 @@ def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
         value:  El valor numérico a convertir.
         from_unit: Unidad de origen ('celsius', 'kelvin', 'fahrenheit').
         to_unit: Unidad de destino ('celsius', 'kelvin', 'fahrenheit').
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si las unidades proporcionadas no son válidas.
     """
 
-    to_celsius = {
-        "celsius": lambda x:x,
-        "kelvin": lambda x: x - 273.15,
-        "fahrenheit": lambda x: (x - 32) * 5 / 9
-    }
-    from_celsius = {
-        "celsius": lambda x: x,
-        "kelvin": lambda x: x + 273.15,
-        "fahrenheit": lambda x: x * 9 / 5 + 32
-    }
+    if backend != "float":
+        return convert_precise(TEMPERATURE.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_celsius = to_celsius[from_unit](value)
-        return from_celsius[to_unit](value_in_celsius)
+        i, j = TEMPERATURE_INDEX[from_unit], TEMPERATURE_INDEX[to_unit]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad inválida: {e}.{Style.RESET_ALL}") from e
-
-def convert_length(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad inválida: {e}.") from e
+    return value * TEMPERATURE_MATRIX[i][j] + TEMPERATURE_OFFSETS[i][j]
+
+def convert_length(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de longitud entre diversas unidades métricas, imperiales y astronómicas.
     
@@ -66,40 +267,30 @@ def convert_length(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen.
         to_unit: Unidad de destino.
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si las unidades proporcionadas no son válidas.
     """
 
-    to_meters = {
-        "angstroms": 1e-10,
-        "nanometros": 1e-9,
-        "micrones": 1e-6,
-        "milimetros": 1e-3,
-        "centimetros": 1e-2,
-        "metros": 1.0,
-        "kilometros": 1e3,
-        "pulgadas": 0.0254,
-        "pies": 0.3048,
-        "yardas": 0.9144,
-        "millas": 1609.344,
-        "millas_nauticas": 1852,
-        "unidad_astronomica": 1.495978707e11,
-        "anio_luz": 9.461e15,
-        "parsec": 3.086e16
-    }
-    from_meters = {unit: 1 / factor for unit, factor in to_meters.items()}
+    if backend != "float":
+        return convert_precise(LENGTH.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_meters = value * to_meters[from_unit]
-        return value_in_meters * from_meters[to_unit]
+        return value * LENGTH_MATRIX[LENGTH_INDEX[from_unit]][LENGTH_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_mass(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_mass(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de masa entre diversas unidades.
 
@@ -111,39 +302,30 @@ def convert_mass(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen.
         to_unit: Unidad de destino.
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si las unidades proporcionadas no son válidas.
     """
 
-    to_grams = {
-        "miligramos": 1e-3,
-        "centigramos": 1e-2,
-        "decigramos": 1e-1,
-        "quilates": 0.2,
-        "gramos": 1.0,
-        "decagramos": 1e1,
-        "hectogramos": 1e2,
-        "kilogramos": 1e3,
-        "toneladas_metricas": 1e6,
-        "onzas": 28.3495,
-        "libras": 453.592,
-        "piedra": 6350.29,
-        "toneladas_cortas_eeuu": 907185,
-        "toneladas_largas_uk": 10160000
-    }
-    from_grams = {unit: 1 / factor for unit, factor in to_grams.items()}
+    if backend != "float":
+        return convert_precise(MASS.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_grams = value * to_grams[from_unit]
-        return value_in_grams * from_grams[to_unit]
+        return value * MASS_MATRIX[MASS_INDEX[from_unit]][MASS_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_volume(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_volume(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de volumen entre diversas unidades.
 
@@ -156,45 +338,30 @@ def convert_volume(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen.
         to_unit: Unidad de destino.
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si las unidades proporcionadas no son válidas.
     """
 
-    to_milliliters= {
-        "mililitros" : 1.0,
-        "centimetros_cubicos" : 1.0,
-        "litros" : 1e3,
-        "metros_cubicos" : 1e6,
-        "cucharaditas_us" : 4.92892,
-        "cucharadas_us" : 14.7868,
-        "onzas_liquidas_us" : 29.5735,
-        "tazas_us" : 236.588,
-        "pintas_us" : 473.176,
-        "cuartos_de_galon_us" : 946.353,
-        "galones_us" : 3785.41,
-        "pulgadas_cubicas" : 16.3871,
-        "pies_cubicos" : 28316.8,
-        "yardas_cubicas" : 764555,
-        "cucharaditas_uk" : 5.91939,
-        "cucharadas_uk" : 17.7582,
-        "onzas_liquidas_uk" : 28.4131,
-        "pintas_uk" : 568.261,
-        "cuartos_de_galon_uk" : 1136.52,
-        "galones_uk" : 4546.09,
-    }
-    from_milliliters = {unit: 1 / factor for unit, factor in to_milliliters.items()}
+    if backend != "float":
+        return convert_precise(VOLUME.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_milliliters = value * to_milliliters[from_unit]
-        return value_in_milliliters * from_milliliters[to_unit]
+        return value * VOLUME_MATRIX[VOLUME_INDEX[from_unit]][VOLUME_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_energy(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_energy(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de energía entre diferentes unidades.
     
@@ -205,32 +372,30 @@ def convert_energy(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_joules = {
-        "joules": 1.0,
-        "kilojulios": 1000,
-        "calorias_termales": 4.184,
-        "calorias_alimentos": 4184,
-        "pie_libras": 1.35582,
-        "unidades_termicas_britanicas": 1055.06,
-        "kilovatio_horas": 3.6e6
-    }
-    from_joules = {unit: 1 / factor for unit, factor in to_joules.items()}
+    if backend != "float":
+        return convert_precise(ENERGY.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_joules = value * to_joules[from_unit]
-        return value_in_joules * from_joules[to_unit]
+        return value * ENERGY_MATRIX[ENERGY_INDEX[from_unit]][ENERGY_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_area(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_area(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de área entre diferentes unidades.
 
@@ -240,35 +405,30 @@ def convert_area(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_square_millimeters = {
-        "milimetros_cuadrados": 1.0,
-        "centimetros_cuadrados": 100,
-        "metros_cuadrados": 1e6,
-        "hectareas": 1e10,
-        "kilometros_cuadrados": 1e12,
-        "pulgadas_cuadradas": 645.16,
-        "pies_cuadrados": 92903,
-        "yardas_cuadradas": 836127,
-        "acres": 4046856422.4,
-        "millas_cuadradas": 2589988110336,
-    }
-    from_square_millimeters = {unit: 1 / factor for unit, factor in to_square_millimeters.items()}
+    if backend != "float":
+        return convert_precise(AREA.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_square_millimeters = value * to_square_millimeters[from_unit]
-        return value_in_square_millimeters * from_square_millimeters[to_unit]
+        return value * AREA_MATRIX[AREA_INDEX[from_unit]][AREA_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_speed(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_speed(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de velocidad entre diferentes unidades.
 
@@ -279,32 +439,30 @@ def convert_speed(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_cm_per_second = {
-        "centimetros_por_segundo": 1.0,
-        "metros_por_segundo": 100,
-        "kilometros_por_hora": 1000.0 / 36.0,
-        "pies_por_segundo": 30.48,
-        "millas_por_hora": 44.706,
-        "nudos": 51.4444,
-        "mach": 34029
-    }
-    from_cm_per_second = {unit: 1 / factor for unit, factor in to_cm_per_second.items()}
+    if backend != "float":
+        return convert_precise(SPEED.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_cm_per_second = value * to_cm_per_second[from_unit]
-        return value_in_cm_per_second * from_cm_per_second[to_unit]
+        return value * SPEED_MATRIX[SPEED_INDEX[from_unit]][SPEED_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_time(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_time(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de tiempo entre diferentes unidades.
 
@@ -314,33 +472,30 @@ def convert_time(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_microseconds = {
-        "microsegundos": 1.0,
-        "milisegundos": 1000,
-        "segundos": 1e6,
-        "minutos": 6e7,
-        "horas": 3.6e9,
-        "dias": 8.64e10,
-        "semanas": 6.048e11,
-        "años": 3.1536e13,
-    }
-    from_microseconds = {unit: 1 / factor for unit, factor in to_microseconds.items()}
+    if backend != "float":
+        return convert_precise(TIME.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_microseconds = value * to_microseconds[from_unit]
-        return value_in_microseconds * from_microseconds[to_unit]
+        return value * TIME_MATRIX[TIME_INDEX[from_unit]][TIME_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_power(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_power(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de potencia entre diferentes unidades.
 
@@ -351,30 +506,30 @@ def convert_power(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_watts= {
-        "vatios": 1.0,
-        "kilovatios": 1e3,
-        "caballos_de_fuerza_eeuu": 745.7,
-        "pie_libras_por_minuto": 0.02259698059,
-        "unidades_termicas_britanicas_por_minuto": 17.58427263,
-    }
-    from_watts = {unit: 1 / factor for unit, factor in to_watts.items()}
+    if backend != "float":
+        return convert_precise(POWER.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_watts = value * to_watts[from_unit]
-        return value_in_watts * from_watts[to_unit]
+        return value * POWER_MATRIX[POWER_INDEX[from_unit]][POWER_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_angle(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_angle(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de ángulo entre diferentes unidades.
 
@@ -384,28 +539,30 @@ def convert_angle(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_grades = {
-        "grados": value,
-        "radianes":180 / pi,
-        "grados_centesimales": 0.9,
-    }
-    from_grades = {unit: 1 / factor for unit, factor in to_grades.items()}
+    if backend != "float":
+        return convert_precise(ANGLE.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_grades = value * to_grades[from_unit]
-        return value_in_grades * from_grades[to_unit]
+        return value * ANGLE_MATRIX[ANGLE_INDEX[from_unit]][ANGLE_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_pressure(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_pressure(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de presión entre diferentes unidades.
 
@@ -416,31 +573,30 @@ def convert_pressure(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_atmospheres = {
-        "atmosferas": 1.0,
-        "bares": 0.9869232667,
-        "kilopascales": 0.009869232667,
-        "milimetros_de_mercurio": 0.001315789474,
-        "pascales": 9.869232667e-06,
-        "libras_por_pulgada_cuadrada": 0.06804618975
-    }
-    from_atmospheres = {unit: 1 / factor for unit, factor in to_atmospheres.items()}
+    if backend != "float":
+        return convert_precise(PRESSURE.key, value, from_unit, to_unit, backend)
 
     try:
-        value_in_atmospheres = value * to_atmospheres[from_unit]
-        return value_in_atmospheres * from_atmospheres[to_unit]
+        return value * PRESSURE_MATRIX[PRESSURE_INDEX[from_unit]][PRESSURE_INDEX[to_unit]]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
-
-def convert_data(value: float, from_unit: str, to_unit: str) -> float:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+def convert_data(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+    *,
+    backend: str = "float"
+) -> float:
     """
     Convierte un valor de almacenamiento de datos entre diferentes unidades.
 
@@ -454,55 +610,178 @@ def convert_data(value: float, from_unit: str, to_unit: str) -> float:
         value: Valor numérico a convertir.
         from_unit: Unidad de origen (en minúsculas y formato interno).
         to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: Backend numérico: 'float' (por defecto), 'decimal' o 'fraction'.
 
     Returns:
-        Valor convertido como float.
+        Valor convertido como float (`Decimal` o `Fraction` según `backend`).
 
     Raises:
         ValueError: Si alguna de las unidades no es válida.
     """
 
-    to_bits = {
-        "bits": 1.0,
-        "cuarteto": 4,
-        "bytes": 8,
-        "kilobits": 1000,
-        "kibibits": 1024,
-        "kilobytes": 8000,
-        "kibibytes": 8192,
-        "megabits": 1e6,
-        "mebibits": 1_048_576,
-        "megabytes": 8e6,
-        "mebibytes": 8_388_608,
-        "gigabits": 1e9,
-        "gibibits": 1_073_741_824,
-        "gigabytes": 8e9,
-        "gibibytes": 8_589_934_592,
-        "terabits": 1e12,
-        "tebibits": 1_099_511_627_776,
-        "terabytes": 8e12,
-        "tebibytes": 8_796_093_208_022,
-        "petabits": 1e15,
-        "pebibits": 1_125_899_906_842_624,
-        "petabytes": 8e15,
-        "pebibytes": 9_007_199_254_740_992,
-        "exabits": 1e18,
-        "exbibits": 1_152_921_504_606_846_976,
-        "exabytes": 8e18,
-        "exbibytes": 9_223_372_036_854_775_808,
-        "zettabits": 1e21,
-        "zebibits": 1_180_591_620_717_411_303_424,
-        "zettabytes": 8e21,
-        "zebibytes": 9_444_732_965_732_923_457_740_000,
-        "yottabits": 1e24,
-        "yobibits": 1_208_925_819_614_629_174_706_176,
-        "yottabytes": 8e24,
-        "yobibytes": 9_671_406_556_917_033_397_649_408,
-    }
-    from_bits = {unit: 1 / factor for unit, factor in to_bits.items()}
+    if backend != "float":
+        return convert_precise(DATA.key, value, from_unit, to_unit, backend)
+
+    try:
+        return value * DATA_MATRIX[DATA_INDEX[from_unit]][DATA_INDEX[to_unit]]
+    except KeyError as e:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+
+
+# ────────────────────── CONVERSORES ESPECIALIZADOS ──────────────────────
+def get_coefficients(dimension: str, from_unit: str, to_unit: str) -> tuple[float, float]:
+    """
+    Obtiene los coeficientes precalculados de una conversión, de forma que
+    `destino = valor * escala + desplazamiento`.
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+
+    Returns:
+        tuple[float, float]: (escala, desplazamiento). El desplazamiento es 0.0
+        en todos los sistemas lineales.
+
+    Raises:
+        ValueError: Si el sistema o alguna de las unidades no es válida.
+    """
+
+    try:
+        index = UNIT_INDEX[dimension]
+    except KeyError as e:
+        raise ValueError(f"Sistema invalido: {e}.") from e
 
     try:
-        value_in_bits = value * to_bits[from_unit]
-        return value_in_bits  * from_bits[to_unit]
+        i, j = index[from_unit], index[to_unit]
     except KeyError as e:
-        raise ValueError(f"{Fore.MAGENTA}Unidad invalida: {e}.") from e
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+    offsets = OFFSET_MATRIX.get(dimension)
+    return FACTOR_MATRIX[dimension][i][j], (offsets[i][j] if offsets else 0.0)
+
+def get_converter(dimension: str, from_unit: str, to_unit: str) -> Callable[[float], float]:
+    """
+    Devuelve una función especializada para un par de unidades fijo. Las búsquedas
+    se hacen una sola vez al crearla, por lo que cada llamada cuesta una multiplicación
+    (más una suma en temperatura). Pensada para guardarse y reutilizarse en ciclos.
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+
+    Returns:
+        Callable[[float], float]: Función que recibe un valor y devuelve el valor convertido.
+
+    Raises:
+        ValueError: Si el sistema o alguna de las unidades no es válida.
+    """
+
+    factor, offset = get_coefficients(dimension, from_unit, to_unit)
+    if offset:
+        return lambda value: value * factor + offset
+    return lambda value: value * factor
+
+@lru_cache(maxsize=CONVERTER_CACHE_SIZE)
+def get_cached_converter(
+    dimension: str,
+    from_unit: str,
+    to_unit: str
+) -> Callable[[float], float]:
+    """
+    Igual que `get_converter`, pero guarda los últimos `CONVERTER_CACHE_SIZE`
+    conversores creados. Pensada para servicios que reciben la misma terna
+    (sistema, origen, destino) en muchas peticiones.
+
+    Raises:
+        ValueError: Si el sistema o alguna de las unidades no es válida.
+    """
+    return get_converter(dimension, from_unit, to_unit)
+
+
+# ────────────────────── CADENAS DE CONVERSIÓN ──────────────────────
+# Un paso de cadena puede ser una conversión (sistema, origen, destino), un par
+# (escala, desplazamiento) o un número, que se aplica como factor (por ejemplo, una
+# constante física entre dos sistemas).
+ChainStep = tuple[str, str, str] | tuple[float, float] | float
+
+def _step_coefficients(step: ChainStep) -> tuple[str | None, str, str, Fraction, Fraction]:
+    """
+    Obtiene los coeficientes exactos de un paso de cadena. Las conversiones entre
+    unidades usan las matrices exactas de `precision_logic` y los pasos numéricos se
+    leen como `Fraction` sin redondear.
+
+    Returns:
+        tuple: (sistema, origen, destino, escala, desplazamiento). El sistema y las
+        unidades son None y "" en los pasos numéricos.
+
+    Raises:
+        ValueError: Si el paso no tiene un formato válido o sus unidades no existen.
+    """
+    def is_number(value) -> bool:
+        return isinstance(value, (int, float, Fraction)) and not isinstance(value, bool)
+
+    try:
+        if is_number(step):
+            return None, "", "", Fraction(step), Fraction(0)
+        if isinstance(step, tuple) and len(step) == 3 and all(isinstance(s, str) for s in step):
+            return (*step, *get_precise_coefficients(*step, "fraction"))
+        if isinstance(step, tuple) and len(step) == 2 and all(map(is_number, step)):
+            return None, "", "", Fraction(step[0]), Fraction(step[1])
+    except (ValueError, OverflowError) as e:    # Unidades inexistentes, inf o NaN
+        raise ValueError(f"Paso de cadena invalido: {step!r}: {e}") from e
+    raise ValueError(f"Paso de cadena invalido: {step!r}.")
+
+def get_chain_coefficients(steps: Iterable[ChainStep]) -> tuple[float, float]:
+    """
+    Pliega una secuencia de pasos en un solo par de coeficientes, de forma que toda
+    la cadena equivale a `destino = valor * escala + desplazamiento`. Los coeficientes
+    de cada paso se componen de forma exacta y se redondean a float una sola vez.
+
+    Args:
+        steps: Pasos de la cadena en orden de aplicación. Cada paso es una tupla
+            (sistema, origen, destino), un par (escala, desplazamiento) o un número.
+
+    Returns:
+        tuple[float, float]: (escala, desplazamiento) de la cadena completa.
+
+    Raises:
+        ValueError: Si algún paso no es válido, o si dos conversiones seguidas del
+            mismo sistema no encadenan la unidad de destino con la de origen.
+    """
+
+    scale, offset = Fraction(1), Fraction(0)
+    previous = (None, "")
+    for step in steps:
+        dimension, from_unit, to_unit, step_scale, step_offset = _step_coefficients(step)
+        if dimension is not None and previous[0] == dimension and previous[1] != from_unit:
+            raise ValueError(
+                f"Cadena discontinua: '{previous[1]}' no continua en '{from_unit}'."
+            )
+        previous = (dimension, to_unit)
+        scale, offset = scale * step_scale, offset * step_scale + step_offset
+    return float(scale), float(offset)
+
+def compile_chain(steps: Iterable[ChainStep]) -> Callable[[float], float]:
+    """
+    Compila una cadena de conversiones en una sola función. Sin importar cuántos pasos
+    tenga, aplicarla cuesta una multiplicación (más una suma si algún paso es afín),
+    tanto a un número como a un arreglo de NumPy. Para buffers `array.array` o listas
+    se puede usar `batch_logic.convert_chain_batch`.
+
+    Args:
+        steps: Pasos de la cadena en orden de aplicación (ver `get_chain_coefficients`).
+
+    Returns:
+        Callable[[float], float]: Función que aplica la cadena completa.
+
+    Raises:
+        ValueError: Si algún paso no es válido o la cadena es discontinua.
+    """
+
+    factor, offset = get_chain_coefficients(steps)
+    if offset:
+        return lambda value: value * factor + offset
+    return lambda value: value * factor
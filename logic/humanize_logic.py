@@ -0,0 +1,186 @@
+"""
+humanize_logic.py
+
+Expresa un valor en la unidad más legible de su sistema (por ejemplo, 8.3e21 bits
+como exbibytes o 5.4e9 microsegundos como horas). Cada sistema tiene una escala de
+unidades ordenada de menor a mayor; se elige la mayor unidad que no supere el valor.
+
+Las tablas se calculan una sola vez al importar el módulo: para cada escala, los
+umbrales ordenados (el tamaño de cada unidad expresado en la primera) y, para cada
+unidad de entrada, los factores hacia todas las unidades de la escala. Los factores
+se derivan de las fracciones exactas de `precision_logic` y se redondean a float una
+sola vez, de modo que 1000 pascales da exactamente 1 kilopascal. Cada llamada cuesta
+una multiplicación, una búsqueda binaria (`bisect`) y otra multiplicación.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from bisect import bisect_right
+from math import isfinite
+from typing import NamedTuple
+
+from logic.precision_logic import get_precise_coefficients
+from logic.unit_catalog import DIMENSIONS, DISPLAY_NAMES
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+PREFIX_SYSTEMS = ("si", "iec")      # Prefijos decimales (kB = 1000 B) o binarios (KiB)
+
+# Escalas de unidades por sistema, de menor a mayor. 'iec' solo cambia en datos; los
+# demás sistemas usan su escala 'si' con cualquier valor de `system`.
+SCALES = {
+    "data": {
+        "si": (
+            "bits", "bytes", "kilobytes", "megabytes", "gigabytes", "terabytes",
+            "petabytes", "exabytes", "zettabytes", "yottabytes",
+        ),
+        "iec": (
+            "bits", "bytes", "kibibytes", "mebibytes", "gibibytes", "tebibytes",
+            "pebibytes", "exbibytes", "zebibytes", "yobibytes",
+        ),
+    },
+    "time": {
+        "si": (
+            "microsegundos", "milisegundos", "segundos", "minutos", "horas", "dias", "años",
+        ),
+    },
+    "length": {"si": ("nanometros", "micrones", "milimetros", "metros", "kilometros")},
+    "mass": {"si": ("miligramos", "gramos", "kilogramos", "toneladas_metricas")},
+    "volume": {"si": ("mililitros", "litros", "metros_cubicos")},
+    "area": {
+        "si": (
+            "milimetros_cuadrados", "centimetros_cuadrados", "metros_cuadrados", "hectareas",
+            "kilometros_cuadrados",
+        ),
+    },
+    "energy": {"si": ("joules", "kilojulios")},
+    "power": {"si": ("vatios", "kilovatios")},
+    "pressure": {"si": ("pascales", "kilopascales")},
+}
+
+
+# ────────────────────── ESTRUCTURAS ──────────────────────
+class HumanValue(NamedTuple):
+    """
+    Valor expresado en la unidad más legible.
+
+    Attributes:
+        value (float): Valor en la unidad elegida.
+        unit (str): Nombre lógico de la unidad elegida.
+        display (str): Nombre para mostrar de la unidad elegida.
+    """
+
+    value: float
+    unit: str
+    display: str
+
+class _ScaleTable(NamedTuple):
+    """Tablas precalculadas de una escala."""
+
+    units: tuple[str, ...]                      # Unidades de la escala, de menor a mayor
+    displays: tuple[str, ...]                   # Nombres para mostrar de cada unidad
+    thresholds: tuple[float, ...]               # Tamaño de cada unidad en la primera
+    factors: dict[str, tuple[float, ...]]       # Entrada -> factor hacia cada unidad
+
+
+# ────────────────────── TABLAS PRECALCULADAS ──────────────────────
+def _build_table(dimension: str, units: tuple[str, ...]) -> _ScaleTable:
+    """Calcula los umbrales y factores de una escala con los coeficientes exactos."""
+    def exact_scale(from_unit: str, to_unit: str):
+        return get_precise_coefficients(dimension, from_unit, to_unit, "fraction")[0]
+
+    first = units[0]
+    display = DISPLAY_NAMES[dimension]
+    return _ScaleTable(
+        units=units,
+        displays=tuple(display[unit] for unit in units),
+        thresholds=tuple(float(exact_scale(unit, first)) for unit in units),
+        factors={
+            unit.name: tuple(float(exact_scale(unit.name, target)) for target in units)
+            for unit in DIMENSIONS[dimension].units
+        },
+    )
+
+_SCALE_TABLES = {
+    dimension: {system: _build_table(dimension, units) for system, units in systems.items()}
+    for dimension, systems in SCALES.items()
+}
+# (sistema, prefijos) -> tabla, con 'iec' resuelto de antemano a la escala 'si' donde no
+# hay escala binaria, para que cada llamada haga una sola búsqueda.
+TABLES = {
+    (dimension, prefixes): tables.get(prefixes, tables["si"])
+    for dimension, tables in _SCALE_TABLES.items()
+    for prefixes in PREFIX_SYSTEMS
+}
+
+
+# ────────────────────── FORMATO ──────────────────────
+def _invalid_table(dimension: str, system: str) -> ValueError:
+    """Construye el error de una combinación de sistema y prefijos sin tabla."""
+    if system not in PREFIX_SYSTEMS:
+        return ValueError(
+            f"Sistema de prefijos invalido: '{system}'. Opciones: {', '.join(PREFIX_SYSTEMS)}."
+        )
+    return ValueError(f"Sistema sin escala automatica: '{dimension}'.")
+
+def humanize(value: float, dimension: str, unit: str, system: str = "si") -> HumanValue:
+    """
+    Expresa un valor en la unidad más legible de su sistema: la mayor unidad de la
+    escala que no supera el valor (en valor absoluto). Los valores menores que la
+    primera unidad se expresan en ella. El cero y los valores no finitos se devuelven
+    en la unidad de entrada.
+
+    Args:
+        value: Valor a expresar.
+        dimension: Sistema de conversión ('data', 'time', 'length', ...).
+        unit: Unidad del valor (en minúsculas y formato interno).
+        system: Prefijos de la escala de datos: 'si' (kilobytes, 1000) o 'iec'
+            (kibibytes, 1024). Los demás sistemas siempre usan la escala 'si'.
+
+    Returns:
+        HumanValue: Valor convertido, unidad elegida y su nombre para mostrar.
+
+    Raises:
+        ValueError: Si el sistema no tiene escala, la unidad o el sistema de prefijos
+            no es válido.
+    """
+    table = TABLES.get((dimension, system))
+    if table is None:
+        raise _invalid_table(dimension, system)
+    try:
+        factors = table.factors[unit]
+    except KeyError as e:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+
+    if not value or not isfinite(value):
+        return HumanValue(value, unit, DISPLAY_NAMES[dimension][unit])
+    index = bisect_right(table.thresholds, abs(value * factors[0])) - 1
+    if index < 0:
+        index = 0
+    return HumanValue(value * factors[index], table.units[index], table.displays[index])
+
+def format_human(
+    value: float,
+    dimension: str,
+    unit: str,
+    system: str = "si",
+    digits: int = 2
+) -> str:
+    """
+    Devuelve el valor como texto en la unidad más legible (ver `humanize`).
+
+    Args:
+        digits: Decimales del valor.
+
+    Returns:
+        str: Texto como '1.50 Gibibytes'.
+
+    Raises:
+        ValueError: Si el sistema no tiene escala, la unidad o el sistema de prefijos
+            no es válido.
+    """
+    value, _, display = humanize(value, dimension, unit, system)
+    return f"{value:.{digits}f} {display}"
@@ -0,0 +1,227 @@
+"""
+memo_logic.py
+
+Caché opcional de resultados para flujos con lecturas muy repetidas (el mismo valor
+con el mismo par de unidades). Al activarla con `enable()` para uno o varios sistemas,
+las conversiones de `convert_*` con los backends de precisión ('decimal' y 'fraction')
+se guardan en una caché LRU acotada por sistema, indexada por (valor, origen, destino,
+backend y, en 'decimal', la precisión y el redondeo del contexto actual).
+
+El backend 'float' no se guarda: su costo (una búsqueda en la matriz y una
+multiplicación) es menor que el de consultar cualquier caché. Los backends de
+precisión cuestan varios microsegundos por llamada, y ahí una lectura repetida se
+resuelve con una sola búsqueda.
+
+Mientras está desactivada no se reemplaza nada, así que no añade ningún costo. La
+caché se instala en `conversion_logic.convert_precise`, que es la función que usan
+las `convert_*` con un backend de precisión, así que puede activarse o desactivarse
+en cualquier momento, incluso después de importar las interfaces.
+
+Uso:
+    memo_logic.enable(["temperature", "pressure"], maxsize=8192)
+    convert_temperature(21.5, "celsius", "kelvin", backend="decimal")
+    memo_logic.get_cache_stats()["temperature"]["hit_ratio"]
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from decimal import Context, Decimal, getcontext
+
+from logic import conversion_logic
+from logic.unit_catalog import DIMENSIONS
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+DEFAULT_MAXSIZE = 4096      # Resultados que se guardan por sistema
+
+
+# ────────────────────── CACHÉ LRU ──────────────────────
+class MemoCache:
+    """
+    Caché LRU acotada con contadores de aciertos, fallos y desalojos.
+
+    Attributes:
+        maxsize (int): Resultados que se guardan antes de desalojar el menos usado.
+        hits (int): Consultas resueltas desde la caché.
+        misses (int): Consultas que tuvieron que calcular el resultado.
+        evictions (int): Resultados desalojados por falta de espacio.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError(f"Tamaño de cache invalido: {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def get_or_compute(self, key, compute: Callable, *args):
+        """
+        Devuelve el resultado guardado para `key` o lo calcula con `compute(*args)` y lo
+        guarda. Los errores de `compute` no se guardan.
+
+        No usa candados: cada operación de `OrderedDict` es atómica con el GIL, y si dos
+        hilos calculan la misma clave a la vez ambos guardan el mismo resultado. Con
+        varios hilos los contadores pueden quedar ligeramente por debajo del total real.
+        """
+        data = self._data
+        try:
+            result = data[key]
+            data.move_to_end(key)
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = compute(*args)
+        data[key] = result
+        if len(data) > self.maxsize:
+            try:
+                data.popitem(last=False)
+                self.evictions += 1
+            except KeyError:     # Otro hilo ya desalojó el último elemento
+                pass
+        return result
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia sus contadores."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, float]:
+        """
+        Devuelve los contadores de la caché.
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_ratio', 'evictions', 'size', 'maxsize'}.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+_caches: dict[str, MemoCache] = {}         # Clave del sistema -> caché activa
+_original: list[Callable] = []             # `convert_precise` sin caché, si está instalada
+
+
+# ────────────────────── CONVERSIÓN CON CACHÉ ──────────────────────
+def _make_key(value, from_unit: str, to_unit: str, backend: str) -> tuple:
+    """
+    Construye la clave de una conversión. Los `Decimal` se guardan por su texto, ya
+    que '1.0' y '1.00' son iguales pero producen resultados con distinto exponente.
+    """
+    number = str(value) if value.__class__ is Decimal else value
+    if backend == "decimal":
+        context = getcontext()
+        return (
+            value.__class__, number, from_unit, to_unit, backend, context.prec, context.rounding
+        )
+    return value.__class__, number, from_unit, to_unit, backend
+
+def _convert_precise(
+    dimension: str,
+    value,
+    from_unit: str,
+    to_unit: str,
+    backend: str = "fraction",
+    context: Context | None = None
+):
+    """
+    Igual que `precision_logic.convert_precise`, pero consulta la caché del sistema si
+    está activa. Las llamadas con un contexto explícito no se guardan.
+    """
+    convert_precise = _original[0]
+    cache = _caches.get(dimension)
+    if cache is None or context is not None:
+        return convert_precise(dimension, value, from_unit, to_unit, backend, context)
+    try:
+        key = _make_key(value, from_unit, to_unit, backend)
+        hash(key)
+    except TypeError:       # Valores no hashables (ej. Decimal('sNaN'))
+        return convert_precise(dimension, value, from_unit, to_unit, backend)
+    return cache.get_or_compute(
+        key, convert_precise, dimension, value, from_unit, to_unit, backend
+    )
+
+
+# ────────────────────── ACTIVACIÓN ──────────────────────
+def _get_keys(dimensions: Iterable[str] | None) -> list[str]:
+    """
+    Valida los sistemas indicados.
+
+    Raises:
+        ValueError: Si algún sistema no existe.
+    """
+    if dimensions is None:
+        return list(DIMENSIONS)
+    keys = list(dimensions)
+    for key in keys:
+        if key not in DIMENSIONS:
+            raise ValueError(f"Sistema invalido: '{key}'.")
+    return keys
+
+def enable(dimensions: Iterable[str] | None = None, maxsize: int = DEFAULT_MAXSIZE) -> None:
+    """
+    Activa la caché para los sistemas indicados. Si un sistema ya la tenía, se
+    reemplaza por una nueva (vacía) con el tamaño indicado.
+
+    Args:
+        dimensions: Claves de los sistemas ('length', 'temperature', ...). Por
+            defecto, todos.
+        maxsize: Resultados que se guardan por sistema antes de desalojar el menos
+            usado recientemente.
+
+    Raises:
+        ValueError: Si algún sistema no existe o `maxsize` no es positivo.
+    """
+    keys = _get_keys(dimensions)
+    caches = {key: MemoCache(maxsize) for key in keys}
+    if not _original:
+        _original.append(conversion_logic.convert_precise)
+        conversion_logic.convert_precise = _convert_precise
+    _caches.update(caches)
+
+def disable(dimensions: Iterable[str] | None = None) -> None:
+    """
+    Desactiva la caché de los sistemas indicados (por defecto, todos). Al no quedar
+    ninguno, restaura la función original.
+
+    Raises:
+        ValueError: Si algún sistema no existe.
+    """
+    for key in _get_keys(dimensions):
+        _caches.pop(key, None)
+    if not _caches and _original:
+        conversion_logic.convert_precise = _original.pop()
+
+def is_enabled(dimension: str) -> bool:
+    """Indica si la caché está activa para un sistema."""
+    return dimension in _caches
+
+def clear_cache() -> None:
+    """Vacía las cachés activas y reinicia sus contadores."""
+    for cache in _caches.values():
+        cache.clear()
+
+def get_cache_stats() -> dict[str, dict[str, float]]:
+    """
+    Devuelve los contadores de la caché de cada sistema activo.
+
+    Returns:
+        dict: {sistema: {'hits', 'misses', 'hit_ratio', 'evictions', 'size', 'maxsize'}}.
+    """
+    return {key: cache.stats() for key, cache in _caches.items()}
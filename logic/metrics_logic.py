@@ -0,0 +1,271 @@
+"""
+metrics_logic.py
+
+Instrumentación opcional de las conversiones. Al activarla con `enable()`, las
+funciones `convert_*` y `get_converter` de `conversion_logic` se reemplazan por
+envolturas que cuentan, por cada terna (sistema, origen, destino), las conversiones
+hechas, el tiempo acumulado y los errores por unidades inválidas. Los conversores
+devueltos por `get_converter` (y por `get_cached_converter`) cuentan cada valor. En
+los errores, los sistemas y unidades fuera del catálogo se agrupan bajo la etiqueta
+'invalid', para que las series no dependan de lo que escriban los clientes.
+
+Mientras está desactivada no se reemplaza nada, así que no añade ningún costo. Como
+las interfaces importan las funciones por nombre, `enable()` debe llamarse antes de
+importarlas (`main.py` lo hace si existe la variable de entorno CONVERSOR_METRICS).
+Las conversiones por lotes de `batch_logic` usan los coeficientes directamente y no
+se cuentan.
+
+Los contadores se exportan en formato de texto de Prometheus (`export_prometheus` y
+`write_snapshot`) o como resumen legible (`format_summary`).
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+
+from logic import conversion_logic
+from logic.unit_catalog import DISPLAY_NAMES
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+METRIC_PREFIX = "conversor"
+INVALID_LABEL = "invalid"       # Etiqueta de los sistemas y unidades fuera del catálogo
+
+# Función `convert_*` -> clave del sistema que convierte
+CONVERT_FUNCTIONS = {
+    "convert_temperature": "temperature",
+    "convert_length": "length",
+    "convert_mass": "mass",
+    "convert_volume": "volume",
+    "convert_energy": "energy",
+    "convert_area": "area",
+    "convert_speed": "speed",
+    "convert_time": "time",
+    "convert_power": "power",
+    "convert_angle": "angle",
+    "convert_pressure": "pressure",
+    "convert_data": "data",
+}
+
+_lock = threading.Lock()
+_calls: dict[tuple[str, str, str], list[int]] = {}     # terna -> [conversiones, ns]
+_errors: dict[tuple[str, str, str], int] = {}          # terna -> unidades inválidas
+_originals: dict[str, Callable] = {}                   # Funciones reemplazadas
+
+
+# ────────────────────── REGISTRO ──────────────────────
+def _record(key: tuple[str, str, str], elapsed_ns: int) -> None:
+    """Suma una conversión y su duración a la terna indicada."""
+    with _lock:
+        entry = _calls.get(key)
+        if entry is None:
+            _calls[key] = [1, elapsed_ns]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_ns
+
+def _error_key(dimension, from_unit, to_unit) -> tuple[str, str, str]:
+    """
+    Construye la terna de un error usando solo claves del catálogo: los sistemas y
+    unidades desconocidos se agrupan en `INVALID_LABEL`. Así los textos enviados por
+    los clientes no crean series nuevas ni hacen crecer los contadores sin límite.
+    """
+    def known(unit, names) -> bool:
+        return isinstance(unit, str) and unit in names
+
+    if not known(dimension, DISPLAY_NAMES):
+        return INVALID_LABEL, INVALID_LABEL, INVALID_LABEL
+    names = DISPLAY_NAMES[dimension]
+    return (
+        dimension,
+        from_unit if known(from_unit, names) else INVALID_LABEL,
+        to_unit if known(to_unit, names) else INVALID_LABEL,
+    )
+
+def _record_error(dimension, from_unit, to_unit) -> None:
+    """Suma un error por unidad inválida a la terna indicada (ver `_error_key`)."""
+    key = _error_key(dimension, from_unit, to_unit)
+    with _lock:
+        _errors[key] = _errors.get(key, 0) + 1
+
+
+# ────────────────────── ENVOLTURAS ──────────────────────
+def _wrap_convert(dimension: str, func: Callable) -> Callable:
+    """Envuelve una función `convert_*` para contar sus llamadas, tiempo y errores."""
+    clock = time.perf_counter_ns
+
+    def convert(value, from_unit: str, to_unit: str, *, backend: str = "float"):
+        start = clock()
+        try:
+            result = func(value, from_unit, to_unit, backend=backend)
+        except ValueError:
+            _record_error(dimension, from_unit, to_unit)
+            raise
+        _record((dimension, from_unit, to_unit), clock() - start)
+        return result
+
+    convert.__name__ = func.__name__
+    convert.__doc__ = func.__doc__
+    convert.__wrapped__ = func
+    return convert
+
+def _wrap_get_converter(func: Callable) -> Callable:
+    """Envuelve `get_converter` para que los conversores devueltos cuenten cada valor."""
+    clock = time.perf_counter_ns
+
+    def get_converter(dimension: str, from_unit: str, to_unit: str):
+        key = (dimension, from_unit, to_unit)
+        try:
+            converter = func(dimension, from_unit, to_unit)
+        except ValueError:
+            _record_error(*key)
+            raise
+
+        def counted(value):
+            start = clock()
+            result = converter(value)
+            _record(key, clock() - start)
+            return result
+
+        return counted
+
+    get_converter.__doc__ = func.__doc__
+    get_converter.__wrapped__ = func
+    return get_converter
+
+
+# ────────────────────── ACTIVACIÓN ──────────────────────
+def is_enabled() -> bool:
+    """Indica si la instrumentación está activa."""
+    return bool(_originals)
+
+def enable() -> None:
+    """
+    Activa la instrumentación reemplazando las funciones de `conversion_logic`.
+    Vacía la caché de `get_cached_converter` para que los conversores nuevos se
+    creen ya instrumentados. Llamarla de nuevo no tiene efecto.
+    """
+    if _originals:
+        return
+    for name, dimension in CONVERT_FUNCTIONS.items():
+        _originals[name] = getattr(conversion_logic, name)
+        setattr(conversion_logic, name, _wrap_convert(dimension, _originals[name]))
+    _originals["get_converter"] = conversion_logic.get_converter
+    conversion_logic.get_converter = _wrap_get_converter(_originals["get_converter"])
+    conversion_logic.get_cached_converter.cache_clear()
+
+def disable() -> None:
+    """Restaura las funciones originales de `conversion_logic` (conserva los contadores)."""
+    for name, func in _originals.items():
+        setattr(conversion_logic, name, func)
+    _originals.clear()
+    conversion_logic.get_cached_converter.cache_clear()
+
+def reset() -> None:
+    """Reinicia todos los contadores."""
+    with _lock:
+        _calls.clear()
+        _errors.clear()
+
+
+# ────────────────────── EXPORTACIÓN ──────────────────────
+def get_snapshot() -> dict[tuple[str, str, str], dict[str, float]]:
+    """
+    Devuelve una copia de los contadores.
+
+    Returns:
+        dict: {(sistema, origen, destino): {'calls', 'seconds', 'errors'}}.
+    """
+    with _lock:
+        keys = _calls.keys() | _errors.keys()
+        return {
+            key: {
+                "calls": _calls.get(key, (0, 0))[0],
+                "seconds": _calls.get(key, (0, 0))[1] / 1e9,
+                "errors": _errors.get(key, 0),
+            }
+            for key in sorted(keys)
+        }
+
+def _labels(key: tuple[str, str, str]) -> str:
+    """Formatea una terna como etiquetas de Prometheus, escapando sus valores."""
+    def escape(text: str) -> str:
+        return str(text).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    dimension, from_unit, to_unit = map(escape, key)
+    return f'{{dimension="{dimension}",from="{from_unit}",to="{to_unit}"}}'
+
+def export_prometheus() -> str:
+    """
+    Devuelve los contadores en el formato de texto de Prometheus.
+
+    Returns:
+        str: Métricas `conversor_conversions_total`, `conversor_conversion_seconds_total`
+        y `conversor_invalid_unit_errors_total`, con una serie por terna.
+    """
+    snapshot = get_snapshot()
+    metrics = (
+        ("conversions_total", "calls", "Conversiones realizadas por terna.", "{}"),
+        ("conversion_seconds_total", "seconds", "Tiempo acumulado de conversion.", "{:.9f}"),
+        ("invalid_unit_errors_total", "errors", "Errores por unidades invalidas.", "{}"),
+    )
+    lines = []
+    for name, field, help_text, number in metrics:
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+        lines.extend(
+            f"{METRIC_PREFIX}_{name}{_labels(key)} {number.format(values[field])}"
+            for key, values in snapshot.items()
+            if values["errors" if field == "errors" else "calls"]
+        )
+    return "\n".join(lines) + "\n"
+
+def write_snapshot(path: str) -> None:
+    """
+    Escribe las métricas de Prometheus en un archivo. Se escribe primero en un archivo
+    temporal y luego se reemplaza, de modo que un recolector nunca lee un archivo a medias.
+
+    Args:
+        path: Ruta del archivo (ej. para el textfile collector de node_exporter).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(export_prometheus())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def format_summary(limit: int = 20) -> str:
+    """
+    Devuelve un resumen legible de las ternas más usadas.
+
+    Args:
+        limit: Número máximo de ternas a mostrar.
+
+    Returns:
+        str: Tabla con conversiones, tiempo total, tiempo medio y errores por terna.
+    """
+    snapshot = get_snapshot()
+    if not snapshot:
+        return "Sin conversiones registradas."
+
+    ranked = sorted(snapshot.items(), key=lambda item: -item[1]["calls"])[:limit]
+    lines = [f"{'terna':<52}{'conversiones':>13}{'total ms':>11}{'µs medio':>10}{'errores':>9}"]
+    for (dimension, from_unit, to_unit), values in ranked:
+        calls, seconds = values["calls"], values["seconds"]
+        mean = seconds / calls * 1e6 if calls else 0.0
+        lines.append(
+            f"{f'{dimension}: {from_unit} -> {to_unit}':<52}{calls:>13}"
+            f"{seconds * 1000:>11.3f}{mean:>10.2f}{values['errors']:>9}"
+        )
+    return "\n".join(lines)
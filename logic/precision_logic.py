@@ -0,0 +1,254 @@
+"""
+precision_logic.py
+
+Conversiones con precisión seleccionable. El backend `float` (rápido) es el de
+`conversion_logic`; este módulo añade `decimal.Decimal` con contexto configurable y
+`fractions.Fraction` (exacto), que las funciones `convert_*` usan cuando se les pide
+otro backend. Sirven para los casos en que el redondeo binario importa: múltiplos
+binarios grandes de datos, distancias astronómicas, cadenas de conversiones.
+
+Los factores del catálogo se interpretan por su representación decimal más corta
+(`1e-10` es exactamente 1/10¹⁰), salvo los que ya son enteros o `Fraction`. Las tablas
+de cada backend se construyen la primera vez que se usa cada sistema y se guardan, de
+modo que importar este módulo no tiene costo y ninguna llamada recalcula factores.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from collections.abc import Callable
+from decimal import Context, Decimal, InvalidOperation, getcontext
+from fractions import Fraction
+from functools import cache
+from numbers import Real
+
+from logic.unit_catalog import DIMENSIONS
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+PRECISE_BACKENDS = ("decimal", "fraction")    # El backend "float" es `conversion_logic`
+
+# Índice {unidad: posición} y matrices de escala y desplazamiento de un sistema
+FractionMatrix = tuple[tuple[Fraction, ...], ...]
+DecimalMatrix = tuple[tuple[Decimal, ...], ...]
+ExactTables = tuple[dict[str, int], FractionMatrix, FractionMatrix]
+DecimalTables = tuple[dict[str, int], DecimalMatrix, DecimalMatrix]
+
+
+# ────────────────────── FUNCIONES AUXILIARES ──────────────────────
+def _exact(value: Real | Decimal | str) -> Fraction:
+    """
+    Convierte un número a `Fraction`. Los float se leen por su representación decimal
+    más corta (`0.1` es 1/10 y no la fracción binaria que guarda el float).
+    """
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+def _get_dimension(dimension: str):
+    """
+    Obtiene un sistema del catálogo por su clave.
+
+    Raises:
+        ValueError: Si el sistema no existe.
+    """
+    try:
+        return DIMENSIONS[dimension]
+    except KeyError as e:
+        raise ValueError(f"Sistema invalido: {e}.") from e
+
+def _check_backend(backend: str) -> None:
+    """
+    Verifica que el backend numérico sea uno de los de precisión.
+
+    Raises:
+        ValueError: Si el backend no es uno de `PRECISE_BACKENDS`.
+    """
+    if backend not in PRECISE_BACKENDS:
+        raise ValueError(
+            f"Backend numerico invalido: '{backend}'. Opciones: float, "
+            f"{', '.join(PRECISE_BACKENDS)}."
+        )
+
+def _fraction_to_decimal(value: Fraction, context: Context) -> Decimal:
+    """Redondea una `Fraction` a `Decimal` con la precisión del contexto."""
+    return context.divide(Decimal(value.numerator), Decimal(value.denominator))
+
+def _apply(value, scale, offset, context: Context | None):
+    """
+    Aplica `valor * escala + desplazamiento` en `Fraction` o, con contexto, en `Decimal`.
+
+    Raises:
+        ValueError: Si el valor es una cadena que no representa un número.
+    """
+    if context is None:
+        return _exact(value) * scale + offset
+    if isinstance(value, Fraction):
+        value = _fraction_to_decimal(value, context)
+    elif isinstance(value, float):
+        value = repr(value)
+    try:
+        value = Decimal(value)
+    except InvalidOperation as e:
+        raise ValueError(f"Valor no numerico: {value!r}.") from e
+    return context.add(context.multiply(value, scale), offset)
+
+
+# ────────────────────── TABLAS POR BACKEND ──────────────────────
+@cache
+def _fraction_tables(dimension: str) -> ExactTables:
+    """
+    Construye, una sola vez por sistema, las matrices exactas de escala y
+    desplazamiento entre cada par de unidades: `destino = valor * escala + desplazamiento`.
+
+    Args:
+        dimension: Clave del sistema ('length', 'data', ...).
+
+    Returns:
+        ExactTables: ({unidad: posición}, escalas, desplazamientos).
+    """
+    units = _get_dimension(dimension).units
+    index = {unit.name: i for i, unit in enumerate(units)}
+    to_base = [(_exact(unit.factor), _exact(unit.offset)) for unit in units]
+    scales = tuple(
+        tuple(from_scale / to_scale for to_scale, _ in to_base)
+        for from_scale, _ in to_base
+    )
+    offsets = tuple(
+        tuple((from_offset - to_offset) / to_scale for to_scale, to_offset in to_base)
+        for _, from_offset in to_base
+    )
+    return index, scales, offsets
+
+@cache
+def _decimal_tables(dimension: str, precision: int, rounding: str) -> DecimalTables:
+    """
+    Redondea las matrices exactas de un sistema a `Decimal` con la precisión y el
+    modo de redondeo indicados. Se guarda una copia por cada contexto distinto.
+
+    Args:
+        dimension: Clave del sistema.
+        precision: Dígitos significativos del contexto.
+        rounding: Modo de redondeo del contexto (ej. `decimal.ROUND_HALF_EVEN`).
+
+    Returns:
+        DecimalTables: ({unidad: posición}, escalas, desplazamientos) en `Decimal`.
+    """
+    context = Context(prec=precision, rounding=rounding)
+
+    def to_decimal(value: Fraction) -> Decimal:
+        return _fraction_to_decimal(value, context)
+
+    index, scales, offsets = _fraction_tables(dimension)
+    return (
+        index,
+        tuple(tuple(map(to_decimal, row)) for row in scales),
+        tuple(tuple(map(to_decimal, row)) for row in offsets),
+    )
+
+
+# ────────────────────── API DE PRECISIÓN ──────────────────────
+def get_precise_coefficients(
+    dimension: str,
+    from_unit: str,
+    to_unit: str,
+    backend: str = "fraction",
+    context: Context | None = None
+) -> tuple[Fraction, Fraction] | tuple[Decimal, Decimal]:
+    """
+    Obtiene los coeficientes precalculados de una conversión en el backend indicado,
+    de forma que `destino = valor * escala + desplazamiento`.
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: 'decimal' o 'fraction'.
+        context: Contexto de `decimal` a usar. Por defecto, el contexto actual
+            (`decimal.getcontext()`, configurable con `decimal.localcontext()`).
+
+    Returns:
+        tuple: (escala, desplazamiento) del tipo numérico del backend.
+
+    Raises:
+        ValueError: Si el sistema, alguna unidad o el backend no es válido.
+    """
+    _check_backend(backend)
+    if backend == "fraction":
+        index, scales, offsets = _fraction_tables(dimension)
+    else:
+        context = context or getcontext()
+        index, scales, offsets = _decimal_tables(dimension, context.prec, context.rounding)
+
+    try:
+        i, j = index[from_unit], index[to_unit]
+    except KeyError as e:
+        raise ValueError(f"Unidad invalida: {e}.") from e
+    return scales[i][j], offsets[i][j]
+
+def get_precise_converter(
+    dimension: str,
+    from_unit: str,
+    to_unit: str,
+    backend: str = "fraction",
+    context: Context | None = None
+) -> Callable:
+    """
+    Devuelve una función especializada para un par de unidades y un backend fijos,
+    equivalente a `get_converter` pero en `Decimal` o `Fraction`.
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: 'decimal' o 'fraction'.
+        context: Contexto de `decimal` a usar (por defecto, una copia del contexto
+            actual al crear el conversor).
+
+    Returns:
+        Callable: Función que recibe un valor (número, `Decimal` o cadena) y devuelve
+        el valor convertido en el tipo del backend.
+
+    Raises:
+        ValueError: Si el sistema, alguna unidad o el backend no es válido.
+    """
+    if backend == "decimal":
+        context = context or getcontext().copy()
+    else:
+        context = None
+    scale, offset = get_precise_coefficients(dimension, from_unit, to_unit, backend, context)
+    return lambda value: _apply(value, scale, offset, context)
+
+def convert_precise(
+    dimension: str,
+    value,
+    from_unit: str,
+    to_unit: str,
+    backend: str = "fraction",
+    context: Context | None = None
+) -> Fraction | Decimal:
+    """
+    Convierte un valor entre dos unidades de un mismo sistema con el backend indicado.
+
+    Args:
+        dimension: Sistema de conversión ('length', 'mass', 'temperature', ...).
+        value: Valor a convertir (número, `Decimal` o cadena como '1.5').
+        from_unit: Unidad de origen (en minúsculas y formato interno).
+        to_unit: Unidad de destino (en minúsculas y formato interno).
+        backend: 'decimal' o 'fraction'.
+        context: Contexto de `decimal` a usar (por defecto, el contexto actual).
+
+    Returns:
+        El valor convertido como `Decimal` o `Fraction` según el backend.
+
+    Raises:
+        ValueError: Si el sistema, alguna unidad o el backend no es válido.
+    """
+    if backend == "decimal":
+        context = context or getcontext()
+    else:
+        context = None
+    scale, offset = get_precise_coefficients(dimension, from_unit, to_unit, backend, context)
+    return _apply(value, scale, offset, context)
@@ -0,0 +1,138 @@
+"""
+quantity_logic.py
+
+Analiza cantidades escritas como texto, por ejemplo "12.5 km/h" o "3 GiB": separa el
+valor de la unidad y resuelve la unidad con los alias del catálogo (los mismos que
+acepta la interfaz de consola) o, si es una expresión compuesta, con `compound_logic`.
+
+Las unidades ya resueltas se guardan en una caché LRU acotada, de modo que un flujo
+de registros que repite las mismas unidades no vuelve a analizarlas. La caché lleva
+contadores de aciertos y fallos.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from functools import lru_cache
+import re
+from typing import NamedTuple
+
+from logic.compound_logic import CompoundUnit, parse_unit
+from logic.unit_catalog import ALIAS_INDEX, SYMBOL_INDEX
+
+
+# ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
+UNIT_CACHE_SIZE = 1024      # Cadenas de unidad distintas que se guardan ya resueltas
+
+# Número (con signo, decimales con punto o coma y exponente) seguido de la unidad
+QUANTITY_PATTERN = re.compile(
+    r"^\s*([-+]?(?:\d[\d_]*(?:[.,]\d*)?|[.,]\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$"
+)
+
+
+# ────────────────────── ESTRUCTURAS ──────────────────────
+class ResolvedUnit(NamedTuple):
+    """
+    Unidad resuelta a partir de una cadena.
+
+    Attributes:
+        dimension (str | None): Clave del sistema ('speed', 'data', ...) si la unidad
+            es del catálogo, o None si es una expresión compuesta.
+        name (str | None): Nombre lógico de la unidad del catálogo, o None.
+        compound (CompoundUnit | None): Unidad reducida a dimensiones base si la
+            cadena es una expresión compuesta ('kWh/día'), o None.
+    """
+
+    dimension: str | None
+    name: str | None
+    compound: CompoundUnit | None = None
+
+class Quantity(NamedTuple):
+    """
+    Cantidad analizada: un valor y su unidad.
+
+    Attributes:
+        value (float): Valor numérico.
+        unit (str): Unidad tal como se escribió.
+        dimension (str | None): Clave del sistema de la unidad del catálogo.
+        name (str | None): Nombre lógico de la unidad del catálogo.
+        compound (CompoundUnit | None): Unidad compuesta reducida, si aplica.
+    """
+
+    value: float
+    unit: str
+    dimension: str | None
+    name: str | None
+    compound: CompoundUnit | None = None
+
+
+# ────────────────────── RESOLUCIÓN DE UNIDADES ──────────────────────
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def resolve_quantity_unit(unit: str) -> ResolvedUnit:
+    """
+    Resuelve una cadena de unidad. Primero se buscan los símbolos de datos que
+    distinguen mayúsculas ('GiB'), después los alias del catálogo ('km/h', 'pies') y,
+    por último, se analiza como expresión compuesta ('N·m', 'kWh/día').
+
+    Args:
+        unit: Unidad escrita por el usuario.
+
+    Returns:
+        ResolvedUnit: Sistema y nombre lógico, o la unidad compuesta reducida.
+
+    Raises:
+        ValueError: Si la unidad no existe ni es una expresión válida.
+    """
+    unit = unit.strip()
+    match = SYMBOL_INDEX.get(unit) or ALIAS_INDEX.get(unit.casefold())
+    if match is not None:
+        return ResolvedUnit(*match)
+    return ResolvedUnit(None, None, parse_unit(unit))
+
+def get_cache_stats() -> dict[str, int]:
+    """
+    Devuelve los contadores de la caché de unidades.
+
+    Returns:
+        dict[str, int]: {'hits', 'misses', 'size', 'maxsize'}.
+    """
+    info = resolve_quantity_unit.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+def clear_cache() -> None:
+    """Vacía la caché de unidades y reinicia sus contadores."""
+    resolve_quantity_unit.cache_clear()
+
+
+# ────────────────────── ANÁLISIS DE CANTIDADES ──────────────────────
+def parse_quantity(text: str) -> Quantity:
+    """
+    Separa el valor y la unidad de una cantidad escrita como texto y resuelve la
+    unidad. Acepta el número pegado a la unidad ("12km") y coma decimal ("12,5 km").
+
+    Args:
+        text: Cantidad a analizar (ej. "12.5 km/h", "3 GiB", "-40 f").
+
+    Returns:
+        Quantity: Valor, unidad escrita y su resolución en el catálogo.
+
+    Raises:
+        ValueError: Si el texto no empieza con un número, no tiene unidad o la
+            unidad no es válida.
+    """
+    match = QUANTITY_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"Cantidad invalida: '{text}'.")
+    number, unit = match.groups()
+    if not unit:
+        raise ValueError(f"Falta la unidad en la cantidad: '{text}'.")
+
+    value = float(number.replace(",", "."))
+    return Quantity(value, unit, *resolve_quantity_unit(unit))
@@ -0,0 +1,590 @@
+"""
+unit_catalog.py
+
+Catálogo único de sistemas de conversión y unidades. Define, para cada sistema, su
+unidad base y para cada unidad su factor de conversión, su nombre para mostrar y sus
+alias. La lógica de conversión, la interfaz de consola y la interfaz gráfica leen de
+este catálogo, por lo que agregar o corregir una unidad se hace en un solo lugar.
+
+El catálogo se construye una sola vez al importar el módulo y es inmutable: cada
+unidad y cada sistema son tuplas con nombre y los índices son `MappingProxyType`.
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+from fractions import Fraction
+from math import pi
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+
+# ────────────────────── ESTRUCTURAS DEL CATÁLOGO ──────────────────────
+class Unit(NamedTuple):
+    """
+    Unidad de medida dentro de un sistema de conversión.
+
+    Attributes:
+        name (str): Nombre lógico usado internamente (ej. 'metros').
+        factor (float): Factor hacia la unidad base del sistema. Puede ser `Fraction`
+            cuando el factor no tiene una representación decimal exacta. En sistemas
+            afines (temperatura) es la escala exacta de `base = valor * factor + offset`.
+        display (str): Nombre amigable para mostrar en las interfaces.
+        aliases (tuple[str, ...]): Alias que se aceptan al escribir la unidad.
+        offset (float): Desplazamiento hacia la unidad base (0 en sistemas lineales).
+    """
+
+    name: str
+    factor: float
+    display: str
+    aliases: tuple[str, ...] = ()
+    offset: float = 0.0
+
+class Dimension(NamedTuple):
+    """
+    Sistema de conversión con sus unidades.
+
+    Attributes:
+        key (str): Clave usada por la lógica y los comandos (ej. 'length').
+        system (str): Nombre del sistema en las interfaces (ej. 'LONGITUD').
+        base (str): Nombre lógico de la unidad base del sistema.
+        aliases (tuple[str, ...]): Alias que se aceptan al escribir el sistema.
+        units (tuple[Unit, ...]): Unidades del sistema en el orden de los menús.
+    """
+
+    key: str
+    system: str
+    base: str
+    aliases: tuple[str, ...]
+    units: tuple[Unit, ...]
+
+
+# ────────────────────── SISTEMAS DE CONVERSIÓN ──────────────────────
+TEMPERATURE = Dimension(
+    key="temperature",
+    system="TEMPERATURA",
+    base="celsius",
+    aliases=("tmp", "temp", "temperatura", "temperature", "temperaturas", "temperatures"),
+    units=(
+        Unit("celsius", Fraction(1), "Celsius", ("c", "celsius"), offset=Fraction(0)),
+        Unit("kelvin", Fraction(1), "Kelvin", ("k", "kelvin"), offset=Fraction("-273.15")),
+        Unit(
+            "fahrenheit", Fraction(5, 9), "Fahrenheit", ("f", "fahrenheit"),
+            offset=Fraction(-160, 9)
+        ),
+    ),
+)
+
+LENGTH = Dimension(
+    key="length",
+    system="LONGITUD",
+    base="metros",
+    aliases=("l", "len", "long", "longitud", "length", "distancia", "distances"),
+    units=(
+        Unit("angstroms", 1e-10, "Ángstroms", (
+            "å", "a", "an", "angstroms", "angstrom", "ångström", "ångströms"
+        )),
+        Unit("nanometros", 1e-9, "Nanómetros", (
+            "nm", "nanometro", "nanometros", "nanometer", "nanometers"
+        )),
+        Unit("micrones", 1e-6, "Micrones", (
+            "µm", "um", "micrometro", "micrometros", "micron", "microns", "micrometer",
+            "micrometers"
+        )),
+        Unit("milimetros", 1e-3, "Milímetros", (
+            "mm", "milimetro", "milimetros", "millimeter", "millimeters"
+        )),
+        Unit("centimetros", 1e-2, "Centímetros", (
+            "cm", "centimetro", "centimetros", "centimeter", "centimeters"
+        )),
+        Unit("metros", 1.0, "Metros", ("m", "metro", "meter", "metros", "meters")),
+        Unit("kilometros", 1e3, "Kilómetros", (
+            "km", "kilometro", "kilometros", "kilometer", "kilometers"
+        )),
+        Unit("pulgadas", 0.0254, "Pulgadas", ("in", "pulgada", "pulgadas", "inch", "inches")),
+        Unit("pies", 0.3048, "Pies", ("ft", "pie", "pies", "foot", "feet")),
+        Unit("yardas", 0.9144, "Yardas", ("yd", "yarda", "yardas", "yard", "yards")),
+        Unit("millas", 1609.344, "Millas", ("mi", "milla", "millas", "mile", "miles")),
+        Unit("millas_nauticas", 1852, "Millas Náuticas", (
+            "nmi", "milla nautica", "millas nauticas", "nautical mile", "nautical miles"
+        )),
+        Unit("unidad_astronomica", 1.495978707e11, "Unidades Astronómicas", (
+            "ua", "au", "unidad astronomica", "unidades astronomicas", "astronomical unit",
+            "astronomical units"
+        )),
+        Unit("anio_luz", 9.461e15, "Años Luz", (
+            "al", "ly", "año luz", "años luz", "light-year", "lightyear", "light-years",
+            "lightyears"
+        )),
+        Unit("parsec", 3.086e16, "Parsecs", ("pc", "parsec", "parsecs")),
+    ),
+)
+
+MASS = Dimension(
+    key="mass",
+    system="MASA",
+    base="gramos",
+    aliases=("mass", "masa", "peso", "weight", "m"),
+    units=(
+        Unit("miligramos", 1e-3, "Miligramos", (
+            "mg", "miligramo", "miligramos", "milligram", "milligrams"
+        )),
+        Unit("centigramos", 1e-2, "Centigramos", (
+            "cg", "centigramo", "centigramos", "centigram", "centigrams"
+        )),
+        Unit("decigramos", 1e-1, "Decigramos", (
+            "dg", "decigramo", "decigramos", "decigram", "decigrams"
+        )),
+        Unit("quilates", 0.2, "Quilates", (
+            "ct", "q", "qi", "quilate", "quilates", "carat", "carats"
+        )),
+        Unit("gramos", 1.0, "Gramos", ("g", "gr", "gramo", "gramos", "gram", "grams")),
+        Unit("decagramos", 1e1, "Decagramos", (
+            "dag", "decagramo", "decagramos", "decagram", "decagrams"
+        )),
+        Unit("hectogramos", 1e2, "Hectogramos", (
+            "hg", "hectogramo", "hectogramos", "hectogram", "hectograms"
+        )),
+        Unit("kilogramos", 1e3, "Kilogramos", (
+            "kg", "kilogramo", "kilogramos", "kilogram", "kilograms"
+        )),
+        Unit("toneladas_metricas", 1e6, "Toneladas Métricas", (
+            "t", "ton", "tonelada", "toneladas", "tonelada metrica", "toneladas metricas", "tonne",
+            "tonnes", "metric ton", "metric tons"
+        )),
+        Unit("onzas", 28.3495, "Onzas", ("oz", "onza", "onzas", "ounce", "ounces")),
+        Unit("libras", 453.592, "Libras", ("lb", "libra", "libras", "pound", "pounds")),
+        Unit("piedra", 6350.29, "Piedra", ("st", "piedra", "stone", "stones")),
+        Unit("toneladas_cortas_eeuu", 907185, "Toneladas Cortas (EEUU)", (
+            "tc", "ston", "tonelada corta", "toneladas cortas", "short ton", "short tons", "us ton",
+            "us tons"
+        )),
+        Unit("toneladas_largas_uk", 10160000, "Toneladas Largas (Reino Unido)", (
+            "lt", "tl", "tonelada larga", "toneladas largas", "long ton", "long tons", "uk ton",
+            "uk tons"
+        )),
+    ),
+)
+
+VOLUME = Dimension(
+    key="volume",
+    system="VOLUMEN",
+    base="mililitros",
+    aliases=("vol", "volumen", "volume"),
+    units=(
+        Unit("mililitros", 1.0, "Mililitros", (
+            "ml", "mililitro", "mililitros", "milliliter", "milliliters"
+        )),
+        Unit("centimetros_cubicos", 1.0, "Centímetros Cúbicos", (
+            "cm3", "cm^3", "centimetro cubico", "centimetros cubicos", "cubic centimeter",
+            "cubic centimeters"
+        )),
+        Unit("litros", 1e3, "Litros", ("l", "lt", "litro", "litros", "liter", "liters")),
+        Unit("metros_cubicos", 1e6, "Metros Cúbicos", (
+            "m3", "m^3", "metro cubico", "metros cubicos", "cubic meter", "cubic meters"
+        )),
+        Unit("cucharaditas_us", 4.92892, "Cucharaditas (US)", (
+            "tsp", "cucharadita", "cucharaditas", "teaspoon", "teaspoons", "us tsp", "us teaspoon"
+        )),
+        Unit("cucharadas_us", 14.7868, "Cucharadas (US)", (
+            "tbsp", "cucharada", "cucharadas", "tablespoon", "tablespoons", "us tbsp",
+            "us tablespoon"
+        )),
+        Unit("onzas_liquidas_us", 29.5735, "Onzas Líquidas (US)", (
+            "fl oz", "onza liquida", "onzas liquidas", "fluid ounce", "fluid ounces", "us fl oz",
+            "us fluid ounce"
+        )),
+        Unit("tazas_us", 236.588, "Tazas (US)", (
+            "cup", "taza", "tazas", "cups", "us cup", "us cups"
+        )),
+        Unit("pintas_us", 473.176, "Pintas (US)", (
+            "pt", "pinta", "pintas", "pint", "pints", "us pint", "us pints"
+        )),
+        Unit("cuartos_de_galon_us", 946.353, "Cuartos de Galón (US)", (
+            "qt", "cuarto de galon", "cuartos de galon", "quart", "quarts", "us qt", "us quart"
+        )),
+        Unit("galones_us", 3785.41, "Galones (US)", (
+            "gal", "galon", "galones", "gallon", "gallons", "us gal", "us gallon"
+        )),
+        Unit("pulgadas_cubicas", 16.3871, "Pulgadas Cúbicas", (
+            "in3", "in^3", "pulgada cubica", "pulgadas cubicas", "cubic inch", "cubic inches"
+        )),
+        Unit("pies_cubicos", 28316.8, "Pies Cúbicos", (
+            "ft3", "ft^3", "pie cubico", "pies cubicos", "cubic foot", "cubic feet"
+        )),
+        Unit("yardas_cubicas", 764555, "Yardas Cúbicas", (
+            "yd3", "yd^3", "yarda cubica", "yardas cubicas", "cubic yard", "cubic yards"
+        )),
+        Unit("cucharaditas_uk", 5.91939, "Cucharaditas (UK)", (
+            "uk tsp", "cucharadita uk", "cucharaditas uk", "uk teaspoon", "uk teaspoons"
+        )),
+        Unit("cucharadas_uk", 17.7582, "Cucharadas (UK)", (
+            "uk tbsp", "cucharada uk", "cucharadas uk", "uk tablespoon", "uk tablespoons"
+        )),
+        Unit("onzas_liquidas_uk", 28.4131, "Onzas Líquidas (UK)", (
+            "uk fl oz", "onza liquida uk", "onzas liquidas uk", "uk fluid ounce", "uk fluid ounces"
+        )),
+        Unit("pintas_uk", 568.261, "Pintas (UK)", (
+            "uk pt", "pinta uk", "pintas uk", "uk pint", "uk pints"
+        )),
+        Unit("cuartos_de_galon_uk", 1136.52, "Cuartos de Galón (UK)", (
+            "uk qt", "cuarto de galon uk", "cuartos de galon uk", "uk quart", "uk quarts"
+        )),
+        Unit("galones_uk", 4546.09, "Galones (UK)", (
+            "uk gal", "galon uk", "galones uk", "uk gallon", "uk gallons"
+        )),
+    ),
+)
+
+ENERGY = Dimension(
+    key="energy",
+    system="ENERGIA",
+    base="joules",
+    aliases=("e", "en", "eng", "energia", "energy", "nrg"),
+    units=(
+        Unit("joules", 1.0, "Joules", ("j", "joule", "joules")),
+        Unit("kilojulios", 1000, "Kilojulios", (
+            "kj", "kilojulio", "kilojulios", "kilojoule", "kilojoules"
+        )),
+        Unit("calorias_termales", 4.184, "Calorías Termales", (
+            "cal", "caloria termal", "calorias termales", "caloría termal", "calorías termales",
+            "thermal calorie", "thermal calories"
+        )),
+        Unit("calorias_alimentos", 4184, "Calorías de Alimentos", (
+            "kcal", "Cal", "caloria alimento", "calorias alimentos", "caloría alimento",
+            "calorías alimentos", "food calorie", "food calories", "kilocalorie", "kilocalories"
+        )),
+        Unit("pie_libras", 1.35582, "Pie-Libras", (
+            "ft-lb", "pie-libra", "pie-libras", "foot-pound", "foot-pounds"
+        )),
+        Unit("unidades_termicas_britanicas", 1055.06, "Unidades Térmicas Británicas", (
+            "btu", "unidad termica britanica", "unidades termicas britanicas",
+            "british thermal unit", "british thermal units"
+        )),
+        Unit("kilovatio_horas", 3.6e6, "Kilovatio-Horas", (
+            "kwh", "kw-h", "kilovatio hora", "kilovatio horas", "kilowatt-hour", "kilowatt-hours"
+        )),
+    ),
+)
+
+AREA = Dimension(
+    key="area",
+    system="AREA",
+    base="milimetros_cuadrados",
+    aliases=("area", "surface", "superficie"),
+    units=(
+        Unit("milimetros_cuadrados", 1.0, "Milímetros Cuadrados", (
+            "mm2", "mm^2", "milimetro cuadrado", "milimetros cuadrados", "square millimeter",
+            "square millimeters"
+        )),
+        Unit("centimetros_cuadrados", 100, "Centímetros Cuadrados", (
+            "cm2", "cm^2", "centimetro cuadrado", "centimetros cuadrados", "square centimeter",
+            "square centimeters"
+        )),
+        Unit("metros_cuadrados", 1e6, "Metros Cuadrados", (
+            "m2", "m^2", "metro cuadrado", "metros cuadrados", "square meter", "square meters"
+        )),
+        Unit("hectareas", 1e10, "Hectáreas", (
+            "ha", "hectarea", "hectareas", "hectare", "hectares"
+        )),
+        Unit("kilometros_cuadrados", 1e12, "Kilómetros Cuadrados", (
+            "km2", "km^2", "kilometro cuadrado", "kilometros cuadrados", "square kilometer",
+            "square kilometers"
+        )),
+        Unit("pulgadas_cuadradas", 645.16, "Pulgadas Cuadradas", (
+            "in2", "in^2", "pulgada cuadrada", "pulgadas cuadradas", "square inch", "square inches"
+        )),
+        Unit("pies_cuadrados", 92903, "Pies Cuadrados", (
+            "ft2", "ft^2", "pie cuadrado", "pies cuadrados", "square foot", "square feet"
+        )),
+        Unit("yardas_cuadradas", 836127, "Yardas Cuadradas", (
+            "yd2", "yd^2", "yarda cuadrada", "yardas cuadradas", "square yard", "square yards"
+        )),
+        Unit("acres", 4046856422.4, "Acres", ("ac", "acre", "acres")),
+        Unit("millas_cuadradas", 2589988110336, "Millas Cuadradas", (
+            "mi2", "mi^2", "milla cuadrada", "millas cuadradas", "square mile", "square miles"
+        )),
+    ),
+)
+
+SPEED = Dimension(
+    key="speed",
+    system="VELOCIDAD",
+    base="centimetros_por_segundo",
+    aliases=("vel", "velocidad", "speed", "velocity"),
+    units=(
+        Unit("centimetros_por_segundo", 1.0, "Centímetros por Segundo", (
+            "cm/s", "cmps", "centimetro por segundo", "centimetros por segundo",
+            "centimeter per second", "centimeters per second"
+        )),
+        Unit("metros_por_segundo", 100, "Metros por Segundo", (
+            "m/s", "mps", "metro por segundo", "metros por segundo", "meter per second",
+            "meters per second"
+        )),
+        Unit("kilometros_por_hora", Fraction(250, 9), "Kilómetros por Hora", (
+            "km/h", "kph", "kilometro por hora", "kilometros por hora", "kilometer per hour",
+            "kilometers per hour"
+        )),
+        Unit("pies_por_segundo", 30.48, "Pies por Segundo", (
+            "ft/s", "fps", "pie por segundo", "pies por segundo", "foot per second",
+            "feet per second"
+        )),
+        Unit("millas_por_hora", 44.706, "Millas por Hora", (
+            "mph", "milla por hora", "millas por hora", "mile per hour", "miles per hour"
+        )),
+        Unit("nudos", 51.4444, "Nudos", ("kn", "kt", "nudo", "nudos", "knot", "knots")),
+        Unit("mach", 34029, "Mach", ("mach", "ma")),
+    ),
+)
+
+TIME = Dimension(
+    key="time",
+    system="TIEMPO",
+    base="microsegundos",
+    aliases=("time", "tiempo", "duracion", "duration"),
+    units=(
+        Unit("microsegundos", 1.0, "Microsegundos", (
+            "µs", "us", "microsegundo", "microsegundos", "microsecond", "microseconds"
+        )),
+        Unit("milisegundos", 1000, "Milisegundos", (
+            "ms", "milisegundo", "milisegundos", "millisecond", "milliseconds"
+        )),
+        Unit("segundos", 1e6, "Segundos", ("s", "segundo", "segundos", "second", "seconds")),
+        Unit("minutos", 6e7, "Minutos", ("min", "minuto", "minutos", "minute", "minutes")),
+        Unit("horas", 3.6e9, "Horas", ("h", "hr", "hora", "horas", "hour", "hours")),
+        Unit("dias", 8.64e10, "Días", ("d", "dia", "dias", "day", "days")),
+        Unit("semanas", 6.048e11, "Semanas", ("wk", "semana", "semanas", "week", "weeks")),
+        Unit("años", 3.1536e13, "Años", ("yr", "año", "años", "year", "years")),
+    ),
+)
+
+POWER = Dimension(
+    key="power",
+    system="POTENCIA",
+    base="vatios",
+    aliases=("pow", "potencia", "power"),
+    units=(
+        Unit("vatios", 1.0, "Vatios", ("w", "vatio", "vatios", "watt", "watts")),
+        Unit("kilovatios", 1e3, "Kilovatios", (
+            "kw", "kilovatio", "kilovatios", "kilowatt", "kilowatts"
+        )),
+        Unit("caballos_de_fuerza_eeuu", 745.7, "Caballos de Fuerza (EEUU)", (
+            "hp", "caballo de fuerza", "caballos de fuerza", "horsepower", "us hp"
+        )),
+        Unit("pie_libras_por_minuto", 0.02259698059, "Pie-Libras/Minuto", (
+            "ft-lb/min", "pie-libra por minuto", "pie-libras por minuto", "foot-pound per minute",
+            "foot-pounds per minute"
+        )),
+        Unit(
+            "unidades_termicas_britanicas_por_minuto", 17.58427263,
+            "Unidades Térmicas Británicas/Minuto",
+            (
+                "btu/min", "unidad termica britanica por minuto",
+                "unidades termicas britanicas por minuto", "british thermal unit per minute",
+                "british thermal units per minute"
+            )
+        ),
+    ),
+)
+
+ANGLE = Dimension(
+    key="angle",
+    system="ANGULOS",
+    base="grados",
+    aliases=("ang", "angulo", "angulos", "angle", "angles"),
+    units=(
+        Unit("grados", 1.0, "Grados", ("°", "deg", "grado", "grados", "degree", "degrees")),
+        Unit("radianes", 180 / pi, "Radianes", ("rad", "radian", "radianes", "radian", "radians")),
+        Unit("grados_centesimales", 0.9, "Grados Centesimales", (
+            "gon", "grad", "gradian", "gradianes", "grado centesimal", "grados centesimales"
+        )),
+    ),
+)
+
+PRESSURE = Dimension(
+    key="pressure",
+    system="PRESION",
+    base="atmosferas",
+    aliases=("pres", "pressure", "presion"),
+    units=(
+        Unit("atmosferas", 1.0, "Atmósferas", (
+            "atm", "atmosfera", "atmosferas", "atmosphere", "atmospheres"
+        )),
+        Unit("bares", 0.9869232667, "Bares", ("bar", "bares")),
+        Unit("kilopascales", 0.009869232667, "Kilopascales", (
+            "kpa", "kilopascal", "kilopascales", "kilopascal", "kilopascals"
+        )),
+        Unit("milimetros_de_mercurio", 0.001315789474, "Milímetros de Mercurio", (
+            "mmhg", "milimetro de mercurio", "milimetros de mercurio", "millimeter of mercury",
+            "millimeters of mercury"
+        )),
+        Unit("pascales", 9.869232667e-06, "Pascales", ("pa", "pascal", "pascales")),
+        Unit("libras_por_pulgada_cuadrada", 0.06804618975, "Libras por Pulgada Cuadrada", (
+            "psi", "libra por pulgada cuadrada", "libras por pulgada cuadrada",
+            "pound per square inch", "pounds per square inch"
+        )),
+    ),
+)
+
+DATA = Dimension(
+    key="data",
+    system="DATOS",
+    base="bits",
+    aliases=("data", "datos", "bytes", "bits"),
+    units=(
+        Unit("bits", 1.0, "Bits", ("bit", "bits")),
+        Unit("cuarteto", 4, "Cuarteto (Nibble)", ("nibble", "nibbles", "cuarteto", "cuartetos")),
+        Unit("bytes", 8, "Bytes", ("byte", "bytes")),
+        Unit("kilobits", 1000, "Kilobits", ("kb", "kilobit", "kilobits")),
+        Unit("kibibits", 1024, "Kibibits", ("kib", "kibibit", "kibibits")),
+        Unit("kilobytes", 8000, "Kilobytes", ("kb", "kilobyte", "kilobytes")),
+        Unit("kibibytes", 8192, "Kibibytes", ("kib", "kibibyte", "kibibytes")),
+        Unit("megabits", 1e6, "Megabits", ("mb", "megabit", "megabits")),
+        Unit("mebibits", 1_048_576, "Mebibits", ("mib", "mebibit", "mebibits")),
+        Unit("megabytes", 8e6, "Megabytes", ("mb", "megabyte", "megabytes")),
+        Unit("mebibytes", 8_388_608, "Mebibytes", ("mib", "mebibyte", "mebibytes")),
+        Unit("gigabits", 1e9, "Gigabits", ("gb", "gigabit", "gigabits")),
+        Unit("gibibits", 1_073_741_824, "Gibibits", ("gib", "gibibit", "gibibits")),
+        Unit("gigabytes", 8e9, "Gigabytes", ("gb", "gigabyte", "gigabytes")),
+        Unit("gibibytes", 8_589_934_592, "Gibibytes", ("gib", "gibibyte", "gibibytes")),
+        Unit("terabits", 1e12, "Terabits", ("tb", "terabit", "terabits")),
+        Unit("tebibits", 1_099_511_627_776, "Tebibits", ("tib", "tebibit", "tebibits")),
+        Unit("terabytes", 8e12, "Terabytes", ("tb", "terabyte", "terabytes")),
+        Unit("tebibytes", 8_796_093_022_208, "Tebibytes", ("tib", "tebibyte", "tebibytes")),
+        Unit("petabits", 1e15, "Petabits", ("pb", "petabit", "petabits")),
+        Unit("pebibits", 1_125_899_906_842_624, "Pebibits", ("pib", "pebibit", "pebibits")),
+        Unit("petabytes", 8e15, "Petabytes", ("pb", "petabyte", "petabytes")),
+        Unit("pebibytes", 9_007_199_254_740_992, "Pebibytes", ("pib", "pebibyte", "pebibytes")),
+        Unit("exabits", 1e18, "Exabits", ("eb", "exabit", "exabits")),
+        Unit("exbibits", 1_152_921_504_606_846_976, "Exbibits", ("eib", "exbibit", "exbibits")),
+        Unit("exabytes", 8e18, "Exabytes", ("eb", "exabyte", "exabytes")),
+        Unit("exbibytes", 9_223_372_036_854_775_808, "Exbibytes", ("eib", "exbibyte", "exbibytes")),
+        Unit("zettabits", 1e21, "Zettabits", ("zb", "zettabit", "zettabits")),
+        Unit("zebibits", 1_180_591_620_717_411_303_424, "Zebibits", ("zib", "zebibit", "zebibits")),
+        Unit("zettabytes", 8e21, "Zettabytes", ("zb", "zettabyte", "zettabytes")),
+        Unit("zebibytes", 9_444_732_965_739_290_427_392, "Zebibytes", (
+            "zib", "zebibyte", "zebibytes"
+        )),
+        Unit("yottabits", 1e24, "Yottabits", ("yb", "yottabit", "yottabits")),
+        Unit("yobibits", 1_208_925_819_614_629_174_706_176, "Yobibits", (
+            "yib", "yobibit", "yobibits"
+        )),
+        Unit("yottabytes", 8e24, "Yottabytes", ("yb", "yottabyte", "yottabytes")),
+        Unit("yobibytes", 9_671_406_556_917_033_397_649_408, "Yobibytes", (
+            "yib", "yobibyte", "yobibytes"
+        )),
+    ),
+)
+
+
+# ────────────────────── ÍNDICES DEL CATÁLOGO ──────────────────────
+# Sistemas en el orden de los menús
+CATALOG = (
+    TEMPERATURE, LENGTH, MASS, VOLUME, ENERGY, AREA, SPEED, TIME, POWER, ANGLE, PRESSURE, DATA
+)
+DIMENSIONS = MappingProxyType({dimension.key: dimension for dimension in CATALOG})
+SYSTEMS = MappingProxyType({dimension.system: dimension for dimension in CATALOG})
+
+# Índice global de alias sin distinguir mayúsculas: {alias: (sistema, unidad)}.
+# Si un alias se repite entre unidades, gana la primera en el orden de los menús.
+def _build_alias_index() -> dict[str, tuple[str, str]]:
+    """Indexa cada unidad del catálogo por su nombre lógico y sus alias en minúsculas."""
+    index = {}
+    for dimension in CATALOG:
+        for unit in dimension.units:
+            for alias in (unit.name, *unit.aliases):
+                index.setdefault(alias.casefold(), (dimension.key, unit.name))
+    return index
+
+ALIAS_INDEX = MappingProxyType(_build_alias_index())
+
+# Símbolos de datos que sí distinguen mayúsculas: 'b' es bit y 'B' es byte
+# ('MB' megabytes, 'Mb' megabits, 'KiB' kibibytes). Se consultan antes que `ALIAS_INDEX`
+# (y antes que los alias de los menús de consola), por eso 'b' no es alias de bytes.
+# Además de 'kB'/'kb' (SI) se aceptan 'KB'/'Kb', la escritura más común de kilo en datos;
+# sin ellos 'KB' caería en el alias 'kb', que es de kilobits.
+_DATA_PREFIXES = (
+    ("k", "kilo", "kibi"), ("M", "mega", "mebi"), ("G", "giga", "gibi"),
+    ("T", "tera", "tebi"), ("P", "peta", "pebi"), ("E", "exa", "exbi"),
+    ("Z", "zetta", "zebi"), ("Y", "yotta", "yobi"),
+)
+SYMBOL_INDEX = MappingProxyType({
+    "b": (DATA.key, "bits"),
+    "B": (DATA.key, "bytes"),
+    "Kb": (DATA.key, "kilobits"),
+    "KB": (DATA.key, "kilobytes"),
+    **{
+        f"{symbol}{suffix}": (DATA.key, f"{decimal}{kind}")
+        for symbol, decimal, _ in _DATA_PREFIXES
+        for suffix, kind in (("b", "bits"), ("B", "bytes"))
+    },
+    **{
+        f"{symbol.upper()}i{suffix}": (DATA.key, f"{binary}{kind}")
+        for symbol, _, binary in _DATA_PREFIXES
+        for suffix, kind in (("b", "bits"), ("B", "bytes"))
+    },
+})
+
+# Mapas bidireccionales entre nombre lógico y nombre para mostrar, por sistema
+DISPLAY_NAMES = MappingProxyType({
+    dimension.key: MappingProxyType({unit.name: unit.display for unit in dimension.units})
+    for dimension in CATALOG
+})
+LOGICAL_NAMES = MappingProxyType({
+    dimension.key: MappingProxyType({unit.display: unit.name for unit in dimension.units})
+    for dimension in CATALOG
+})
+
+
+# ────────────────────── FUNCIONES DE CONSULTA ──────────────────────
+def get_dimension(name: str) -> Dimension:
+    """
+    Obtiene un sistema del catálogo por su clave ('length') o su nombre ('LONGITUD').
+
+    Args:
+        name: Clave o nombre del sistema.
+
+    Returns:
+        Dimension: Sistema de conversión encontrado.
+
+    Raises:
+        ValueError: Si el sistema no existe en el catálogo.
+    """
+    dimension = DIMENSIONS.get(name) or SYSTEMS.get(name.upper())
+    if dimension is None:
+        raise ValueError(f"Sistema invalido: '{name}'.")
+    return dimension
+
+def get_display_names(name: str) -> Mapping[str, str]:
+    """
+    Obtiene los nombres para mostrar de las unidades de un sistema, en el orden de
+    los menús. El mapa se construye una sola vez al importar el catálogo.
+
+    Args:
+        name: Clave o nombre del sistema.
+
+    Returns:
+        Mapping[str, str]: {unidad_logica: "Unidad Amigable"} de solo lectura.
+
+    Raises:
+        ValueError: Si el sistema no existe en el catálogo.
+    """
+    return DISPLAY_NAMES[get_dimension(name).key]
+
+def get_logical_names(name: str) -> Mapping[str, str]:
+    """
+    Obtiene el mapa inverso de `get_display_names`: del nombre para mostrar al
+    nombre lógico que usan las funciones de conversión.
+
+    Args:
+        name: Clave o nombre del sistema.
+
+    Returns:
+        Mapping[str, str]: {"Unidad Amigable": unidad_logica} de solo lectura.
+
+    Raises:
+        ValueError: Si el sistema no existe en el catálogo.
+    """
+    return LOGICAL_NAMES[get_dimension(name).key]
@@ -10,14 +10,16 @@ Versión: 1.0
 
 
 # ────────────────────── IMPORTACIONES ──────────────────────
+import os
 import sys
 import logging
+from importlib import import_module
 
-from colorama import Fore, Style, init
+from interfaces.terminal import load_colors
 
 
 # ────────────────────── VARIABLES GLOBALES / CONFIGURACION ──────────────────────
-init(autoreset=True)    # Inicializa Colorama con autoreset en cada impresión
+Fore, Style = load_colors(sys.stderr)   # Colorama solo se carga si hay una terminal
 BOLD = Style.BRIGHT     # Atajo para aplicar estilo de negritas
 
 
@@ -54,12 +56,91 @@ formatter = ColorFormatter("%(levelname)s: %(message)s")
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
+# Comandos no interactivos: nombre -> módulo que implementa `start_interface(argv)`
+COMMANDS = {
+    "convert": "interfaces.interfaz_bulk",
+    "convert-binary": "interfaces.interfaz_binary",
+    "convert-parquet": "interfaces.interfaz_arrow",
+    "serve": "interfaces.interfaz_server",
+    "worker": "interfaces.interfaz_worker",
+}
+
+# Instrumentación: "1" muestra un resumen al salir; cualquier otro valor es la ruta
+# del archivo donde se guardan las métricas en formato de Prometheus
+METRICS_ENV = "CONVERSOR_METRICS"
+
 # ────────────────────── FUNCIONES AUXILIARES ──────────────────────
 def _enter_to_continue() -> None:
     """Pausa la ejecución hasta que el usuario presione Enter."""
     input(f"{Fore.YELLOW}Presione enter para continuar...\n")
 
 
+def _get_command() -> str | None:
+    """
+    Obtiene el comando no interactivo solicitado por consola, si existe.
+
+    Returns:
+        str | None: Nombre del comando o None si se debe iniciar una interfaz interactiva.
+    """
+    if len(sys.argv) < 2:
+        return None
+    command = sys.argv[1].strip().lower()
+    return command if command in COMMANDS else None
+
+
+def _run_command(command: str) -> int:
+    """
+    Ejecuta un comando no interactivo con el resto de argumentos de la consola.
+
+    Args:
+        command: Nombre del comando registrado en `COMMANDS`.
+
+    Returns:
+        int: Código de salida del comando.
+    """
+    try:
+        module = import_module(COMMANDS[command])
+    except ImportError as e:
+        logger.error("No se pudo cargar el módulo: %s", e)
+        return 1
+    try:
+        return module.start_interface(sys.argv[2:])
+    except KeyboardInterrupt:
+        logger.warning("Ejecución interrumpida por el usuario.")
+        return 130
+
+
+def _enable_metrics() -> str | None:
+    """
+    Activa la instrumentación de conversiones si la variable METRICS_ENV lo indica.
+    Debe llamarse antes de importar las interfaces.
+
+    Returns:
+        str | None: Destino de las métricas ('1' o una ruta), o None si están desactivadas.
+    """
+    target = os.environ.get(METRICS_ENV, "").strip()
+    if target in ("", "0"):
+        return None
+    # pylint: disable=import-outside-toplevel
+    from logic import metrics_logic
+    metrics_logic.enable()
+    return target
+
+
+def _report_metrics(target: str) -> None:
+    """Muestra el resumen de métricas o lo guarda en el archivo indicado."""
+    # pylint: disable=import-outside-toplevel
+    from logic import metrics_logic
+    if target == "1":
+        logger.info("Métricas de conversión:\n%s", metrics_logic.format_summary())
+        return
+    try:
+        metrics_logic.write_snapshot(target)
+        logger.info("Métricas guardadas en %s", target)
+    except OSError as e:
+        logger.error("No se pudieron guardar las métricas: %s", e)
+
+
 def _get_ui_mode() -> bool:
     """
     Determina el modo de interfaz a usar (CLI o GUI) según argumentos por consola.
@@ -84,8 +165,12 @@ def _get_ui_mode() -> bool:
 
 
 # ────────────────────── FUNCIÓN PRINCIPAL ──────────────────────
-def main() -> None:
-    """Punto de entrada principal de la aplicación."""
+def _run() -> None:
+    """Ejecuta el comando no interactivo o la interfaz elegida."""
+    command = _get_command()
+    if command is not None:
+        sys.exit(_run_command(command))
+
     ui_mode = _get_ui_mode()
 
     # pylint: disable=broad-except
@@ -111,6 +196,16 @@ def main() -> None:
         _enter_to_continue()
 
 
+def main() -> None:
+    """Punto de entrada principal de la aplicación."""
+    metrics_target = _enable_metrics()
+    try:
+        _run()
+    finally:
+        if metrics_target is not None:
+            _report_metrics(metrics_target)
+
+
 # ────────────────────── PUNTO DE EJECUCIÓN ──────────────────────
 if __name__ == "__main__":
     main()
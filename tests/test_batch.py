@@ -0,0 +1,55 @@
+"""
+test_batch.py
+
+Pruebas de la conversión por lotes (`batch_logic`): tipos de entrada y validación del
+buffer de salida.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import sys
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic import batch_logic
+from logic.batch_logic import convert_batch
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+class ConvertBatchTest(unittest.TestCase):
+    """Pruebas de `convert_batch`."""
+
+    def test_list_and_array(self):
+        self.assertEqual(convert_batch("temperature", [0, 100], "celsius", "kelvin"),
+                         [273.15, 373.15])
+        result = convert_batch("length", array("d", [1.0]), "kilometros", "metros")
+        self.assertEqual(result.tolist(), [1000.0])
+
+    def test_integer_array_out_is_rejected(self):
+        with self.assertRaises(ValueError):
+            convert_batch("length", array("d", [1.0]), "metros", "pies", out=array("i", [0]))
+
+    @unittest.skipIf(batch_logic.np is None, "NumPy no está instalado")
+    def test_numpy_out(self):
+        np = batch_logic.np
+        values = np.arange(3.0)
+        out = np.empty(3)
+        self.assertIs(convert_batch("length", values, "metros", "centimetros", out=out), out)
+        self.assertEqual(out.tolist(), [0.0, 100.0, 200.0])
+        for bad in (np.empty(3, dtype=np.int64), [0, 0, 0], np.empty(2)):
+            with self.subTest(bad=bad), self.assertRaises(ValueError):
+                convert_batch("length", values, "metros", "pies", out=bad)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+test_bulk.py
+
+Pruebas de la conversión masiva de CSV (`interfaz_bulk`): el modo paralelo produce la
+misma salida y, en modo estricto, informa la misma fila que el modo de un solo proceso.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from interfaces.interfaz_bulk import InvalidRowError, convert_file_parallel, convert_stream
+from logic.conversion_logic import get_converter
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+CONVERSION = ("length", "metros", "pies")
+
+
+class BulkModesTest(unittest.TestCase):
+    """Concordancia entre el modo de un solo proceso y el paralelo."""
+
+    def _write_csv(self, values: list[str]) -> str:
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8", newline="") as file:
+            file.write("id,valor\n")
+            file.writelines(f"{i},{value}\n" for i, value in enumerate(values))
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def _serial(self, path: str, strict: bool) -> tuple[str, dict[str, int]]:
+        output = io.StringIO()
+        with open(path, encoding="utf-8", newline="") as source:
+            stats = convert_stream(
+                source, output, get_converter(*CONVERSION), "valor", strict=strict
+            )
+        return output.getvalue(), stats
+
+    def _parallel(self, path: str, strict: bool) -> tuple[str, dict[str, int]]:
+        output = io.StringIO()
+        stats = convert_file_parallel(
+            path, output, CONVERSION, "valor", strict=strict, workers=2, chunk_size=256
+        )
+        return output.getvalue(), stats
+
+    def test_same_output(self):
+        path = self._write_csv([str(i / 4) for i in range(500)] + ["abc"])
+        self.assertEqual(self._serial(path, False), self._parallel(path, False))
+
+    def test_strict_reports_the_same_row(self):
+        values = [str(i) for i in range(500)]
+        values[321] = "abc"
+        path = self._write_csv(values)
+        rows = []
+        for run in (self._serial, self._parallel):
+            with self.assertRaises(InvalidRowError) as raised:
+                run(path, True)
+            rows.append(raised.exception.row)
+        self.assertEqual(rows, [322, 322])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+test_compound.py
+
+Pruebas del motor de unidades compuestas (`compound_logic`): análisis de expresiones
+con sus distintos separadores y exponentes, conversión genérica y errores.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import sys
+import unittest
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic.compound_logic import convert, format_vector, get_conversion, parse_unit
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+VELOCITY = (1, 0, -1, 0, 0, 0)
+FORCE = (1, 1, -2, 0, 0, 0)
+
+
+class ParseUnitTest(unittest.TestCase):
+    """Pruebas de `parse_unit`."""
+
+    def test_product_separators(self):
+        for expression in ("kg·m/s²", "kg*m/s^2", "kg⋅m/s2", "kg m/s^2", "kg  m  s^-2"):
+            with self.subTest(expression):
+                unit = parse_unit(expression)
+                self.assertEqual((unit.vector, unit.scale), (FORCE, 1))
+
+    def test_space_separated_products(self):
+        self.assertEqual(parse_unit("m s^-1").vector, VELOCITY)
+        self.assertEqual(parse_unit("km h^-1").scale, Fraction(5, 18))
+        self.assertEqual(parse_unit("N m"), parse_unit("N·m"))
+
+    def test_multi_word_aliases_are_not_split(self):
+        self.assertEqual(parse_unit("metros por segundo"), parse_unit("m/s"))
+
+    def test_accents_and_exponents(self):
+        self.assertEqual(parse_unit("kWh/día"), parse_unit("kWh/dia"))
+        self.assertEqual(parse_unit("m³").vector, parse_unit("m^3").vector)
+
+    def test_invalid_expressions(self):
+        for expression in ("", "m x", "pulgas/s", "m s^"):
+            with self.subTest(expression), self.assertRaises(ValueError):
+                parse_unit(expression)
+
+
+class ConvertTest(unittest.TestCase):
+    """Pruebas de la conversión genérica."""
+
+    def test_compound_conversions(self):
+        self.assertEqual(convert(36, "km h^-1", "m/s"), 10.0)
+        self.assertEqual(convert(1, "N m", "J"), 1.0)
+        self.assertAlmostEqual(convert(24, "kWh/día", "W"), 1000.0)
+
+    def test_temperature_uses_offsets(self):
+        self.assertEqual(get_conversion("celsius", "fahrenheit"), (1.8, 32.0))
+
+    def test_incompatible_units(self):
+        with self.assertRaisesRegex(ValueError, "incompatibles"):
+            convert(1, "m/s", "kg")
+        self.assertEqual(format_vector(VELOCITY), "L·T^-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
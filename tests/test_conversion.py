@@ -0,0 +1,51 @@
+"""
+test_conversion.py
+
+Pruebas de las funciones `convert_*` de `conversion_logic`: valores conocidos y
+concordancia con los conversores de `get_converter`.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import itertools
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic.conversion_logic import TEMPERATURE_INDEX, convert_temperature, get_converter
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+class TemperatureTest(unittest.TestCase):
+    """Pruebas de `convert_temperature`."""
+
+    def test_known_values(self):
+        self.assertEqual(convert_temperature(100, "celsius", "fahrenheit"), 212.0)
+        self.assertEqual(convert_temperature(-40, "fahrenheit", "celsius"), -40.0)
+        self.assertEqual(convert_temperature(0, "kelvin", "celsius"), -273.15)
+
+    def test_matches_get_converter(self):
+        for from_unit, to_unit in itertools.product(TEMPERATURE_INDEX, repeat=2):
+            converter = get_converter("temperature", from_unit, to_unit)
+            for value in (-459.67, -40.0, 0.1, 36.6, 1e6):
+                with self.subTest(from_unit=from_unit, to_unit=to_unit, value=value):
+                    self.assertEqual(
+                        convert_temperature(value, from_unit, to_unit), converter(value)
+                    )
+
+    def test_invalid_unit(self):
+        with self.assertRaises(ValueError):
+            convert_temperature(1, "celsius", "rankine")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+test_conversion_chain.py
+
+Pruebas de `conversion_logic.get_chain_coefficients`: composición exacta de los pasos
+y validación de su formato.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic.conversion_logic import compile_chain, get_chain_coefficients
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+class ChainCoefficientsTest(unittest.TestCase):
+    """Pruebas de los coeficientes de una cadena de conversiones."""
+
+    def test_celsius_kelvin_fahrenheit_is_exact(self):
+        steps = [("temperature", "celsius", "kelvin"), ("temperature", "kelvin", "fahrenheit")]
+        self.assertEqual(get_chain_coefficients(steps), (1.8, 32.0))
+        self.assertEqual(compile_chain(steps)(100.0), 212.0)
+
+    def test_numeric_steps_are_composed(self):
+        steps = [("length", "kilometros", "metros"), 0.5, (2, 1)]
+        self.assertEqual(get_chain_coefficients(steps), (1000.0, 1.0))
+
+    def test_invalid_steps_name_the_step(self):
+        for step in (("length", "metros", "x"), ("length", 1, "pies"), (1, "a"), True):
+            with self.subTest(step=step):
+                with self.assertRaisesRegex(ValueError, "Paso de cadena invalido"):
+                    get_chain_coefficients([step])
+
+    def test_discontinuous_chain(self):
+        steps = [("length", "metros", "pies"), ("length", "metros", "pies")]
+        with self.assertRaisesRegex(ValueError, "Cadena discontinua"):
+            get_chain_coefficients(steps)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+test_humanize.py
+
+Pruebas de la elección de la unidad más legible (`humanize_logic`): límites de los
+umbrales de cada escala, prefijos SI e IEC, valores especiales y errores.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic.humanize_logic import HumanValue, format_human, humanize
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+class ThresholdsTest(unittest.TestCase):
+    """Valores justo en los umbrales de la búsqueda binaria y a cada lado."""
+
+    def test_data_boundaries(self):
+        cases = [
+            ((7.999, "bits", "si"), "bits"),
+            ((8, "bits", "si"), "bytes"),
+            ((999, "bytes", "si"), "bytes"),
+            ((1000, "bytes", "si"), "kilobytes"),
+            ((1023, "bytes", "iec"), "bytes"),
+            ((1024, "bytes", "iec"), "kibibytes"),
+            ((1024, "kibibytes", "iec"), "mebibytes"),
+            ((8.3e21, "bits", "iec"), "exbibytes"),
+            ((8.3e21, "bits", "si"), "zettabytes"),
+        ]
+        for (value, unit, system), expected in cases:
+            with self.subTest(value=value, unit=unit, system=system):
+                self.assertEqual(humanize(value, "data", unit, system).unit, expected)
+
+    def test_exact_values_at_thresholds(self):
+        self.assertEqual(humanize(1000, "pressure", "pascales").value, 1.0)
+        self.assertEqual(humanize(60, "time", "segundos"), HumanValue(1.0, "minutos", "Minutos"))
+        self.assertEqual(humanize(59.999, "time", "segundos").unit, "segundos")
+        self.assertEqual(humanize(5.4e9, "time", "microsegundos").value, 1.5)
+
+    def test_extremes_clamp_to_the_scale(self):
+        self.assertEqual(humanize(0.2, "length", "angstroms").unit, "nanometros")
+        self.assertEqual(humanize(1e30, "length", "metros").unit, "kilometros")
+
+    def test_negative_values_use_absolute_value(self):
+        self.assertEqual(humanize(-90, "time", "segundos"), HumanValue(-1.5, "minutos", "Minutos"))
+
+
+class SpecialValuesTest(unittest.TestCase):
+    """Cero, valores no finitos, formato y errores."""
+
+    def test_zero_and_non_finite_keep_the_unit(self):
+        self.assertEqual(humanize(0, "data", "gigabytes").unit, "gigabytes")
+        self.assertEqual(humanize(math.inf, "time", "horas").unit, "horas")
+        self.assertTrue(math.isnan(humanize(math.nan, "time", "horas").value))
+
+    def test_iec_falls_back_to_si_outside_data(self):
+        self.assertEqual(humanize(1500, "length", "metros", "iec").unit, "kilometros")
+
+    def test_format_human(self):
+        self.assertEqual(format_human(1.5 * 2 ** 30, "data", "bytes", "iec"), "1.50 Gibibytes")
+        self.assertEqual(format_human(1234, "length", "metros", digits=1), "1.2 Kilómetros")
+
+    def test_errors(self):
+        for args in ((1, "temperature", "celsius"), (1, "data", "x"), (1, "data", "bits", "bin")):
+            with self.subTest(args=args), self.assertRaises(ValueError):
+                humanize(*args)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+test_memo.py
+
+Pruebas de la caché de resultados (`memo_logic`): política LRU, claves por backend y
+contexto de `decimal`, instalación y restauración de `convert_precise`.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import sys
+import unittest
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic import conversion_logic, memo_logic
+from logic.memo_logic import MemoCache
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+class MemoCacheTest(unittest.TestCase):
+    """Pruebas de la caché LRU."""
+
+    def test_hits_misses_and_evictions(self):
+        cache = MemoCache(maxsize=2)
+        calls = []
+
+        def compute(value):
+            calls.append(value)
+            return value * 2
+
+        for key in (1, 2, 1, 3, 2):     # 3 desaloja a 2 (el menos usado), no a 1
+            cache.get_or_compute(key, compute, key)
+        self.assertEqual(calls, [1, 2, 3, 2])
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 4, 2))
+        self.assertEqual(stats["size"], 2)
+
+    def test_errors_are_not_cached(self):
+        cache = MemoCache()
+
+        def fail():
+            raise ValueError("fallo")
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.get_or_compute("k", fail)
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            MemoCache(0)
+
+
+class MemoLayerTest(unittest.TestCase):
+    """Pruebas de la caché instalada sobre las conversiones de precisión."""
+
+    def setUp(self):
+        self.original = conversion_logic.convert_precise
+        memo_logic.enable(["temperature"], maxsize=16)
+
+    def tearDown(self):
+        memo_logic.disable()
+
+    def test_repeated_conversions_hit(self):
+        for _ in range(3):
+            result = conversion_logic.convert_temperature(
+                "21.5", "celsius", "kelvin", backend="fraction"
+            )
+        self.assertEqual(result, Fraction("294.65"))
+        stats = memo_logic.get_cache_stats()["temperature"]
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+    def test_keys_distinguish_backend_type_and_context(self):
+        convert = conversion_logic.convert_temperature
+        self.assertIsInstance(convert(1, "celsius", "kelvin", backend="fraction"), Fraction)
+        self.assertIsInstance(convert(1, "celsius", "kelvin", backend="decimal"), Decimal)
+        with localcontext() as context:
+            context.prec = 3
+            self.assertEqual(
+                convert(Decimal("1.005"), "celsius", "kelvin", backend="decimal"),
+                Decimal("274")
+            )
+        self.assertEqual(
+            convert(Decimal("1.005"), "celsius", "kelvin", backend="decimal"),
+            Decimal("274.155")
+        )
+        self.assertEqual(memo_logic.get_cache_stats()["temperature"]["hits"], 0)
+
+    def test_only_enabled_dimensions_are_cached(self):
+        conversion_logic.convert_length(1, "metros", "pies", backend="fraction")
+        self.assertFalse(memo_logic.is_enabled("length"))
+        self.assertNotIn("length", memo_logic.get_cache_stats())
+
+    def test_disable_restores_convert_precise(self):
+        self.assertIsNot(conversion_logic.convert_precise, self.original)
+        memo_logic.disable()
+        self.assertIs(conversion_logic.convert_precise, self.original)
+        with self.assertRaises(ValueError):
+            memo_logic.enable(["no-existe"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+test_metrics.py
+
+Pruebas de la instrumentación de conversiones (`metrics_logic`): conteo por terna,
+etiquetas acotadas para los errores y exportación a Prometheus.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic import conversion_logic, metrics_logic
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+class MetricsTest(unittest.TestCase):
+    """Pruebas de `metrics_logic` con la instrumentación activa."""
+
+    def setUp(self):
+        metrics_logic.reset()
+        metrics_logic.enable()
+
+    def tearDown(self):
+        metrics_logic.disable()
+        metrics_logic.reset()
+
+    def test_counts_conversions_per_key(self):
+        conversion_logic.convert_length(1, "metros", "pies")
+        converter = conversion_logic.get_cached_converter("length", "metros", "pies")
+        converter(2)
+        snapshot = metrics_logic.get_snapshot()
+        self.assertEqual(snapshot[("length", "metros", "pies")]["calls"], 2)
+
+    def test_unknown_units_share_one_label(self):
+        for unit in ("pulgas", "x" * 1000, "otra-unidad"):
+            with self.assertRaises(ValueError):
+                conversion_logic.convert_length(1, unit, "pies")
+        with self.assertRaises(ValueError):
+            conversion_logic.get_converter("no-existe", "a", "b")
+
+        errors = {
+            key: values["errors"] for key, values in metrics_logic.get_snapshot().items()
+        }
+        self.assertEqual(errors, {
+            ("length", "invalid", "pies"): 3,
+            ("invalid", "invalid", "invalid"): 1,
+        })
+
+    def test_prometheus_export(self):
+        conversion_logic.convert_length(1, "metros", "pies")
+        text = metrics_logic.export_prometheus()
+        self.assertIn(
+            'conversor_conversions_total{dimension="length",from="metros",to="pies"} 1', text
+        )
+
+    def test_disable_restores_functions(self):
+        metrics_logic.disable()
+        self.assertFalse(metrics_logic.is_enabled())
+        self.assertFalse(hasattr(conversion_logic.convert_length, "__wrapped__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
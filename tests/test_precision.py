@@ -0,0 +1,87 @@
+"""
+test_precision.py
+
+Pruebas de las conversiones con precisión seleccionable (`precision_logic`): tipos de
+entrada aceptados por cada backend, exactitud y errores.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import sys
+import unittest
+from decimal import Context, Decimal
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from logic.conversion_logic import convert_temperature
+from logic.precision_logic import convert_precise, get_precise_converter
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+# La misma cantidad (0.1 m) escrita con cada tipo de entrada aceptado
+INPUTS = (0.1, "0.1", Fraction(1, 10), Decimal("0.1"))
+
+
+class BackendInputsTest(unittest.TestCase):
+    """Cada backend acepta int, float, str, Fraction y Decimal."""
+
+    def test_fraction_backend(self):
+        self.assertEqual(convert_precise("length", 1, "metros", "centimetros"), 100)
+        for value in INPUTS:
+            with self.subTest(value=value):
+                result = convert_precise("length", value, "metros", "centimetros", "fraction")
+                self.assertIsInstance(result, Fraction)
+                self.assertEqual(result, 10)
+
+    def test_decimal_backend(self):
+        self.assertEqual(convert_precise("length", 1, "metros", "centimetros", "decimal"), 100)
+        for value in INPUTS:
+            with self.subTest(value=value):
+                result = convert_precise("length", value, "metros", "centimetros", "decimal")
+                self.assertIsInstance(result, Decimal)
+                self.assertEqual(result, Decimal(10))
+
+    def test_float_backend(self):
+        self.assertEqual(convert_temperature(100, "celsius", "fahrenheit"), 212.0)
+
+    def test_invalid_strings_raise_value_error(self):
+        for backend in ("fraction", "decimal"):
+            with self.subTest(backend), self.assertRaises(ValueError):
+                convert_precise("length", "abc", "metros", "centimetros", backend)
+
+
+class ExactnessTest(unittest.TestCase):
+    """Exactitud y contexto de los backends de precisión."""
+
+    def test_exact_affine_conversion(self):
+        result = convert_precise("temperature", "-40", "celsius", "fahrenheit")
+        self.assertEqual(result, -40)
+
+    def test_large_binary_multiples(self):
+        result = convert_precise("data", 1, "yobibytes", "bits")
+        self.assertEqual(result, 8 * 2 ** 80)
+
+    def test_decimal_context(self):
+        converter = get_precise_converter(
+            "length", "metros", "pies", "decimal", Context(prec=5)
+        )
+        self.assertEqual(converter("1"), Decimal("3.2808"))
+
+    def test_invalid_backend_and_unit(self):
+        with self.assertRaises(ValueError):
+            convert_precise("length", 1, "metros", "pies", "binario")
+        with self.assertRaises(ValueError):
+            convert_precise("length", 1, "metros", "pulgas")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+test_quantity.py
+
+Pruebas del análisis de cantidades (`quantity_logic`) y de la tabla de símbolos de
+datos que distingue mayúsculas (`unit_catalog.SYMBOL_INDEX`), incluida su concordancia
+con los menús de la interfaz de consola.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from interfaces import interfaz_cli as cli
+from logic import quantity_logic
+from logic.quantity_logic import parse_quantity, resolve_quantity_unit
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+# Símbolo -> unidad: 'b' es bit, 'B' es byte, con prefijos SI y binarios
+DATA_SYMBOLS = {
+    "b": "bits",
+    "B": "bytes",
+    "kb": "kilobits",
+    "kB": "kilobytes",
+    "Kb": "kilobits",
+    "KB": "kilobytes",
+    "Mb": "megabits",
+    "MB": "megabytes",
+    "Kib": "kibibits",
+    "KiB": "kibibytes",
+    "Mib": "mebibits",
+    "MiB": "mebibytes",
+    "GiB": "gibibytes",
+}
+
+
+class DataSymbolsTest(unittest.TestCase):
+    """Pruebas de los símbolos de datos que distinguen mayúsculas."""
+
+    def test_quantity_symbols(self):
+        for symbol, unit in DATA_SYMBOLS.items():
+            with self.subTest(symbol):
+                quantity = parse_quantity(f"5 {symbol}")
+                self.assertEqual((quantity.dimension, quantity.name), ("data", unit))
+
+    def test_cli_menus_agree_with_quantities(self):
+        index = cli.UNIT_INDEX["DATOS"]
+        match_unit = cli._match_unit                 # pylint: disable=protected-access
+        for symbol, unit in DATA_SYMBOLS.items():
+            with self.subTest(symbol):
+                self.assertEqual(match_unit(symbol, index), unit)
+                self.assertEqual(cli.resolve_unit(symbol), ("DATOS", unit))
+
+    def test_names_are_case_insensitive(self):
+        self.assertEqual(parse_quantity("2 Bytes").name, "bytes")
+        self.assertEqual(parse_quantity("2 KIBIBYTES").name, "kibibytes")
+
+
+class ParseQuantityTest(unittest.TestCase):
+    """Pruebas de `parse_quantity`."""
+
+    def test_number_formats(self):
+        cases = {
+            "12.5 km/h": (12.5, "kilometros_por_hora"),
+            "12km": (12.0, "kilometros"),
+            "12,5 km": (12.5, "kilometros"),
+            "-40 f": (-40.0, "fahrenheit"),
+            "1e3 m": (1000.0, "metros"),
+        }
+        for text, (value, unit) in cases.items():
+            with self.subTest(text):
+                quantity = parse_quantity(text)
+                self.assertEqual((quantity.value, quantity.name), (value, unit))
+
+    def test_compound_unit(self):
+        quantity = parse_quantity("3 N·m")
+        self.assertIsNone(quantity.name)
+        self.assertIsNotNone(quantity.compound)
+
+    def test_invalid_quantities(self):
+        for text in ("km", "12", "12 pulgas"):
+            with self.subTest(text), self.assertRaises(ValueError):
+                parse_quantity(text)
+
+    def test_cache_stats(self):
+        quantity_logic.clear_cache()
+        resolve_quantity_unit("km")
+        resolve_quantity_unit("km")
+        stats = quantity_logic.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
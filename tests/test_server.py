@@ -0,0 +1,106 @@
+"""
+test_server.py
+
+Pruebas del microservicio HTTP (`interfaz_server`): rutas de conversión, validación de
+valores y lectura de peticiones mal formadas.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import asyncio
+import json
+import os
+import sys
+import unittest
+from http import HTTPStatus
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from interfaces.interfaz_server import (
+    ConversionServer, HTTPError, handle_batch, handle_convert,
+)
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+PARAMS = {"dim": "length", "from": "metros", "to": "pies"}
+
+
+def _read(raw: bytes, limit: int = 2 ** 16):
+    """Lee una petición cruda con `_read_request` y devuelve su resultado."""
+    async def run():
+        reader = asyncio.StreamReader(limit=limit)
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await ConversionServer()._read_request(reader)  # pylint: disable=protected-access
+    return asyncio.run(run())
+
+
+class RoutesTest(unittest.TestCase):
+    """Pruebas de `handle_convert` y `handle_batch`."""
+
+    def test_convert(self):
+        payload, _ = handle_convert({**PARAMS, "value": "1"}, b"", "")
+        self.assertEqual(json.loads(payload)["result"], 3.280839895013123)
+
+    def test_batch_json_and_ndjson(self):
+        payload, _ = handle_batch(PARAMS, b"[1, 2]", "application/json")
+        self.assertEqual(json.loads(payload)["results"], [3.280839895013123, 6.561679790026246])
+        payload, content_type = handle_batch(PARAMS, b"[1]\n\n[2]\n", "application/x-ndjson")
+        self.assertEqual(content_type, "application/x-ndjson")
+        self.assertEqual(len(payload.splitlines()), 2)
+
+    def test_invalid_values_are_bad_requests(self):
+        bodies = {
+            "booleano": b"[true, 1]",
+            "desbordamiento": b"[1" + b"0" * 400 + b"]",
+            "infinito": b"[1e308]",
+            "no es lista": b'{"values": "12"}',
+            "json": b"[1,",
+        }
+        for label, body in bodies.items():
+            with self.subTest(label), self.assertRaises(HTTPError) as raised:
+                handle_batch(PARAMS, body, "application/json")
+            self.assertEqual(raised.exception.status, HTTPStatus.BAD_REQUEST)
+
+    def test_convert_infinite_result(self):
+        with self.assertRaises(HTTPError):
+            handle_convert({**PARAMS, "value": "1e308"}, b"", "")
+
+
+class ReadRequestTest(unittest.TestCase):
+    """Pruebas de `ConversionServer._read_request`."""
+
+    def test_valid_request(self):
+        method, path, query, _, headers, body = _read(
+            b"POST /convert/batch?dim=length HTTP/1.1\r\nContent-Length: 3\r\n\r\n[1]"
+        )
+        self.assertEqual(
+            (method, path, query, body), ("POST", "/convert/batch", "dim=length", b"[1]")
+        )
+        self.assertEqual(headers["content-length"], "3")
+
+    def test_malformed_requests(self):
+        requests = {
+            "longitud negativa": (b"POST / HTTP/1.1\r\nContent-Length: -5\r\n\r\n", 2 ** 16),
+            "longitud invalida": (b"POST / HTTP/1.1\r\nContent-Length: x\r\n\r\n", 2 ** 16),
+            "linea de peticion": (b"GET\r\n\r\n", 2 ** 16),
+            "encabezado largo": (b"GET / HTTP/1.1\r\nX: " + b"a" * 200 + b"\r\n\r\n", 64),
+        }
+        for label, (raw, limit) in requests.items():
+            with self.subTest(label), self.assertRaises(HTTPError) as raised:
+                _read(raw, limit)
+            self.assertEqual(raised.exception.status, HTTPStatus.BAD_REQUEST)
+
+    def test_closed_connection(self):
+        self.assertIsNone(_read(b""))
+
+
+if __name__ == "__main__":
+    unittest.main()
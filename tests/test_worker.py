@@ -0,0 +1,82 @@
+"""
+test_worker.py
+
+Pruebas del modo trabajador (`interfaz_worker`): validación de peticiones, respuestas
+NDJSON estrictas y continuidad del proceso ante peticiones defectuosas.
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover tests
+
+Autor: Alejandro Cortés
+Versión: 1.0
+"""
+
+
+# ────────────────────── IMPORTACIONES ──────────────────────
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from interfaces.interfaz_worker import handle_request, serve_stream
+
+
+# ────────────────────── PRUEBAS ──────────────────────
+BASE = {"dim": "length", "from": "metros", "to": "pies"}
+
+
+class HandleRequestTest(unittest.TestCase):
+    """Pruebas de `handle_request`."""
+
+    def test_single_value_and_id(self):
+        response = handle_request({**BASE, "id": 7, "value": 1})
+        self.assertEqual(response, {"id": 7, "result": 3.280839895013123})
+
+    def test_values_list(self):
+        response = handle_request({**BASE, "values": [1, "2"]})
+        self.assertEqual(response["results"], [3.280839895013123, 6.561679790026246])
+
+    def test_invalid_requests_return_errors(self):
+        cases = {
+            "no es lista": {**BASE, "values": "12"},
+            "booleano": {**BASE, "values": [True]},
+            "infinito": {**BASE, "values": [1e308]},
+            "nan": {**BASE, "value": "nan"},
+            "desbordamiento": {**BASE, "value": 10**400},
+            "unidad": {**BASE, "to": "pulgas", "value": 1},
+            "sin campo": {"dim": "length", "value": 1},
+        }
+        for label, request in cases.items():
+            with self.subTest(label):
+                self.assertIn("error", handle_request(request))
+
+    def test_not_an_object(self):
+        self.assertIn("error", handle_request([1, 2]))
+
+
+class ServeStreamTest(unittest.TestCase):
+    """Pruebas de `serve_stream`."""
+
+    def test_bad_lines_do_not_stop_the_stream(self):
+        lines = [
+            b"{no es json}",
+            json.dumps({**BASE, "value": 10**400}).encode(),
+            b'{"id": NaN, "dim": "length", "from": "metros", "to": "pies", "value": 1}',
+            b"",
+            json.dumps({**BASE, "value": 1}).encode(),
+        ]
+        output = io.StringIO()
+        stats = serve_stream(io.BytesIO(b"\n".join(lines) + b"\n"), output)
+
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(stats, {"requests": 4, "errors": 3})
+        self.assertEqual([("error" in r) for r in responses], [True, True, True, False])
+        self.assertNotIn("NaN", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()